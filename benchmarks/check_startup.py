@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Contrôle du temps de démarrage des scripts Jira CLI
+Mesure avec `python -X importtime` le coût des imports de `jira_cli.py <outil> --help`
+et échoue si un outil dépasse le budget ou charge la pile HTTP sans en avoir besoin.
+"""
+
+import sys
+import os
+import argparse
+import subprocess
+from typing import Dict, List, Tuple
+
+ROOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT_DIR)
+
+from jira_cli import TOOL_MODULES
+
+# Budget par défaut (ms) des imports propres à un outil, hors démarrage de l'interpréteur
+DEFAULT_BUDGET_MS = 150.0
+
+# Modules qui ne doivent être importés qu'à l'exécution d'une sous-commande
+DEFERRED_MODULES = ('requests', 'urllib3', 'concurrent.futures', 'csv', 'lib.jira_client')
+
+
+def import_profile(argv: List[str]) -> Tuple[float, List[str]]:
+    """
+    Exécute une commande Python sous -X importtime
+
+    Returns:
+        (durée cumulée des imports de premier niveau en ms, modules importés)
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime'] + argv,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                            text=True, cwd=ROOT_DIR)
+    total_us = 0
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|', 2)
+        modules.append(name.strip())
+        # Un seul espace avant le nom: import de premier niveau (les sous-imports sont indentés)
+        if not name[1:].startswith(' '):
+            total_us += int(cumulative)
+    return total_us / 1000, modules
+
+
+def measure(argv: List[str], repeat: int) -> Tuple[float, List[str]]:
+    """Meilleure durée sur `repeat` exécutions (les suivantes profitent du cache disque)"""
+    runs = [import_profile(argv) for _ in range(repeat)]
+    return min(ms for ms, _ in runs), runs[0][1]
+
+
+def check_tools(tools: List[str], budget_ms: float, repeat: int) -> Dict[str, Dict]:
+    """Mesure chaque outil et retourne ses résultats"""
+    baseline_ms, _ = measure(['-c', 'pass'], repeat)
+
+    results = {}
+    for tool in tools:
+        total_ms, modules = measure(['jira_cli.py', tool, '--help'], repeat)
+        own_ms = max(0.0, total_ms - baseline_ms)
+        eager = [m for m in DEFERRED_MODULES if m in modules]
+        results[tool] = {
+            'import_ms': round(own_ms, 1),
+            'eager_imports': eager,
+            'ok': own_ms <= budget_ms and not eager
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Contrôle du temps de démarrage des scripts Jira CLI')
+    parser.add_argument('--budget', type=float,
+                        default=float(os.environ.get('JIRA_STARTUP_BUDGET_MS', DEFAULT_BUDGET_MS)),
+                        help='Budget des imports par outil en ms (défaut: JIRA_STARTUP_BUDGET_MS ou 150)')
+    parser.add_argument('--repeat', type=int, default=3, help='Nombre de mesures par outil')
+    parser.add_argument('--only', nargs='+', choices=list(TOOL_MODULES), help='Outils à mesurer')
+
+    args = parser.parse_args()
+
+    results = check_tools(args.only or list(TOOL_MODULES), args.budget, max(1, args.repeat))
+
+    for tool, result in results.items():
+        status = '✓' if result['ok'] else '✗'
+        line = f"{status} {tool:<12} {result['import_ms']:>7.1f} ms"
+        if result['eager_imports']:
+            line += f"  (importés trop tôt: {', '.join(result['eager_imports'])})"
+        print(line)
+
+    failed = [tool for tool, result in results.items() if not result['ok']]
+    if failed:
+        print(f"\n✗ Budget de {args.budget:.0f} ms dépassé ou imports non différés: {', '.join(failed)}")
+        sys.exit(1)
+
+    print(f"\n✓ Tous les outils démarrent sous {args.budget:.0f} ms")
+
+
+if __name__ == '__main__':
+    main()
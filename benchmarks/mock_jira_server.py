@@ -0,0 +1,1012 @@
+#!/usr/bin/env python3
+"""
+Serveur Jira Cloud simulé pour les benchmarks hors ligne
+Sert les endpoints REST v3 et Agile 1.0 utilisés par les scripts à partir
+d'un jeu de données généré, avec latence, pagination et limitation de débit
+configurables. Aucune dépendance hors bibliothèque standard.
+"""
+
+import sys
+import re
+import gzip
+import json
+import math
+import random
+import threading
+import time
+import argparse
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlsplit, parse_qs
+
+# Référentiels du jeu de données
+STATUSES = ['To Do', 'In Progress', 'In Review', 'Done']
+STATUS_CATEGORIES = {'To Do': 'new', 'In Progress': 'indeterminate', 'In Review': 'indeterminate', 'Done': 'done'}
+ISSUE_TYPES = ['Story', 'Task', 'Bug', 'Epic']
+PRIORITIES = ['Highest', 'High', 'Medium', 'Low', 'Lowest']
+STORY_POINTS = [1, 2, 3, 5, 8, 13]
+
+# Transitions disponibles depuis n'importe quel statut (id -> statut cible)
+TRANSITIONS = {str(11 + i * 10): status for i, status in enumerate(STATUSES)}
+
+# Champs renvoyés quand la requête ne précise pas `fields`
+DEFAULT_FIELDS = ('summary', 'status', 'issuetype', 'priority', 'assignee', 'reporter', 'creator',
+                  'project', 'labels', 'created', 'updated', 'resolutiondate', 'customfield_10016')
+
+BASE_DATE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def format_date(dt: datetime) -> str:
+    """Format de date des réponses Jira (2024-01-01T09:00:00.000+0000)"""
+    return dt.strftime('%Y-%m-%dT%H:%M:%S.000+0000')
+
+
+def priority_name(value: Optional[Dict], default: str) -> str:
+    """Nom d'une priorité référencée par nom ou par id"""
+    value = value or {}
+    if str(value.get('id', '')).isdigit() and 1 <= int(value['id']) <= len(PRIORITIES):
+        return PRIORITIES[int(value['id']) - 1]
+    return value.get('name', default)
+
+
+class MockDataset:
+    """
+    Jeu de données Jira généré de façon déterministe
+
+    Les issues sont stockées sous forme compacte et mises en forme à la
+    demande, ce qui permet de monter à 100k issues sans consommer trop de mémoire.
+    """
+
+    def __init__(self, issues: int = 1000, projects: int = 5, users: int = 200, groups: int = 20,
+                 sprints_per_board: int = 10, audit_records: int = 5000, seed: int = 42):
+        self.seed = seed
+        self.lock = threading.RLock()
+        self.version = 0  # Incrémenté à chaque écriture (invalide les recherches mémorisées)
+        rng = random.Random(seed)
+
+        self.users = [{
+            'accountId': f'user-{i:05d}',
+            'accountType': 'atlassian' if i % 20 else 'app',
+            'displayName': f'Utilisateur {i}',
+            'emailAddress': f'user{i}@example.com',
+            'active': i % 10 != 0
+        } for i in range(users)]
+        self.users_by_id = {u['accountId']: u for u in self.users}
+
+        self.projects = [{
+            'id': str(10000 + i),
+            'key': f'PRJ{i}',
+            'name': f'Projet {i}',
+            'projectTypeKey': 'software' if i % 3 else 'business',
+            'style': 'classic' if i % 2 else 'next-gen',
+            'lead': self._user_ref(self.users[i % users]),
+            'description': f'Projet de démonstration {i}'
+        } for i in range(projects)]
+        self.projects_by_key = {p['key']: p for p in self.projects}
+
+        # Un board Scrum par projet, avec ses sprints (les plus anciens sont clos)
+        self.boards = []
+        self.sprints = {}
+        sprint_id = 1
+        for i, project in enumerate(self.projects):
+            board = {'id': i + 1, 'name': f"Board {project['key']}", 'type': 'scrum',
+                     'location': {'projectKey': project['key']}}
+            self.boards.append(board)
+            for n in range(sprints_per_board):
+                start = BASE_DATE + timedelta(days=14 * n)
+                state = 'closed' if n < sprints_per_board - 2 else ('active' if n == sprints_per_board - 2 else 'future')
+                self.sprints[sprint_id] = {
+                    'id': sprint_id, 'name': f"{project['key']} Sprint {n + 1}", 'state': state,
+                    'originBoardId': board['id'],
+                    'startDate': format_date(start), 'endDate': format_date(start + timedelta(days=14)),
+                    'goal': ''
+                }
+                sprint_id += 1
+        self.board_sprints = defaultdict(list)
+        for sprint in self.sprints.values():
+            self.board_sprints[sprint['originBoardId']].append(sprint['id'])
+
+        self.groups = [{'name': f'groupe-{i}', 'groupId': f'group-{i:04d}'} for i in range(groups)]
+        self.group_members = {
+            g['name']: [self.users[j]['accountId'] for j in range(users) if j % groups == i or j % 7 == i % 7]
+            for i, g in enumerate(self.groups)
+        }
+
+        self.permission_schemes = [{
+            'id': 10000 + i,
+            'name': f'Schéma de permissions {i}',
+            'description': f'Schéma {i}',
+            'permissions': [{'id': 10000 + i * 100 + p, 'permission': f'PERMISSION_{p}',
+                             'holder': {'type': 'group', 'parameter': self.groups[p % groups]['name']}}
+                            for p in range(20 + i)]
+        } for i in range(max(1, projects))]
+
+        self.workflows = [{
+            'id': {'name': f'Workflow {i}', 'entityId': f'wf-{i}'},
+            'description': f'Workflow {i}',
+            'isDefault': i == 0,
+            'statuses': [{'id': str(s), 'name': name} for s, name in enumerate(STATUSES)]
+        } for i in range(max(1, projects))]
+
+        # Issues: réparties par projet, chaque issue appartient à un sprint de son board
+        self.issues = []
+        self.issues_by_key = {}
+        counters = defaultdict(int)
+        now = datetime.now(timezone.utc)
+        span = max(1, int((now - BASE_DATE).total_seconds()))
+        for i in range(issues):
+            project = self.projects[i % projects]
+            counters[project['key']] += 1
+            created = BASE_DATE + timedelta(seconds=rng.randrange(span))
+            status = rng.choice(STATUSES)
+            resolved = created + timedelta(hours=rng.randrange(1, 500)) if status == 'Done' else None
+            board_id = i % projects + 1
+            assignee = rng.randrange(users) if rng.random() < 0.85 else None
+            self._add_issue({
+                'id': str(100000 + i),
+                'key': f"{project['key']}-{counters[project['key']]}",
+                'project': project['key'],
+                'summary': f'Issue {i} générée pour les benchmarks',
+                'status': status,
+                'issuetype': rng.choice(ISSUE_TYPES),
+                'priority': rng.choice(PRIORITIES),
+                'assignee': self.users[assignee]['accountId'] if assignee is not None else None,
+                'reporter': self.users[rng.randrange(users)]['accountId'],
+                'labels': [],
+                'points': rng.choice(STORY_POINTS),
+                'sprint': rng.choice(self.board_sprints[board_id]),
+                'created': created,
+                'updated': min(now, created + timedelta(hours=rng.randrange(1, 1000))),
+                'resolved': resolved
+            })
+        self.next_issue_id = 100000 + issues
+        self.counters = counters
+
+        self.audit_records = [{
+            'id': i,
+            'summary': 'User logged in',
+            'authorAccountId': self.users[rng.randrange(users)]['accountId'],
+            'created': format_date(now - timedelta(minutes=rng.randrange(90 * 24 * 60))),
+            'category': 'user management',
+            'eventSource': ''
+        } for i in range(audit_records)]
+        self.audit_records.sort(key=lambda r: r['created'], reverse=True)
+
+    def _add_issue(self, issue: Dict):
+        self.issues.append(issue)
+        self.issues_by_key[issue['key']] = issue
+
+    def _user_ref(self, user: Optional[Dict]) -> Optional[Dict]:
+        if not user:
+            return None
+        return {'accountId': user['accountId'], 'displayName': user['displayName'], 'active': user['active']}
+
+    # ---- Mise en forme ----------------------------------------------------
+
+    def render_issue(self, issue: Dict, fields: Optional[List[str]] = None) -> Dict:
+        """Met en forme une issue comme l'API REST v3"""
+        wanted = fields or DEFAULT_FIELDS
+        if '*all' in wanted or '*navigable' in wanted:
+            wanted = DEFAULT_FIELDS
+
+        values = {}
+        for name in wanted:
+            if name == 'summary':
+                values['summary'] = issue['summary']
+            elif name == 'status':
+                values['status'] = {'name': issue['status'], 'statusCategory': {'key': STATUS_CATEGORIES[issue['status']]}}
+            elif name == 'issuetype':
+                values['issuetype'] = {'name': issue['issuetype']}
+            elif name == 'priority':
+                values['priority'] = {'name': issue['priority']}
+            elif name in ('assignee', 'reporter', 'creator'):
+                account_id = issue['reporter'] if name == 'creator' else issue[name]
+                values[name] = self._user_ref(self.users_by_id.get(account_id))
+            elif name == 'project':
+                project = self.projects_by_key[issue['project']]
+                values['project'] = {'id': project['id'], 'key': project['key'], 'name': project['name']}
+            elif name == 'labels':
+                values['labels'] = list(issue['labels'])
+            elif name in ('created', 'updated'):
+                values[name] = format_date(issue[name])
+            elif name == 'resolutiondate':
+                values['resolutiondate'] = format_date(issue['resolved']) if issue['resolved'] else None
+            elif name == 'customfield_10016':
+                values['customfield_10016'] = issue['points']
+            elif name == 'sprint':
+                values['sprint'] = self.sprints.get(issue['sprint'])
+
+        return {'id': issue['id'], 'key': issue['key'], 'self': f"/rest/api/3/issue/{issue['id']}", 'fields': values}
+
+    # ---- Écritures --------------------------------------------------------
+
+    def create_issue(self, fields: Dict) -> Dict:
+        """Crée une issue, lève ValueError si les champs obligatoires manquent"""
+        project_key = (fields.get('project') or {}).get('key')
+        if project_key not in self.projects_by_key:
+            raise ValueError("project: Spécifiez un projet valide")
+        if not fields.get('summary'):
+            raise ValueError("summary: Vous devez spécifier un résumé")
+
+        with self.lock:
+            self.counters[project_key] += 1
+            issue_id = str(self.next_issue_id)
+            self.next_issue_id += 1
+            now = datetime.now(timezone.utc)
+            issue = {
+                'id': issue_id,
+                'key': f'{project_key}-{self.counters[project_key]}',
+                'project': project_key,
+                'summary': fields['summary'],
+                'status': 'To Do',
+                'issuetype': (fields.get('issuetype') or {}).get('name', 'Task'),
+                'priority': priority_name(fields.get('priority'), 'Medium'),
+                'assignee': (fields.get('assignee') or {}).get('accountId'),
+                'reporter': self.users[0]['accountId'],
+                'labels': list(fields.get('labels') or []),
+                'points': fields.get('customfield_10016'),
+                'sprint': None,
+                'created': now,
+                'updated': now,
+                'resolved': None
+            }
+            self._add_issue(issue)
+            self.version += 1
+        return {'id': issue_id, 'key': issue['key'], 'self': f'/rest/api/3/issue/{issue_id}'}
+
+    def update_issue(self, issue: Dict, fields: Dict):
+        with self.lock:
+            for name, value in fields.items():
+                if name == 'summary':
+                    issue['summary'] = value
+                elif name == 'labels':
+                    issue['labels'] = list(value)
+                elif name == 'priority':
+                    issue['priority'] = priority_name(value, issue['priority'])
+                elif name == 'assignee':
+                    issue['assignee'] = (value or {}).get('accountId')
+                elif name == 'customfield_10016':
+                    issue['points'] = value
+            issue['updated'] = datetime.now(timezone.utc)
+            self.version += 1
+
+    def transition_issue(self, issue: Dict, status: str):
+        with self.lock:
+            issue['status'] = status
+            issue['resolved'] = datetime.now(timezone.utc) if status == 'Done' else None
+            issue['updated'] = datetime.now(timezone.utc)
+            self.version += 1
+
+    def delete_issue(self, issue: Dict):
+        with self.lock:
+            self.issues.remove(issue)
+            del self.issues_by_key[issue['key']]
+            self.version += 1
+
+
+# ---- Évaluation JQL -------------------------------------------------------
+
+JQL_CLAUSE = re.compile(
+    r'^\s*(?P<field>[\w.]+)\s*(?P<op>!=|>=|<=|=|>|<|~|\bnot in\b|\bin\b|\bis not\b|\bis\b)\s*(?P<value>.+?)\s*$',
+    re.IGNORECASE
+)
+JQL_RELATIVE_DATE = re.compile(r'^([-+]?\d+)([dwh])$')
+
+
+def _split_top_level(text: str, keyword: str) -> List[str]:
+    """Découpe une requête sur AND/OR hors parenthèses et guillemets"""
+    parts, depth, quote, start = [], 0, None, 0
+    pattern = re.compile(rf'\s+{keyword}\s+', re.IGNORECASE)
+    i = 0
+    while i < len(text):
+        char = text[i]
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in '"\'':
+            quote = char
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif depth == 0:
+            match = pattern.match(text, i)
+            if match:
+                parts.append(text[start:i])
+                start = i = match.end()
+                continue
+        i += 1
+    parts.append(text[start:])
+    return parts
+
+
+def _unquote(value: str) -> str:
+    value = value.strip()
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in '"\'':
+        return value[1:-1]
+    return value
+
+
+def _parse_jql_date(value: str) -> Optional[datetime]:
+    value = _unquote(value)
+    relative = JQL_RELATIVE_DATE.match(value)
+    if relative:
+        unit = {'d': 'days', 'w': 'weeks', 'h': 'hours'}[relative.group(2)]
+        return datetime.now(timezone.utc) + timedelta(**{unit: int(relative.group(1))})
+    try:
+        dt = datetime.fromisoformat(value.replace('/', '-'))
+    except ValueError:
+        return None
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+def compile_jql(jql: str, dataset: MockDataset) -> Callable[[Dict], bool]:
+    """
+    Compile le sous-ensemble de JQL utilisé par les scripts en prédicat Python
+
+    Supporte AND/OR, les parenthèses, =, !=, <, <=, >, >=, ~, in, not in,
+    is EMPTY / is not EMPTY et les dates relatives (-30d). Les clauses
+    inconnues sont ignorées (elles ne filtrent rien).
+    """
+    query = re.split(r'\s+order\s+by\s+', jql or '', flags=re.IGNORECASE)[0].strip()
+    if not query:
+        return lambda issue: True
+
+    or_parts = _split_top_level(query, 'OR')
+    if len(or_parts) > 1:
+        predicates = [compile_jql(part, dataset) for part in or_parts]
+        return lambda issue: any(p(issue) for p in predicates)
+
+    and_parts = _split_top_level(query, 'AND')
+    if len(and_parts) > 1:
+        predicates = [compile_jql(part, dataset) for part in and_parts]
+        return lambda issue: all(p(issue) for p in predicates)
+
+    if query.startswith('(') and query.endswith(')'):
+        return compile_jql(query[1:-1], dataset)
+
+    match = JQL_CLAUSE.match(query)
+    if not match:
+        return lambda issue: True
+
+    field = match.group('field').lower()
+    op = match.group('op').lower()
+    raw_value = match.group('value')
+
+    getters = {
+        'project': lambda i: i['project'],
+        'key': lambda i: i['key'],
+        'issuekey': lambda i: i['key'],
+        'status': lambda i: i['status'],
+        'statuscategory': lambda i: STATUS_CATEGORIES[i['status']],
+        'type': lambda i: i['issuetype'],
+        'issuetype': lambda i: i['issuetype'],
+        'priority': lambda i: i['priority'],
+        'assignee': lambda i: i['assignee'],
+        'reporter': lambda i: i['reporter'],
+        'creator': lambda i: i['reporter'],
+        'labels': lambda i: i['labels'],
+        'sprint': lambda i: i['sprint'],
+        'summary': lambda i: i['summary'],
+        'text': lambda i: i['summary'],
+        'created': lambda i: i['created'],
+        'updated': lambda i: i['updated'],
+        'resolved': lambda i: i['resolved'],
+        'resolutiondate': lambda i: i['resolved'],
+    }
+    getter = getters.get(field)
+    if getter is None:
+        return lambda issue: True
+
+    if op in ('is', 'is not'):
+        empty = _unquote(raw_value).lower() in ('empty', 'null')
+        want_empty = empty == (op == 'is')
+        return lambda issue: (not getter(issue)) == want_empty
+
+    if field in ('created', 'updated', 'resolved', 'resolutiondate'):
+        bound = _parse_jql_date(raw_value)
+        if bound is None:
+            return lambda issue: True
+        compare = {
+            '>=': lambda v: v >= bound, '>': lambda v: v > bound,
+            '<=': lambda v: v <= bound, '<': lambda v: v < bound,
+            '=': lambda v: v.date() == bound.date(), '!=': lambda v: v.date() != bound.date(),
+        }.get(op, lambda v: True)
+        return lambda issue: getter(issue) is not None and compare(getter(issue))
+
+    if op in ('in', 'not in'):
+        values = {_unquote(v).lower() for v in raw_value.strip().strip('()').split(',') if v.strip()}
+    else:
+        values = {_unquote(raw_value).lower()}
+
+    def matches(issue: Dict) -> bool:
+        value = getter(issue)
+        if op == '~':
+            needle = next(iter(values))
+            return needle in str(value).lower()
+        candidates = value if isinstance(value, list) else [value]
+        return any(str(c).lower() in values for c in candidates if c is not None)
+
+    if op in ('!=', 'not in'):
+        return lambda issue: not matches(issue)
+    return matches
+
+
+# ---- Serveur HTTP ---------------------------------------------------------
+
+class TokenBucket:
+    """Limite de débit côté serveur, à la manière de Jira Cloud"""
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.capacity = burst or max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def take(self):
+        """Consomme un jeton; retourne (accepté, jetons restants, attente avant le prochain)"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True, self.tokens, 0.0
+            return False, 0.0, (1 - self.tokens) / self.rate
+
+
+class MockJiraServer(ThreadingHTTPServer):
+    """
+    Serveur HTTP multi-threadé simulant Jira Cloud
+
+    Args:
+        dataset: Jeu de données servi
+        host, port: Adresse d'écoute (port 0: port libre choisi par le système)
+        latency: Latence ajoutée à chaque réponse en secondes
+        jitter: Variation aléatoire de la latence en secondes
+        max_results: Taille maximale d'une page (maxResults plafonné)
+        rate_limit: Requêtes/seconde acceptées avant de répondre 429 (None: illimité)
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, dataset: MockDataset, host: str = '127.0.0.1', port: int = 0,
+                 latency: float = 0.0, jitter: float = 0.0, max_results: int = 100,
+                 rate_limit: Optional[float] = None):
+        super().__init__((host, port), MockJiraHandler)
+        self.dataset = dataset
+        self.latency = latency
+        self.jitter = jitter
+        self.max_results = max_results
+        self.bucket = TokenBucket(rate_limit) if rate_limit else None
+        self.stats = defaultdict(int)
+        self.stats_lock = threading.Lock()
+        self._search_cache = {}
+        self.tasks = {}  # Tâches bulk/issues/* terminées, par ID
+        self.tasks_lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def count(self, name: str):
+        with self.stats_lock:
+            self.stats[name] += 1
+
+    def reset_stats(self):
+        with self.stats_lock:
+            self.stats.clear()
+
+    def search(self, jql: str) -> List[Dict]:
+        """Issues correspondant à une JQL, mémorisées jusqu'à la prochaine écriture"""
+        dataset = self.dataset
+        key = (jql, dataset.version)
+        result = self._search_cache.get(key)
+        if result is None:
+            predicate = compile_jql(jql, dataset)
+            with dataset.lock:
+                result = [issue for issue in dataset.issues if predicate(issue)]
+            if len(self._search_cache) > 256:
+                self._search_cache.clear()
+            self._search_cache[key] = result
+        return result
+
+    def start(self) -> 'MockJiraServer':
+        """Démarre le serveur dans un thread d'arrière-plan"""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Arrête le serveur et libère le port"""
+        self.shutdown()
+        self.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+class ApiError(Exception):
+    """Erreur renvoyée au client au format Jira (errorMessages / errors)"""
+
+    def __init__(self, status: int, message: str, errors: Dict = None):
+        super().__init__(message)
+        self.status = status
+        self.body = {'errorMessages': [message] if message else [], 'errors': errors or {}}
+
+
+class MockJiraHandler(BaseHTTPRequestHandler):
+    """Routage des requêtes REST v3 / Agile 1.0 vers le jeu de données"""
+
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True  # Évite ~40 ms d'ACK retardé par réponse en keep-alive
+    server: MockJiraServer
+
+    ROUTES = [
+        ('GET', r'search', 'search'),
+        ('POST', r'search', 'search'),
+        ('POST', r'issue', 'create_issue'),
+        ('POST', r'issue/bulk', 'create_issues_bulk'),
+        ('GET', r'bulk/issues/transition', 'bulk_transitions'),
+        ('POST', r'bulk/issues/transition', 'submit_bulk_transition'),
+        ('POST', r'bulk/issues/fields', 'submit_bulk_edit'),
+        ('GET', r'bulk/queue/(?P<id>\d+)', 'bulk_task'),
+        ('GET', r'issue/(?P<key>[^/]+)/transitions', 'get_transitions'),
+        ('POST', r'issue/(?P<key>[^/]+)/transitions', 'do_transition'),
+        ('PUT', r'issue/(?P<key>[^/]+)/assignee', 'assign_issue'),
+        ('GET', r'issue/(?P<key>[^/]+)', 'get_issue'),
+        ('PUT', r'issue/(?P<key>[^/]+)', 'update_issue'),
+        ('DELETE', r'issue/(?P<key>[^/]+)', 'delete_issue'),
+        ('GET', r'users/search', 'list_users'),
+        ('GET', r'user/search', 'search_users'),
+        ('GET', r'user/groups', 'user_groups'),
+        ('GET', r'user', 'get_user'),
+        ('GET', r'priority', 'list_priorities'),
+        ('GET', r'project/search', 'list_projects'),
+        ('GET', r'project/(?P<key>[^/]+)', 'get_project'),
+        ('GET', r'group/bulk', 'list_groups'),
+        ('GET', r'group/member', 'group_members'),
+        ('GET', r'permissionscheme', 'list_permission_schemes'),
+        ('GET', r'permissionscheme/(?P<id>\d+)', 'get_permission_scheme'),
+        ('GET', r'workflow/search', 'list_workflows'),
+        ('GET', r'auditing/record', 'audit_records'),
+        ('GET', r'board', 'list_boards'),
+        ('GET', r'board/(?P<id>\d+)', 'get_board'),
+        ('GET', r'board/(?P<id>\d+)/sprint', 'board_sprints'),
+        ('GET', r'board/(?P<id>\d+)/issue', 'board_issues'),
+        ('GET', r'sprint/(?P<id>\d+)', 'get_sprint'),
+        ('GET', r'sprint/(?P<id>\d+)/issue', 'sprint_issues'),
+    ]
+    COMPILED_ROUTES = [(method, re.compile(rf'^/rest/(?:api/[23]|agile/1\.0)/{pattern}/?$'), name)
+                       for method, pattern, name in ROUTES]
+
+    def log_message(self, format, *args):
+        pass  # Pas de log par requête: il fausserait les mesures
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def do_PUT(self):
+        self._dispatch('PUT')
+
+    def do_DELETE(self):
+        self._dispatch('DELETE')
+
+    # ---- Plomberie --------------------------------------------------------
+
+    def _dispatch(self, method: str):
+        url = urlsplit(self.path)
+        self.query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        length = int(self.headers.get('Content-Length') or 0)
+        raw_body = self.rfile.read(length) if length else b''
+
+        if url.path.startswith('/__mock__/'):
+            return self._control(method, url.path)
+
+        server = self.server
+        if server.latency or server.jitter:
+            time.sleep(max(0.0, server.latency + random.uniform(-server.jitter, server.jitter)))
+
+        headers = {}
+        if server.bucket:
+            accepted, remaining, wait = server.bucket.take()
+            headers['X-RateLimit-Limit'] = str(int(server.bucket.capacity))
+            headers['X-RateLimit-Remaining'] = str(int(remaining))
+            if remaining < server.bucket.capacity * 0.2:
+                headers['X-RateLimit-NearLimit'] = 'true'
+            if not accepted:
+                server.count('429')
+                headers['Retry-After'] = str(max(1, math.ceil(wait)))
+                return self._send(429, {'errorMessages': ['Rate limit exceeded'], 'errors': {}}, headers)
+
+        for route_method, pattern, name in self.COMPILED_ROUTES:
+            match = pattern.match(url.path)
+            if match and route_method == method:
+                server.count(f'{method} {name}')
+                try:
+                    body = json.loads(raw_body) if raw_body else {}
+                    status, payload = getattr(self, f'route_{name}')(body, **match.groupdict())
+                except ApiError as e:
+                    status, payload = e.status, e.body
+                except ValueError as e:
+                    status, payload = 400, {'errorMessages': [str(e)], 'errors': {}}
+                return self._send(status, payload, headers)
+
+        server.count('404')
+        self._send(404, {'errorMessages': [f'Endpoint inconnu: {method} {url.path}'], 'errors': {}}, headers)
+
+    def _control(self, method: str, path: str):
+        """Endpoints de pilotage du serveur (statistiques des benchmarks)"""
+        if path == '/__mock__/stats':
+            with self.server.stats_lock:
+                stats = dict(self.server.stats)
+            return self._send(200, {'requests': stats, 'issues': len(self.server.dataset.issues)})
+        if path == '/__mock__/reset' and method == 'POST':
+            self.server.reset_stats()
+            return self._send(204, None)
+        self._send(404, {'errorMessages': ['Commande inconnue'], 'errors': {}})
+
+    def _send(self, status: int, payload, headers: Dict = None):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8') if payload is not None else b''
+
+        self.send_response(status)
+        if body:
+            self.send_header('Content-Type', 'application/json;charset=UTF-8')
+            if len(body) > 1024 and 'gzip' in self.headers.get('Accept-Encoding', ''):
+                body = gzip.compress(body, compresslevel=1)
+                self.send_header('Content-Encoding', 'gzip')
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _page_args(self, default: int = 50):
+        start_at = int(self.query.get('startAt', self.query.get('offset', 0)))
+        max_results = int(self.query.get('maxResults', self.query.get('limit', default)))
+        return max(0, start_at), max(0, min(max_results, self.server.max_results))
+
+    def _page_bean(self, items: List, default: int = 50):
+        """Page au format PageBean (startAt, maxResults, total, isLast, values)"""
+        start_at, max_results = self._page_args(default)
+        values = items[start_at:start_at + max_results]
+        return 200, {
+            'startAt': start_at,
+            'maxResults': max_results,
+            'total': len(items),
+            'isLast': start_at + len(values) >= len(items),
+            'values': values
+        }
+
+    def _issue_page(self, issues: List[Dict], source: Dict = None):
+        """Page de résultats de recherche (startAt, maxResults, total, issues)"""
+        source = source or self.query
+        start_at, max_results = self._page_args(50)
+        if source is not self.query:
+            start_at = int(source.get('startAt', 0))
+            max_results = min(int(source.get('maxResults', 50)), self.server.max_results)
+        fields = source.get('fields')
+        if isinstance(fields, str):
+            fields = [f.strip() for f in fields.split(',') if f.strip()]
+        dataset = self.server.dataset
+        return 200, {
+            'expand': 'schema,names',
+            'startAt': start_at,
+            'maxResults': max_results,
+            'total': len(issues),
+            'issues': [dataset.render_issue(i, fields) for i in issues[start_at:start_at + max_results]]
+        }
+
+    def _issue(self, key: str) -> Dict:
+        dataset = self.server.dataset
+        issue = dataset.issues_by_key.get(key)
+        if issue is None:
+            issue = next((i for i in dataset.issues if i['id'] == key), None)
+        if issue is None:
+            raise ApiError(404, "L'issue n'existe pas ou vous n'avez pas la permission de la voir.")
+        return issue
+
+    # ---- REST v3 ----------------------------------------------------------
+
+    def route_search(self, body):
+        source = body if body else self.query
+        return self._issue_page(self.server.search(source.get('jql', '')), source if body else None)
+
+    def route_create_issue(self, body):
+        try:
+            return 201, self.server.dataset.create_issue(body.get('fields', {}))
+        except ValueError as e:
+            field, _, message = str(e).partition(': ')
+            raise ApiError(400, '', {field: message})
+
+    def route_create_issues_bulk(self, body):
+        """Création en masse: les éléments invalides sont signalés par leur position"""
+        issues, errors = [], []
+        for number, update in enumerate(body.get('issueUpdates', [])):
+            try:
+                issues.append(self.server.dataset.create_issue(update.get('fields', {})))
+            except ValueError as e:
+                field, _, message = str(e).partition(': ')
+                errors.append({'status': 400, 'failedElementNumber': number,
+                               'elementErrors': {'errorMessages': [], 'errors': {field: message}}})
+        return (201 if issues or not errors else 400), {'issues': issues, 'errors': errors}
+
+    def route_get_issue(self, body, key):
+        fields = self.query.get('fields')
+        return 200, self.server.dataset.render_issue(self._issue(key), fields.split(',') if fields else None)
+
+    def route_update_issue(self, body, key):
+        self.server.dataset.update_issue(self._issue(key), body.get('fields', {}))
+        return 204, None
+
+    def route_delete_issue(self, body, key):
+        self.server.dataset.delete_issue(self._issue(key))
+        return 204, None
+
+    def route_assign_issue(self, body, key):
+        account_id = body.get('accountId')
+        if account_id and account_id not in self.server.dataset.users_by_id:
+            raise ApiError(400, '', {'assignee': "L'utilisateur n'existe pas"})
+        self.server.dataset.update_issue(self._issue(key), {'assignee': {'accountId': account_id}})
+        return 204, None
+
+    def route_get_transitions(self, body, key):
+        self._issue(key)
+        return 200, {'transitions': [{'id': tid, 'name': status, 'to': {'name': status}}
+                                     for tid, status in TRANSITIONS.items()]}
+
+    def route_do_transition(self, body, key):
+        issue = self._issue(key)
+        transition_id = str((body.get('transition') or {}).get('id', ''))
+        if transition_id not in TRANSITIONS:
+            raise ApiError(400, "La transition demandée n'est pas valide pour cette issue.")
+        self.server.dataset.transition_issue(issue, TRANSITIONS[transition_id])
+        return 204, None
+
+    # ---- Tâches bulk (traitées immédiatement, suivies par bulk/queue) --------
+
+    def _bulk_issues(self, keys: List[str]) -> List[Dict]:
+        dataset = self.server.dataset
+        found = []
+        for key in keys:
+            issue = dataset.issues_by_key.get(str(key)) or next(
+                (i for i in dataset.issues if i['id'] == str(key)), None)
+            if issue:
+                found.append(issue)
+        return found
+
+    def _store_task(self, issues: int, processed: List[str], failed: Dict[str, List[str]]):
+        with self.server.tasks_lock:
+            task_id = str(10000 + len(self.server.tasks))
+            self.server.tasks[task_id] = {
+                'taskId': task_id,
+                'status': 'COMPLETE',
+                'progressPercent': 100,
+                'totalIssueCount': issues,
+                'processedAccessibleIssues': [int(i) for i in processed],
+                'failedAccessibleIssues': failed,
+                'invalidOrInaccessibleIssueCount': issues - len(processed) - len(failed)
+            }
+        return 201, {'taskId': task_id}
+
+    def route_bulk_transitions(self, body):
+        keys = [k for k in self.query.get('issueIdsOrKeys', '').split(',') if k]
+        issues = self._bulk_issues(keys)
+        transitions = [{'transitionId': int(tid), 'transitionName': status, 'to': {'statusName': status}}
+                       for tid, status in TRANSITIONS.items()]
+        return 200, {'availableTransitions': [{'issues': [i['key'] for i in issues],
+                                               'transitions': transitions}] if issues else []}
+
+    def route_submit_bulk_transition(self, body):
+        dataset = self.server.dataset
+        total, processed, failed = 0, [], {}
+        for selection in body.get('bulkTransitionInputs', []):
+            keys = selection.get('selectedIssueIdsOrKeys', [])
+            total += len(keys)
+            status = TRANSITIONS.get(str(selection.get('transitionId')))
+            for issue in self._bulk_issues(keys):
+                if status is None:
+                    failed[issue['id']] = ["La transition demandée n'est pas valide pour cette issue."]
+                else:
+                    dataset.transition_issue(issue, status)
+                    processed.append(issue['id'])
+        return self._store_task(total, processed, failed)
+
+    def route_submit_bulk_edit(self, body):
+        dataset = self.server.dataset
+        edited = body.get('editedFieldsInput') or {}
+        fields = {}
+        for field in edited.get('singleLineTextFields', []):
+            fields[field['fieldId']] = field['text']
+        for field in edited.get('labelsFields', []):
+            fields['labels'] = [label['name'] for label in field.get('labels', [])]
+        for field in edited.get('singleSelectClearableUserPickerFields', []):
+            fields['assignee'] = {'accountId': (field.get('user') or {}).get('accountId')}
+        priority_id = (edited.get('priority') or {}).get('priorityId')
+        if priority_id:
+            if not priority_id.isdigit() or not 1 <= int(priority_id) <= len(PRIORITIES):
+                raise ApiError(400, '', {'priority': 'Priorité inconnue'})
+            fields['priority'] = {'name': PRIORITIES[int(priority_id) - 1]}
+
+        keys = body.get('selectedIssueIdsOrKeys', [])
+        account_id = (fields.get('assignee') or {}).get('accountId')
+        processed, failed = [], {}
+        for issue in self._bulk_issues(keys):
+            if account_id and account_id not in dataset.users_by_id:
+                failed[issue['id']] = ["L'utilisateur n'existe pas"]
+            else:
+                dataset.update_issue(issue, fields)
+                processed.append(issue['id'])
+        return self._store_task(len(keys), processed, failed)
+
+    def route_bulk_task(self, body, id):
+        with self.server.tasks_lock:
+            task = self.server.tasks.get(id)
+        if task is None:
+            raise ApiError(404, "La tâche n'existe pas")
+        return 200, task
+
+    def route_list_users(self, body):
+        _, payload = self._page_bean(self.server.dataset.users)
+        return 200, payload['values']
+
+    def route_search_users(self, body):
+        query = self.query.get('query', '').lower()
+        return 200, [u for u in self.server.dataset.users
+                     if query in u['displayName'].lower() or query in u['emailAddress']][:50]
+
+    def route_get_user(self, body):
+        user = self.server.dataset.users_by_id.get(self.query.get('accountId'))
+        if not user:
+            raise ApiError(404, "L'utilisateur n'existe pas")
+        return 200, user
+
+    def route_list_priorities(self, body):
+        return 200, [{'id': str(i + 1), 'name': name} for i, name in enumerate(PRIORITIES)]
+
+    def route_user_groups(self, body):
+        account_id = self.query.get('accountId')
+        return 200, [g for g in self.server.dataset.groups
+                     if account_id in self.server.dataset.group_members[g['name']]]
+
+    def route_list_projects(self, body):
+        return self._page_bean(self.server.dataset.projects)
+
+    def route_get_project(self, body, key):
+        project = self.server.dataset.projects_by_key.get(key)
+        if not project:
+            raise ApiError(404, "Aucun projet n'a été trouvé avec cette clé")
+        return 200, project
+
+    def route_list_groups(self, body):
+        return self._page_bean(self.server.dataset.groups)
+
+    def route_group_members(self, body):
+        dataset = self.server.dataset
+        members = dataset.group_members.get(self.query.get('groupname'))
+        if members is None:
+            raise ApiError(404, "Le groupe n'existe pas")
+        return self._page_bean([dataset.users_by_id[a] for a in members])
+
+    def route_list_permission_schemes(self, body):
+        return 200, {'permissionSchemes': [{k: v for k, v in s.items() if k != 'permissions'}
+                                           for s in self.server.dataset.permission_schemes]}
+
+    def route_get_permission_scheme(self, body, id):
+        scheme = next((s for s in self.server.dataset.permission_schemes if s['id'] == int(id)), None)
+        if not scheme:
+            raise ApiError(404, "Le schéma de permissions n'existe pas")
+        return 200, scheme
+
+    def route_list_workflows(self, body):
+        return self._page_bean(self.server.dataset.workflows)
+
+    def route_audit_records(self, body):
+        records = self.server.dataset.audit_records
+        summary = self.query.get('filter')
+        if summary:
+            records = [r for r in records if summary.lower() in r['summary'].lower()]
+        start_at, max_results = self._page_args(1000)
+        return 200, {'offset': start_at, 'limit': max_results, 'total': len(records),
+                     'records': records[start_at:start_at + max_results]}
+
+    # ---- Agile 1.0 --------------------------------------------------------
+
+    def _board(self, id) -> Dict:
+        board = next((b for b in self.server.dataset.boards if b['id'] == int(id)), None)
+        if not board:
+            raise ApiError(404, "Le board n'existe pas")
+        return board
+
+    def route_list_boards(self, body):
+        return self._page_bean(self.server.dataset.boards)
+
+    def route_get_board(self, body, id):
+        return 200, self._board(id)
+
+    def route_board_sprints(self, body, id):
+        dataset = self.server.dataset
+        self._board(id)
+        states = set(filter(None, self.query.get('state', '').split(',')))
+        sprints = [dataset.sprints[s] for s in dataset.board_sprints[int(id)]
+                   if not states or dataset.sprints[s]['state'] in states]
+        return self._page_bean(sprints)
+
+    def route_board_issues(self, body, id):
+        project_key = self._board(id)['location']['projectKey']
+        jql = f'project = {project_key}'
+        if self.query.get('jql'):
+            jql += f" AND ({self.query['jql']})"
+        return self._issue_page(self.server.search(jql))
+
+    def route_get_sprint(self, body, id):
+        sprint = self.server.dataset.sprints.get(int(id))
+        if not sprint:
+            raise ApiError(404, "Le sprint n'existe pas")
+        return 200, sprint
+
+    def route_sprint_issues(self, body, id):
+        if int(id) not in self.server.dataset.sprints:
+            raise ApiError(404, "Le sprint n'existe pas")
+        jql = f'sprint = {id}'
+        if self.query.get('jql'):
+            jql += f" AND ({self.query['jql']})"
+        return self._issue_page(self.server.search(jql))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serveur Jira Cloud simulé pour les benchmarks')
+    parser.add_argument('--host', default='127.0.0.1', help='Adresse d\'écoute')
+    parser.add_argument('--port', type=int, default=8080, help='Port d\'écoute (0: port libre)')
+    parser.add_argument('--issues', type=int, default=1000, help='Nombre d\'issues générées')
+    parser.add_argument('--projects', type=int, default=5, help='Nombre de projets')
+    parser.add_argument('--users', type=int, default=200, help='Nombre d\'utilisateurs')
+    parser.add_argument('--groups', type=int, default=20, help='Nombre de groupes')
+    parser.add_argument('--seed', type=int, default=42, help='Graine du générateur')
+    parser.add_argument('--latency', type=float, default=0.0, help='Latence par requête (ms)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Variation de la latence (ms)')
+    parser.add_argument('--max-results', type=int, default=100, help='Taille maximale d\'une page')
+    parser.add_argument('--rate-limit', type=float, help='Requêtes/seconde avant de répondre 429')
+
+    args = parser.parse_args()
+
+    try:
+        started = time.perf_counter()
+        dataset = MockDataset(issues=args.issues, projects=args.projects, users=args.users,
+                              groups=args.groups, seed=args.seed)
+        server = MockJiraServer(dataset, host=args.host, port=args.port,
+                                latency=args.latency / 1000, jitter=args.jitter / 1000,
+                                max_results=args.max_results, rate_limit=args.rate_limit)
+
+        print(f"✓ {len(dataset.issues)} issues générées en {time.perf_counter() - started:.1f}s")
+        print(f"✓ Jira simulé disponible sur {server.base_url}")
+        print("  Configuration: {\"jira_url\": \"%s\", \"email\": \"bench@example.com\", "
+              "\"api_token\": \"mock\"}" % server.base_url)
+
+        server.serve_forever()
+
+    except KeyboardInterrupt:
+        print("\nArrêt du serveur")
+    except Exception as e:
+        print(f"Erreur: {e}", file=sys.stderr)
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
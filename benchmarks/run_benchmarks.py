@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+"""
+Benchmarks des chemins critiques des scripts Jira CLI
+Exécute BulkOperations, ReportingTool, AuditTool, UserManager et SprintManager
+contre le Jira simulé (mock_jira_server.py) à plusieurs tailles de jeu de
+données et enregistre débit et latences en JSON pour comparer les exécutions.
+"""
+
+import sys
+import os
+import argparse
+import contextlib
+import json
+import platform
+import shutil
+import tempfile
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, List
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCH_DIR)
+sys.path.insert(0, os.path.join(BENCH_DIR, '..', 'jira_cli'))
+
+from mock_jira_server import MockDataset, MockJiraServer
+
+# Tailles de jeu de données par défaut (nombre d'issues)
+DEFAULT_SIZES = [1000, 10000, 100000]
+
+# Écart (%) au-delà duquel une mesure est signalée comme régression
+DEFAULT_THRESHOLD = 10.0
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Percentile par rang le plus proche"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+class LatencyRecorder:
+    """Collecte la durée de chaque requête HTTP d'un benchmark"""
+
+    def __init__(self):
+        self.samples = []
+        self._lock = threading.Lock()
+
+    def add(self, seconds: float):
+        with self._lock:
+            self.samples.append(seconds)
+
+    def response_hook(self, response, *args, **kwargs):
+        """Hook requests: mesure les appels directs passant par la session partagée"""
+        self.add(response.elapsed.total_seconds())
+
+    def summary(self) -> Dict:
+        return {
+            'count': len(self.samples),
+            'p50': round(percentile(self.samples, 50) * 1000, 2),
+            'p95': round(percentile(self.samples, 95) * 1000, 2),
+            'p99': round(percentile(self.samples, 99) * 1000, 2),
+            'max': round(max(self.samples, default=0.0) * 1000, 2)
+        }
+
+
+class TimingClient:
+    """Enveloppe un JiraClient et chronomètre chacun de ses appels réseau"""
+
+    def __init__(self, client, recorder: LatencyRecorder):
+        self._client = client
+        self._recorder = recorder
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+    def _timed(self, method: str, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return getattr(self._client, method)(*args, **kwargs)
+        finally:
+            self._recorder.add(time.perf_counter() - started)
+
+    def get(self, *args, **kwargs):
+        return self._timed('get', *args, **kwargs)
+
+    def get_paginated(self, *args, **kwargs):
+        return self._timed('get_paginated', *args, **kwargs)
+
+    def post(self, *args, **kwargs):
+        return self._timed('post', *args, **kwargs)
+
+    def put(self, *args, **kwargs):
+        return self._timed('put', *args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        return self._timed('delete', *args, **kwargs)
+
+
+class BenchmarkContext:
+    """État partagé par les benchmarks d'une taille de jeu de données"""
+
+    def __init__(self, server: MockJiraServer, config_path: str, work_dir: str, ops: int):
+        self.server = server
+        self.dataset = server.dataset
+        self.config_path = config_path
+        self.work_dir = work_dir
+        self.ops = ops
+        self.recorder = None
+
+    def client(self):
+        """Client neuf pour chaque benchmark, même empilement que create_client"""
+        from lib.jira_client import JiraClient
+        from lib.response_cache import CachedClient
+        from lib.request_coalescing import CoalescingClient
+
+        client = TimingClient(JiraClient(self.config_path), self.recorder)
+        # Cache disque désactivé: les mesures ne doivent pas dépendre des exécutions précédentes
+        return CoalescingClient(CachedClient(client, enabled=False))
+
+    def issue_keys(self, project_key: str) -> List[str]:
+        """Clés des `ops` premières issues d'un projet (lues directement dans le jeu de données)"""
+        keys = [i['key'] for i in self.dataset.issues if i['project'] == project_key]
+        return keys[:self.ops]
+
+
+# ---- Benchmarks -----------------------------------------------------------
+# Chaque fonction retourne le nombre d'éléments traités (issues, groupes, ...)
+
+def bench_bulk_create(ctx: BenchmarkContext) -> int:
+    from scripts.bulk_operations import BulkOperations
+    issues_data = [{'fields': {'project': {'key': 'PRJ0'}, 'summary': f'Benchmark {i}',
+                               'issuetype': {'name': 'Task'}}} for i in range(ctx.ops)]
+    results = BulkOperations(ctx.client()).bulk_create_issues(issues_data)
+    return len(results['created'])
+
+
+def bench_bulk_update(ctx: BenchmarkContext) -> int:
+    from scripts.bulk_operations import BulkOperations
+    updates = [{'issue_key': key, 'fields': {'labels': ['benchmark']}} for key in ctx.issue_keys('PRJ1')]
+    results = BulkOperations(ctx.client()).bulk_update_issues(updates)
+    return len(results['updated'])
+
+
+def bench_bulk_transition(ctx: BenchmarkContext) -> int:
+    from scripts.bulk_operations import BulkOperations
+    results = BulkOperations(ctx.client()).bulk_transition_issues(ctx.issue_keys('PRJ2'), 'Done')
+    return len(results['transitioned'])
+
+
+def bench_bulk_assign(ctx: BenchmarkContext) -> int:
+    from scripts.bulk_operations import BulkOperations
+    account_id = ctx.dataset.users[1]['accountId']
+    results = BulkOperations(ctx.client()).bulk_assign_issues(ctx.issue_keys('PRJ3'), account_id)
+    return len(results['assigned'])
+
+
+def bench_bulk_delete(ctx: BenchmarkContext) -> int:
+    from scripts.bulk_operations import BulkOperations
+    results = BulkOperations(ctx.client()).bulk_delete_issues(ctx.issue_keys('PRJ4'))
+    return len(results['deleted'])
+
+
+def bench_reporting_project(ctx: BenchmarkContext) -> int:
+    from scripts.reporting import ReportingTool
+    return ReportingTool(ctx.client()).generate_project_report('PRJ0')['total_issues']
+
+
+def bench_reporting_sla(ctx: BenchmarkContext) -> int:
+    from scripts.reporting import ReportingTool
+    return ReportingTool(ctx.client()).generate_sla_report('PRJ0')['total_issues']
+
+
+def bench_reporting_dashboard(ctx: BenchmarkContext) -> int:
+    from scripts.reporting import ReportingTool
+    return ReportingTool(ctx.client()).generate_dashboard_summary()['total_projects']
+
+
+def bench_reporting_export_csv(ctx: BenchmarkContext) -> int:
+    from scripts.reporting import ReportingTool
+    filename = os.path.join(ctx.work_dir, 'report.csv')
+    ReportingTool(ctx.client()).export_csv_report('PRJ0', filename)
+    with open(filename, encoding='utf-8') as f:
+        return sum(1 for _ in f) - 1
+
+
+def bench_audit_groups(ctx: BenchmarkContext) -> int:
+    from scripts.audit_tool import AuditTool
+    return AuditTool(ctx.client()).audit_groups()['total_groups']
+
+
+def bench_audit_permissions(ctx: BenchmarkContext) -> int:
+    from scripts.audit_tool import AuditTool
+    return AuditTool(ctx.client()).audit_permissions()['total_schemes']
+
+
+def bench_users_last_login(ctx: BenchmarkContext) -> int:
+    from scripts.user_manager import UserManager
+    return len(UserManager(ctx.client()).get_users_by_last_login())
+
+
+def bench_sprint_velocity(ctx: BenchmarkContext) -> int:
+    from scripts.sprint_manager import SprintManager
+    return SprintManager(ctx.client()).calculate_velocity(board_id=1)['sprints_analyzed']
+
+
+# Ordre d'exécution: lectures d'abord, écritures ensuite (la suppression en dernier)
+BENCHMARKS = {
+    'reporting.project': bench_reporting_project,
+    'reporting.sla': bench_reporting_sla,
+    'reporting.dashboard': bench_reporting_dashboard,
+    'reporting.export_csv': bench_reporting_export_csv,
+    'audit.groups': bench_audit_groups,
+    'audit.permissions': bench_audit_permissions,
+    'users.last_login': bench_users_last_login,
+    'sprint.velocity': bench_sprint_velocity,
+    'bulk.create': bench_bulk_create,
+    'bulk.update': bench_bulk_update,
+    'bulk.transition': bench_bulk_transition,
+    'bulk.assign': bench_bulk_assign,
+    'bulk.delete': bench_bulk_delete,
+}
+
+
+def run_benchmark(name: str, func: Callable, ctx: BenchmarkContext) -> Dict:
+    """Exécute un benchmark et retourne ses mesures"""
+    from lib.http_session import get_session
+    from lib.rate_limiter import get_rate_limiter
+
+    ctx.recorder = LatencyRecorder()
+    ctx.server.reset_stats()
+    limiter = get_rate_limiter()
+    throttled_before = limiter.throttled_count
+    hooks = get_session().hooks['response']
+    hooks.append(ctx.recorder.response_hook)
+
+    error = None
+    items = 0
+    started = time.perf_counter()
+    try:
+        # La sortie des scripts (✓/✗ par issue) n'est pas mesurée
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            items = func(ctx)
+    except Exception as e:
+        error = f'{type(e).__name__}: {e}'
+    finally:
+        wall = time.perf_counter() - started
+        hooks.remove(ctx.recorder.response_hook)
+
+    with ctx.server.stats_lock:
+        stats = dict(ctx.server.stats)
+
+    return {
+        'benchmark': name,
+        'size': len(ctx.dataset.issues),
+        'items': items,
+        'wall_s': round(wall, 4),
+        'items_per_s': round(items / wall, 2) if wall > 0 else 0,
+        'requests': sum(stats.values()),
+        'requests_per_s': round(sum(stats.values()) / wall, 2) if wall > 0 else 0,
+        'throttled': stats.get('429', 0),
+        'client_throttled': limiter.throttled_count - throttled_before,
+        'latency_ms': ctx.recorder.summary(),
+        'error': error
+    }
+
+
+def run_size(size: int, names: List[str], args) -> List[Dict]:
+    """Génère un jeu de données, démarre le serveur et exécute les benchmarks"""
+    print(f"\n=== {size} issues ===")
+    started = time.perf_counter()
+    dataset = MockDataset(issues=size, projects=args.projects, users=args.users, seed=args.seed)
+    print(f"Jeu de données généré en {time.perf_counter() - started:.1f}s")
+
+    work_dir = tempfile.mkdtemp(prefix='jira_bench_')
+    results = []
+    try:
+        with MockJiraServer(dataset, latency=args.latency / 1000, jitter=args.jitter / 1000,
+                            max_results=args.max_results, rate_limit=args.rate_limit) as server:
+            config_path = os.path.join(work_dir, 'config.json')
+            with open(config_path, 'w') as f:
+                json.dump({'jira_url': server.base_url, 'email': 'bench@example.com',
+                           'api_token': 'mock'}, f)
+
+            ctx = BenchmarkContext(server, config_path, work_dir, args.ops)
+            for name in names:
+                result = run_benchmark(name, BENCHMARKS[name], ctx)
+                result['size'] = size
+                results.append(result)
+
+                status = f"✗ {result['error']}" if result['error'] else '✓'
+                print(f"  {status} {name:<22} {result['wall_s']:>8.3f}s  "
+                      f"{result['items_per_s']:>9.1f} él./s  {result['requests']:>6} req  "
+                      f"p95 {result['latency_ms']['p95']:>7.1f} ms")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    return results
+
+
+def compare_results(current: List[Dict], baseline_path: str, threshold: float) -> int:
+    """
+    Compare les durées à une exécution précédente
+
+    Returns:
+        Nombre de régressions au-delà du seuil
+    """
+    with open(baseline_path, 'r') as f:
+        baseline = {(r['benchmark'], r['size']): r for r in json.load(f).get('runs', [])}
+
+    regressions = 0
+    print(f"\n=== COMPARAISON avec {baseline_path} ===")
+    for result in current:
+        previous = baseline.get((result['benchmark'], result['size']))
+        if not previous or result['error'] or previous.get('error') or not previous['wall_s']:
+            continue
+
+        delta = (result['wall_s'] - previous['wall_s']) / previous['wall_s'] * 100
+        marker = '  '
+        if delta > threshold:
+            marker = '⚠ '
+            regressions += 1
+        print(f"{marker}{result['benchmark']:<22} {result['size']:>7}  "
+              f"{previous['wall_s']:>8.3f}s → {result['wall_s']:>8.3f}s  ({delta:+.1f}%)")
+
+    if regressions:
+        print(f"\n⚠ {regressions} régression(s) au-delà de {threshold}%")
+    else:
+        print("\n✓ Aucune régression")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmarks Jira CLI contre un Jira simulé')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='Tailles de jeu de données (nombre d\'issues)')
+    parser.add_argument('--only', nargs='+', choices=list(BENCHMARKS), help='Benchmarks à exécuter')
+    parser.add_argument('--ops', type=int, default=200, help='Issues traitées par benchmark d\'écriture')
+    parser.add_argument('--projects', type=int, default=5, help='Nombre de projets')
+    parser.add_argument('--users', type=int, default=200, help='Nombre d\'utilisateurs')
+    parser.add_argument('--seed', type=int, default=42, help='Graine du générateur')
+    parser.add_argument('--latency', type=float, default=20.0, help='Latence simulée par requête (ms)')
+    parser.add_argument('--jitter', type=float, default=5.0, help='Variation de la latence (ms)')
+    parser.add_argument('--max-results', type=int, default=100, help='Taille maximale d\'une page')
+    parser.add_argument('--rate-limit', type=float, help='Débit serveur avant 429 (req/s, défaut: illimité)')
+    parser.add_argument('--client-rate', type=float, default=1000.0,
+                        help='Débit du limiteur client (JIRA_RATE_LIMIT / JIRA_RATE_LIMIT_MAX)')
+    parser.add_argument('--output', help='Fichier JSON des résultats (défaut: benchmarks/results/bench-<date>.json)')
+    parser.add_argument('--compare', help='Résultats précédents à comparer')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Écart (%%) signalé comme régression')
+
+    args = parser.parse_args()
+
+    # Le limiteur client est un singleton: le configurer avant tout import de lib
+    os.environ['JIRA_RATE_LIMIT'] = str(args.client_rate)
+    os.environ['JIRA_RATE_LIMIT_MAX'] = str(args.client_rate)
+
+    try:
+        from lib import fast_json
+
+        names = args.only or list(BENCHMARKS)
+        runs = []
+        for size in args.sizes:
+            runs.extend(run_size(size, names, args))
+
+        output = args.output or os.path.join(
+            BENCH_DIR, 'results', f"bench-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json")
+        os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+
+        with open(output, 'w') as f:
+            fast_json.dump({
+                'date': datetime.now().isoformat(),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'json_backend': fast_json.BACKEND,
+                'settings': {
+                    'latency_ms': args.latency,
+                    'jitter_ms': args.jitter,
+                    'max_results': args.max_results,
+                    'rate_limit': args.rate_limit,
+                    'client_rate': args.client_rate,
+                    'ops': args.ops,
+                    'seed': args.seed
+                },
+                'runs': runs
+            }, f)
+        print(f"\n✓ Résultats enregistrés dans {output}")
+
+        failed = [r for r in runs if r['error']]
+        regressions = compare_results(runs, args.compare, args.threshold) if args.compare else 0
+
+        if failed or regressions:
+            sys.exit(1)
+
+    except Exception as e:
+        print(f"Erreur: {e}", file=sys.stderr)
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
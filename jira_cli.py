@@ -5,7 +5,254 @@ Permet d'accéder à tous les outils depuis une seule commande
 """
 
 import sys
+import os
 import argparse
+import importlib
+import threading
+
+# Répertoire contenant les paquets `lib` et `scripts`
+JIRA_CLI_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'jira_cli')
+
+# Outils disponibles et module qui les implémente
+TOOL_MODULES = {
+    'users': 'scripts.user_manager',
+    'audit': 'scripts.audit_tool',
+    'projects': 'scripts.project_manager',
+    'reports': 'scripts.reporting',
+    'issues': 'scripts.issue_manager',
+    'sprints': 'scripts.sprint_manager',
+    'bulk': 'scripts.bulk_operations',
+    'boards': 'scripts.board_manager',
+    'dashboards': 'scripts.dashboard_manager'
+}
+
+# Modes qui exécutent plusieurs commandes avec un client chaud
+SESSION_MODES = ['shell', 'serve', 'batch']
+
+SHELL_HELP = """Commandes:
+  <outil> [arguments]   Exécute un outil (ex: users list-active --format json)
+  reset                 Oublie les données gardées en mémoire (projets, utilisateurs, ...)
+  help                  Affiche cette aide
+  exit, quit            Quitte le shell
+
+Outils: """ + ', '.join(TOOL_MODULES)
+
+
+def use_lib():
+    """Rend importables les paquets `lib` et `scripts`"""
+    if JIRA_CLI_DIR not in sys.path:
+        sys.path.insert(0, JIRA_CLI_DIR)
+
+
+def exit_code(exc: SystemExit) -> int:
+    """Code de sortie équivalent à celui d'un processus terminé par `exc`"""
+    if exc.code is None:
+        return 0
+    if isinstance(exc.code, int):
+        return exc.code
+    # sys.exit('message'): l'interpréteur affiche le message et sort avec 1
+    print(exc.code, file=sys.stderr)
+    return 1
+
+
+def run_tool(tool: str, tool_args: list) -> int:
+    """
+    Exécute le main() d'un outil dans le processus courant
+
+    Depuis le thread principal, sys.argv est remplacé le temps de l'appel pour
+    que l'outil voie exactement les arguments (et le nom de programme) qu'il
+    recevrait en tant que script. Les autres threads ne touchent pas à sys.argv.
+
+    Returns:
+        Code de sortie de l'outil
+    """
+    use_lib()
+    module = importlib.import_module(TOOL_MODULES[tool])
+    tool_args = list(tool_args)
+
+    swap_argv = threading.current_thread() is threading.main_thread()
+    saved_argv = sys.argv
+    if swap_argv:
+        sys.argv = [module.__file__] + tool_args
+    try:
+        module.main(tool_args)
+    except SystemExit as e:
+        return exit_code(e)
+    finally:
+        if swap_argv:
+            sys.argv = saved_argv
+        sys.stdout.flush()
+    return 0
+
+
+def run_command(argv: list) -> int:
+    """
+    Exécute une ligne de commande `<outil> [arguments]` en mode chaud
+
+    Les données de référence lues par la commande restent en mémoire pour les suivantes.
+
+    Returns:
+        Code de sortie de la commande
+    """
+    from lib.client_factory import end_command, reset_warm_clients
+
+    if argv == ['reset']:
+        reset_warm_clients()
+        print("✓ Données en mémoire oubliées")
+        return 0
+    if not argv or argv[0] not in TOOL_MODULES:
+        print(f"Outil inconnu: {argv[0] if argv else ''} (disponibles: {', '.join(TOOL_MODULES)})",
+              file=sys.stderr)
+        return 2
+
+    try:
+        return run_tool(argv[0], argv[1:])
+    finally:
+        end_command()
+
+
+def run_shell() -> int:
+    """Boucle interactive: toutes les commandes partagent le même client Jira"""
+    import shlex
+
+    use_lib()
+    from lib.client_factory import enable_warm_clients
+    enable_warm_clients()
+
+    try:
+        import readline  # noqa: F401 - historique et édition de ligne
+    except ImportError:
+        pass
+
+    print("Jira CLI shell - 'help' pour l'aide, 'exit' pour quitter")
+    while True:
+        try:
+            line = input('jira> ')
+        except EOFError:
+            print()
+            break
+        except KeyboardInterrupt:
+            print()
+            continue
+
+        try:
+            argv = shlex.split(line)
+        except ValueError as e:
+            print(f"Erreur: {e}", file=sys.stderr)
+            continue
+
+        if not argv:
+            continue
+        if argv[0] in ('exit', 'quit'):
+            break
+        if argv[0] == 'help':
+            print(SHELL_HELP)
+            continue
+
+        try:
+            exit_code = run_command(argv)
+        except KeyboardInterrupt:
+            print("\nInterrompu")
+            continue
+        except Exception as e:
+            # Une commande en échec ne doit pas fermer le shell (ni vider ses caches)
+            print(f"Erreur: {type(e).__name__}: {e}", file=sys.stderr)
+            exit_code = 1
+        if exit_code:
+            print(f"(code de sortie {exit_code})", file=sys.stderr)
+
+    return 0
+
+
+def run_server(server_args: list) -> int:
+    """Démon local: exécute les commandes reçues sur un socket Unix avec un client chaud"""
+    import signal
+
+    parser = argparse.ArgumentParser(prog='jira_cli.py serve',
+                                     description='Démon Jira CLI (client et caches gardés en mémoire)')
+    parser.add_argument('--socket', help='Socket Unix (défaut: JIRA_DAEMON_SOCKET ou '
+                                         '$XDG_RUNTIME_DIR/jira_cli.sock)')
+    args = parser.parse_args(server_args)
+
+    use_lib()
+    from lib.client_factory import enable_warm_clients
+    from lib.daemon import CommandServer, default_socket_path
+    enable_warm_clients()
+
+    socket_path = args.socket or default_socket_path()
+    # SIGTERM: arrêt propre (suppression du socket)
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    try:
+        server = CommandServer(socket_path, run_command)
+    except (RuntimeError, OSError) as e:
+        print(f"Erreur: {e}", file=sys.stderr)
+        return 1
+
+    with server:
+        print(f"✓ Démon à l'écoute sur {socket_path} (Ctrl+C pour arrêter)", flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+def run_batch(batch_args: list) -> int:
+    """Exécute un plan de commandes dans ce processus avec un client partagé"""
+    parser = argparse.ArgumentParser(prog='jira_cli.py batch',
+                                     description='Exécute une liste de commandes dans un seul processus')
+    parser.add_argument('plan', help='Plan: une commande par ligne, .json ou .yaml (- pour stdin)')
+    parser.add_argument('--workers', type=int,
+                        help='Étapes parallèles (&) exécutées simultanément (défaut: JIRA_WORKERS ou 8)')
+    parser.add_argument('--keep-going', action='store_true',
+                        help='Continuer après une étape en échec')
+    args = parser.parse_args(batch_args)
+
+    use_lib()
+    from lib.batch import PlanError, load_plan, run_plan
+    from lib.client_factory import enable_warm_clients
+
+    try:
+        steps = load_plan(args.plan)
+    except (OSError, PlanError) as e:
+        print(f"Erreur: plan {args.plan}: {e}", file=sys.stderr)
+        return 2
+
+    unknown = [step for step in steps if step['argv'][0] not in TOOL_MODULES]
+    if unknown:
+        for step in unknown:
+            print(f"Erreur: plan {args.plan}, ligne {step['line']}: outil inconnu '{step['argv'][0]}'",
+                  file=sys.stderr)
+        return 2
+
+    # Un seul client pour toutes les étapes: les lectures identiques ne partent qu'une fois
+    enable_warm_clients()
+    return run_plan(steps, lambda argv: run_tool(argv[0], argv[1:]),
+                    workers=args.workers, keep_going=args.keep_going)
+
+
+def forward_to_daemon(argv: list):
+    """
+    Confie une commande au démon désigné par JIRA_DAEMON_SOCKET
+
+    Une commande qui demande une confirmation interactive est relancée dans
+    ce processus (le démon n'a pas accès au terminal de l'appelant).
+
+    Returns:
+        Code de sortie de la commande, None si aucun démon ne répond
+        ou si la commande doit s'exécuter localement
+    """
+    use_lib()
+    from lib.daemon import default_socket_path, send_command
+
+    response = send_command(default_socket_path(), argv)
+    if response is None or response.get('needs_input'):
+        return None
+
+    sys.stdout.write(response['stdout'])
+    sys.stderr.write(response['stderr'])
+    return response['exit_code']
 
 
 def main():
@@ -24,6 +271,13 @@ Commandes disponibles:
   boards      Gestion des boards (list, create, config, issues, sprints, etc.)
   dashboards  Gestion des dashboards et filtres (list, create, share, favourites, etc.)
 
+Modes avec client chaud (projets, utilisateurs, boards gardés en mémoire):
+  shell       Shell interactif enchaînant les commandes dans un seul processus
+  serve       Démon local sur socket Unix (--socket); les commandes lancées avec
+              JIRA_DAEMON_SOCKET défini lui sont transmises
+  batch       Exécute un plan de commandes (fichier texte, JSON ou YAML) dans un
+              seul processus, avec étapes parallèles optionnelles
+
 Exemples:
   python3 jira_cli.py users list
   python3 jira_cli.py audit projects
@@ -42,34 +296,27 @@ Pour plus d'aide sur une commande:
         """
     )
 
-    parser.add_argument('tool', choices=['users', 'audit', 'projects', 'reports',
-                                        'issues', 'sprints', 'bulk', 'boards', 'dashboards'],
+    parser.add_argument('tool', choices=list(TOOL_MODULES) + SESSION_MODES,
                        help='Outil à utiliser')
     parser.add_argument('args', nargs=argparse.REMAINDER,
                        help='Arguments pour l\'outil')
 
     args = parser.parse_args()
 
-    # Mapper les outils vers leurs scripts
-    tool_map = {
-        'users': 'jira_cli/scripts/user_manager.py',
-        'audit': 'jira_cli/scripts/audit_tool.py',
-        'projects': 'jira_cli/scripts/project_manager.py',
-        'reports': 'jira_cli/scripts/reporting.py',
-        'issues': 'jira_cli/scripts/issue_manager.py',
-        'sprints': 'jira_cli/scripts/sprint_manager.py',
-        'bulk': 'jira_cli/scripts/bulk_operations.py',
-        'boards': 'jira_cli/scripts/board_manager.py',
-        'dashboards': 'jira_cli/scripts/dashboard_manager.py'
-    }
-
-    script = tool_map[args.tool]
-
-    # Exécuter le script correspondant avec les arguments
-    import subprocess
-    cmd = [sys.executable, script] + args.args
-    result = subprocess.run(cmd)
-    sys.exit(result.returncode)
+    if args.tool == 'shell':
+        sys.exit(run_shell())
+    if args.tool == 'serve':
+        sys.exit(run_server(args.args))
+    if args.tool == 'batch':
+        sys.exit(run_batch(args.args))
+
+    if os.environ.get('JIRA_DAEMON_SOCKET'):
+        exit_code = forward_to_daemon([args.tool] + args.args)
+        if exit_code is not None:
+            sys.exit(exit_code)
+
+    # Exécuter l'outil dans ce processus (pas de second interpréteur à démarrer)
+    sys.exit(run_tool(args.tool, args.args))
 
 
 if __name__ == '__main__':
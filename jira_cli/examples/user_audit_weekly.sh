@@ -31,31 +31,22 @@ log "=========================================="
 log "AUDIT HEBDOMADAIRE DES UTILISATEURS JIRA"
 log "=========================================="
 
-# 1. Audit complet
+# 1-4. Audit complet, utilisateurs actifs/désactivés, dernière connexion
+# Un seul processus: la liste des utilisateurs n'est téléchargée qu'une fois
 log ""
-log "1. Audit complet des accès..."
-python3 "$JIRA_CLI" users audit --output "$OUTPUT_DIR/audit_complet_$DATE.json" 2>&1 | tee -a "$LOG_FILE"
+log "1-4. Audit des accès et exports des utilisateurs..."
+python3 "$JIRA_CLI" batch - <<PLAN 2>&1 | tee -a "$LOG_FILE"
+users audit --output "$OUTPUT_DIR/audit_complet_$DATE.json"
+& users list-active --format json > "$OUTPUT_DIR/users_active_$DATE.json"
+& users list-disabled --format json > "$OUTPUT_DIR/users_disabled_$DATE.json"
+& users list-by-login --days 90 --format csv --output "$OUTPUT_DIR/users_by_login_$DATE.csv"
+PLAN
 
-# 2. Liste des utilisateurs actifs
-log ""
-log "2. Export des utilisateurs actifs..."
-python3 "$JIRA_CLI" users list-active --format json > "$OUTPUT_DIR/users_active_$DATE.json" 2>&1 | tee -a "$LOG_FILE"
-
-# 3. Liste des utilisateurs désactivés
-log ""
-log "3. Export des utilisateurs désactivés..."
-python3 "$JIRA_CLI" users list-disabled --format json > "$OUTPUT_DIR/users_disabled_$DATE.json" 2>&1 | tee -a "$LOG_FILE"
-
-# 4. Utilisateurs par dernière connexion
-log ""
-log "4. Export des utilisateurs par dernière connexion..."
-python3 "$JIRA_CLI" users list-by-login --days 90 --format csv --output "$OUTPUT_DIR/users_by_login_$DATE.csv" 2>&1 | tee -a "$LOG_FILE"
-
-# 5. Statistiques
+# 5. Statistiques (à partir des exports, sans nouvel appel à Jira)
 log ""
 log "5. Génération des statistiques..."
-ACTIVE_COUNT=$(python3 "$JIRA_CLI" users list-active --format json 2>/dev/null | jq '. | length')
-DISABLED_COUNT=$(python3 "$JIRA_CLI" users list-disabled --format json 2>/dev/null | jq '. | length')
+ACTIVE_COUNT=$(jq '. | length' "$OUTPUT_DIR/users_active_$DATE.json")
+DISABLED_COUNT=$(jq '. | length' "$OUTPUT_DIR/users_disabled_$DATE.json")
 TOTAL=$((ACTIVE_COUNT + DISABLED_COUNT))
 
 log ""
@@ -0,0 +1,134 @@
+"""
+Dimensionnement adaptatif des lots des opérations en masse (AIMD)
+La taille des lots et le nombre de workers augmentent tant que Jira répond
+sainement, et sont divisés par deux dès que Jira signale une saturation
+(429/503, erreurs 5xx, délais dépassés, latence au-delà de la cible).
+Les erreurs métier (champ invalide, permission, transition) ne sont pas
+une saturation: un lot où elles abondent garde sa taille.
+"""
+
+import os
+import time
+from typing import Dict, List, Optional
+
+from lib.concurrency import get_workers
+from lib.rate_limiter import get_rate_limiter
+
+# Bornes de la taille des lots
+MIN_BATCH_SIZE = 5
+MAX_BATCH_SIZE = 500
+
+# Augmentation de la taille des lots après un lot sain
+BATCH_SIZE_STEP = 10
+
+# Nombre maximum de workers atteignable par l'augmentation
+MAX_WORKERS = 32
+
+# Latence p95 cible en millisecondes (surchargeable via JIRA_LATENCY_TARGET_MS)
+DEFAULT_LATENCY_TARGET_MS = 1500
+
+# Au-delà de ce taux d'éléments en échec sans saturation (erreurs métier),
+# la taille du lot est maintenue au lieu d'augmenter
+MAX_ERROR_RATE = 0.1
+
+
+def get_latency_target() -> float:
+    """Latence p95 cible en secondes"""
+    try:
+        return max(1.0, float(os.environ.get('JIRA_LATENCY_TARGET_MS', DEFAULT_LATENCY_TARGET_MS))) / 1000
+    except ValueError:
+        return DEFAULT_LATENCY_TARGET_MS / 1000
+
+
+def percentile(values: List[float], fraction: float) -> Optional[float]:
+    """Percentile (méthode du rang le plus proche), None si la liste est vide"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))]
+
+
+class BatchController:
+    """
+    Taille de lot et nombre de workers ajustés lot après lot
+
+    Les mesures (durée des réponses, 429/503, 5xx, délais dépassés) proviennent du limiteur
+    de débit partagé: seul le temps de réponse de Jira compte, pas l'attente
+    locale imposée par le limiteur.
+    """
+
+    def __init__(self, batch_size: int = 50, workers: int = None,
+                 min_batch_size: int = MIN_BATCH_SIZE, max_batch_size: int = MAX_BATCH_SIZE,
+                 max_workers: int = MAX_WORKERS, latency_target: float = None):
+        """
+        Args:
+            batch_size: Taille initiale des lots
+            workers: Nombre initial de workers (défaut: JIRA_WORKERS ou 8)
+            min_batch_size, max_batch_size: Bornes de la taille des lots
+            max_workers: Nombre maximum de workers
+            latency_target: Latence p95 cible en secondes (défaut: JIRA_LATENCY_TARGET_MS)
+        """
+        self.min_batch_size = min_batch_size
+        self.max_batch_size = max(min_batch_size, max_batch_size)
+        self.batch_size = min(max(batch_size, self.min_batch_size), self.max_batch_size)
+        self.max_workers = max(1, max_workers)
+        self.workers = min(get_workers(workers), self.max_workers)
+        self.latency_target = latency_target or get_latency_target()
+        self.limiter = get_rate_limiter()
+        self.trajectory = []
+        self._snapshot = None
+
+    def start_batch(self):
+        """Mémorise l'état du limiteur avant l'envoi d'un lot"""
+        limiter = self.limiter
+        self._snapshot = (time.monotonic(), limiter.response_count, limiter.throttled_count,
+                          limiter.server_error_count, limiter.timeout_count)
+
+    def end_batch(self, items: int, failed: int) -> Dict:
+        """
+        Ajuste la taille et les workers d'après le lot terminé
+
+        Args:
+            items: Nombre d'éléments du lot
+            failed: Nombre d'éléments en échec
+
+        Returns:
+            Entrée ajoutée à la trajectoire
+        """
+        started, responses, throttled, server_errors, timeouts = self._snapshot
+        limiter = self.limiter
+        p95 = percentile(limiter.latencies_since(responses), 0.95)
+        throttled = limiter.throttled_count - throttled
+        server_errors = limiter.server_error_count - server_errors
+        timeouts = limiter.timeout_count - timeouts
+        error_rate = failed / items if items else 0.0
+
+        entry = {
+            'batch': len(self.trajectory) + 1,
+            'size': items,
+            'workers': self.workers,
+            'p95_ms': round(p95 * 1000) if p95 is not None else None,
+            'failed': failed,
+            'throttled': throttled,
+            'server_errors': server_errors,
+            'timeouts': timeouts,
+            'seconds': round(time.monotonic() - started, 3)
+        }
+
+        if (throttled or server_errors or timeouts
+                or (p95 is not None and p95 > self.latency_target)):
+            # Diminution multiplicative
+            entry['action'] = 'decrease'
+            self.batch_size = max(self.min_batch_size, self.batch_size // 2)
+            self.workers = max(1, self.workers // 2)
+        elif error_rate > MAX_ERROR_RATE:
+            # Erreurs métier, Jira n'est pas saturé: taille maintenue
+            entry['action'] = 'hold'
+        else:
+            # Augmentation additive
+            entry['action'] = 'increase'
+            self.batch_size = min(self.max_batch_size, self.batch_size + BATCH_SIZE_STEP)
+            self.workers = min(self.max_workers, self.workers + 1)
+
+        self.trajectory.append(entry)
+        return entry
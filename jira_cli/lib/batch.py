@@ -0,0 +1,227 @@
+"""
+Exécution d'un plan de commandes dans un seul processus (jira_cli.py batch)
+Toutes les étapes partagent le même client Jira et ses réponses en mémoire.
+
+Formats de plan:
+- texte: une commande par ligne (`#` pour les commentaires), `> fichier` en fin
+  de ligne pour écrire la sortie dans un fichier, `&` en début de ligne pour
+  une étape pouvant s'exécuter en même temps que les étapes `&` voisines
+- JSON / YAML: liste de commandes, ou {"steps": [...]} dont chaque étape est une
+  chaîne ou {"command": "...", "output": "...", "parallel": true}
+"""
+
+import io
+import os
+import shlex
+import sys
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from lib import fast_json
+from lib.concurrency import map_concurrent
+
+
+class PlanError(ValueError):
+    """Plan de commandes invalide"""
+
+
+def parse_command(command: str, output: str = None, parallel: bool = False, line: int = None) -> Dict:
+    """Transforme une ligne de commande en étape du plan"""
+    try:
+        argv = shlex.split(command)
+    except ValueError as e:
+        raise PlanError(f"ligne {line}: {e}" if line else str(e))
+
+    if len(argv) >= 2 and argv[-2] == '>':
+        output = argv[-1]
+        argv = argv[:-2]
+    if not argv:
+        raise PlanError(f"ligne {line}: commande vide" if line else "commande vide")
+
+    return {'argv': argv, 'output': output, 'parallel': parallel, 'line': line}
+
+
+def parse_text_plan(text: str) -> List[Dict]:
+    """Lit un plan au format texte (une commande par ligne)"""
+    steps = []
+    for number, raw in enumerate(text.splitlines(), 1):
+        line = raw.strip()
+        if not line or line.startswith('#'):
+            continue
+        parallel = line.startswith('&')
+        if parallel:
+            line = line[1:].strip()
+        steps.append(parse_command(line, parallel=parallel, line=number))
+    return steps
+
+
+def parse_plan_data(data) -> List[Dict]:
+    """Lit un plan structuré (JSON ou YAML déjà désérialisé)"""
+    if isinstance(data, dict):
+        data = data.get('steps')
+    if not isinstance(data, list):
+        raise PlanError("le plan doit être une liste d'étapes ou un objet {\"steps\": [...]}")
+
+    steps = []
+    for number, step in enumerate(data, 1):
+        if isinstance(step, str):
+            steps.append(parse_command(step, line=number))
+        elif isinstance(step, dict) and isinstance(step.get('command'), str):
+            steps.append(parse_command(step['command'], output=step.get('output'),
+                                       parallel=bool(step.get('parallel')), line=number))
+        else:
+            raise PlanError(f"étape {number}: chaîne ou objet avec une clé \"command\" attendu")
+    return steps
+
+
+def load_plan(path: str) -> List[Dict]:
+    """
+    Charge un plan depuis un fichier (`-` pour l'entrée standard)
+
+    Le format est déduit de l'extension: .json, .yaml / .yml (PyYAML requis), sinon texte.
+    """
+    if path == '-':
+        text = sys.stdin.read()
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            text = f.read()
+
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.json':
+        try:
+            return parse_plan_data(fast_json.loads(text))
+        except ValueError as e:
+            if isinstance(e, PlanError):
+                raise
+            raise PlanError(f"JSON invalide: {e}")
+
+    if extension in ('.yaml', '.yml'):
+        try:
+            import yaml
+        except ImportError:
+            raise PlanError("PyYAML est requis pour les plans YAML (pip install pyyaml)")
+        try:
+            return parse_plan_data(yaml.safe_load(text))
+        except yaml.YAMLError as e:
+            raise PlanError(f"YAML invalide: {e}")
+
+    return parse_text_plan(text)
+
+
+def group_steps(steps: List[Dict]) -> List[List[Dict]]:
+    """Regroupe les étapes parallèles consécutives (les autres restent seules)"""
+    groups = []
+    for step in steps:
+        if step['parallel'] and groups and groups[-1][0]['parallel']:
+            groups[-1].append(step)
+        else:
+            groups.append([step])
+    return groups
+
+
+class _ThreadLocalStdout:
+    """sys.stdout de remplacement: chaque thread peut écrire dans sa propre cible"""
+
+    def __init__(self, default):
+        self._default = default
+        self._local = threading.local()
+
+    @property
+    def target(self):
+        return getattr(self._local, 'target', None) or self._default
+
+    @target.setter
+    def target(self, stream):
+        self._local.target = stream
+
+    def write(self, text):
+        return self.target.write(text)
+
+    def flush(self):
+        self.target.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.target, name)
+
+
+def run_plan(steps: List[Dict], execute: Callable[[List[str]], int],
+             workers: Optional[int] = None, keep_going: bool = False) -> int:
+    """
+    Exécute les étapes d'un plan dans l'ordre
+
+    Les groupes d'étapes parallèles s'exécutent sur un pool de threads; leur
+    sortie est restituée dans l'ordre du plan une fois le groupe terminé.
+
+    Args:
+        steps: Étapes (voir load_plan)
+        execute: Fonction exécutant une commande et retournant son code de sortie
+        workers: Nombre d'étapes parallèles simultanées (défaut: JIRA_WORKERS ou 8)
+        keep_going: Continuer après une étape en échec
+
+    Returns:
+        Code de sortie de la première étape en échec, 0 si tout a réussi
+    """
+    stdout = _ThreadLocalStdout(sys.stdout)
+    total = len(steps)
+    index = {id(step): number for number, step in enumerate(steps, 1)}
+    failures = []
+    succeeded = 0
+
+    def run_step(step: Dict, buffered: bool) -> Dict:
+        buffer = io.StringIO() if buffered and not step['output'] else None
+        output_file = None
+        if step['output']:
+            try:
+                output_file = open(step['output'], 'w', encoding='utf-8')
+            except OSError as e:
+                print(f"Erreur: {e}", file=sys.stderr)
+                return {'exit_code': 1, 'seconds': 0.0, 'output': ''}
+
+        stdout.target = output_file or buffer
+        started = time.perf_counter()
+        try:
+            exit_code = execute(step['argv'])
+        finally:
+            stdout.target = None
+            if output_file:
+                output_file.close()
+        return {'exit_code': exit_code, 'seconds': time.perf_counter() - started,
+                'output': buffer.getvalue() if buffer else ''}
+
+    def report(step: Dict, result: Dict):
+        status = '✓' if result['exit_code'] == 0 else f"✗ (code {result['exit_code']})"
+        print(f"{status} [{index[id(step)]}/{total}] {shlex.join(step['argv'])} "
+              f"({result['seconds']:.1f}s)", file=sys.stderr)
+
+    started = time.perf_counter()
+    saved_stdout = sys.stdout
+    sys.stdout = stdout
+    try:
+        for group in group_steps(steps):
+            if len(group) == 1:
+                step = group[0]
+                print(f"▶ [{index[id(step)]}/{total}] {shlex.join(step['argv'])}", file=sys.stderr)
+                results = [run_step(step, buffered=False)]
+            else:
+                print(f"▶ [{index[id(group[0])]}-{index[id(group[-1])]}/{total}] "
+                      f"{len(group)} étapes en parallèle", file=sys.stderr)
+                results = map_concurrent(lambda s: run_step(s, buffered=True), group, workers)
+
+            for step, result in zip(group, results):
+                saved_stdout.write(result['output'])
+                report(step, result)
+                if result['exit_code'] != 0:
+                    failures.append(result['exit_code'])
+                else:
+                    succeeded += 1
+
+            if failures and not keep_going:
+                break
+    finally:
+        sys.stdout = saved_stdout
+        sys.stdout.flush()
+
+    print(f"\n{'✓' if not failures else '✗'} {succeeded}/{total} étapes réussies "
+          f"en {time.perf_counter() - started:.1f}s", file=sys.stderr)
+    return failures[0] if failures else 0
@@ -0,0 +1,212 @@
+"""
+Tâches asynchrones de modification en masse de Jira Cloud
+- bulk/issues/transition et bulk/issues/fields traitent jusqu'à 1 000 issues par tâche
+- bulk/queue/{taskId} donne l'avancement puis le résultat de chaque issue
+
+Les appels passent directement par la session partagée: l'état d'une tâche
+ne doit jamais être servi par le cache disque ou le regroupement des lectures.
+"""
+
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from lib import fast_json
+from lib.http_session import build_url, rate_limited_request
+
+# Nombre maximum d'issues par tâche
+MAX_TASK_ISSUES = 1000
+
+# Tâches bulk simultanées par utilisateur acceptées par Jira
+MAX_CONCURRENT_TASKS = 5
+
+# États finaux d'une tâche
+TERMINAL_STATUSES = ('COMPLETE', 'FAILED', 'CANCELLED', 'DEAD')
+
+# Intervalle de suivi des tâches (secondes), allongé progressivement
+POLL_INTERVAL = 1.0
+MAX_POLL_INTERVAL = 10.0
+
+# Durée maximale d'attente d'une tâche (secondes)
+DEFAULT_TIMEOUT = 3600
+
+
+class BulkTaskError(Exception):
+    """Tâche refusée par Jira ou non terminée"""
+
+
+def _request(client, method: str, endpoint: str, params: Dict = None, payload: Dict = None) -> Dict:
+    """Appel à l'API bulk, lève BulkTaskError avec le message de Jira en cas d'échec"""
+    kwargs = {'auth': client.auth, 'params': params}
+    if payload is not None:
+        kwargs['data'] = fast_json.dumps(payload).encode('utf-8')
+        kwargs['headers'] = {'Content-Type': 'application/json'}
+
+    response = rate_limited_request(method, build_url(client.base_url, endpoint), **kwargs)
+    try:
+        body = fast_json.loads(response.content) if response.content else {}
+    except ValueError:
+        body = {}
+
+    if response.status_code >= 400:
+        messages = list(body.get('errorMessages', [])) if isinstance(body, dict) else []
+        if isinstance(body, dict):
+            messages += [f"{field}: {message}" for field, message in body.get('errors', {}).items()]
+        raise BulkTaskError('; '.join(messages) or f'HTTP {response.status_code}')
+    return body
+
+
+def transition_groups(client, issue_keys: List[str]) -> List[Dict]:
+    """
+    Transitions disponibles pour un ensemble d'issues, regroupées par workflow
+
+    Returns:
+        Liste de {'issues': [clés], 'transitions': [{'transitionId', 'transitionName', ...}]}
+    """
+    groups = []
+    params = {'issueIdsOrKeys': ','.join(issue_keys)}
+    while True:
+        page = _request(client, 'GET', 'bulk/issues/transition', params=params)
+        new_groups = page.get('availableTransitions', [])
+        groups.extend(new_groups)
+
+        cursor = page.get('startingAfter')
+        if not cursor or not new_groups or cursor == params.get('startingAfter'):
+            return groups
+        params = {**params, 'startingAfter': cursor}
+
+
+def submit_transition_task(client, inputs: List[Tuple[str, List[str]]],
+                           notify: bool = True) -> str:
+    """
+    Soumet une tâche de transition
+
+    Args:
+        inputs: Liste de (ID de transition, clés des issues concernées)
+        notify: Envoyer les notifications de modification
+
+    Returns:
+        ID de la tâche
+    """
+    payload = {
+        'bulkTransitionInputs': [
+            {'transitionId': str(transition_id), 'selectedIssueIdsOrKeys': keys}
+            for transition_id, keys in inputs
+        ],
+        'sendBulkNotification': notify
+    }
+    return _request(client, 'POST', 'bulk/issues/transition', payload=payload)['taskId']
+
+
+def submit_edit_task(client, issue_keys: List[str], actions: List[str], edited: Dict,
+                     notify: bool = True) -> str:
+    """
+    Soumet une tâche de modification de champs (mêmes valeurs pour toutes les issues)
+
+    Args:
+        actions: Champs modifiés (selectedActions)
+        edited: Nouvelles valeurs au format editedFieldsInput (voir bulk_edit_input)
+
+    Returns:
+        ID de la tâche
+    """
+    payload = {
+        'selectedIssueIdsOrKeys': issue_keys,
+        'selectedActions': actions,
+        'editedFieldsInput': edited,
+        'sendBulkNotification': notify
+    }
+    return _request(client, 'POST', 'bulk/issues/fields', payload=payload)['taskId']
+
+
+def wait_for_task(client, task_id: str, timeout: float = DEFAULT_TIMEOUT,
+                  on_progress: Optional[Callable[[Dict], None]] = None) -> Dict:
+    """
+    Attend la fin d'une tâche
+
+    Args:
+        on_progress: Appelé avec l'état de la tâche à chaque suivi
+
+    Returns:
+        État final (status, processedAccessibleIssues, failedAccessibleIssues, ...)
+    """
+    deadline = time.monotonic() + timeout
+    interval = POLL_INTERVAL
+
+    while True:
+        task = _request(client, 'GET', f'bulk/queue/{task_id}')
+        if on_progress:
+            on_progress(task)
+        if task.get('status') in TERMINAL_STATUSES:
+            return task
+        if time.monotonic() + interval > deadline:
+            raise BulkTaskError(f"Tâche {task_id} non terminée après {timeout:.0f}s "
+                                f"({task.get('status')}, {task.get('progressPercent', 0)}%)")
+
+        time.sleep(interval)
+        interval = min(MAX_POLL_INTERVAL, interval * 1.5)
+
+
+def task_outcomes(task: Dict, issue_ids: Dict[str, str]) -> Dict[str, Optional[str]]:
+    """
+    Résultat de chaque issue d'une tâche terminée
+
+    Args:
+        task: État final de la tâche
+        issue_ids: ID de chaque clé soumise (Jira rend les résultats par ID)
+
+    Returns:
+        Erreur par clé (None si l'issue a été modifiée)
+    """
+    processed = {str(issue_id) for issue_id in task.get('processedAccessibleIssues', [])}
+    failed = {str(issue_id): errors for issue_id, errors in (task.get('failedAccessibleIssues') or {}).items()}
+
+    outcomes = {}
+    for key, issue_id in issue_ids.items():
+        if issue_id in failed:
+            errors = failed[issue_id]
+            outcomes[key] = '; '.join(errors) if isinstance(errors, list) else str(errors)
+        elif issue_id in processed:
+            outcomes[key] = None
+        elif task.get('status') != 'COMPLETE':
+            outcomes[key] = f"Tâche {task.get('status')}"
+        else:
+            outcomes[key] = 'Non traitée par Jira (issue inaccessible)'
+    return outcomes
+
+
+def bulk_edit_input(fields: Dict) -> Optional[Tuple[List[str], Dict]]:
+    """
+    Traduit des champs au format PUT issue/{key} en editedFieldsInput
+
+    Champs pris en charge: summary, labels (remplacés), priority (par id),
+    assignee (par accountId) et description (ADF).
+
+    Returns:
+        (selectedActions, editedFieldsInput), None si un champ n'est pas pris en charge
+    """
+    actions, edited = [], {}
+
+    for name, value in fields.items():
+        if name == 'summary' and isinstance(value, str):
+            edited.setdefault('singleLineTextFields', []).append({'fieldId': 'summary', 'text': value})
+        elif name == 'labels' and isinstance(value, list):
+            edited.setdefault('labelsFields', []).append({
+                'fieldId': 'labels',
+                'bulkEditMultiSelectFieldOption': 'REPLACE',
+                'labels': [{'name': label} for label in value]
+            })
+        elif name == 'priority' and isinstance(value, dict) and value.get('id'):
+            edited['priority'] = {'priorityId': str(value['id'])}
+        elif name == 'assignee' and isinstance(value, dict) and (value.get('accountId') or value.get('id')):
+            edited.setdefault('singleSelectClearableUserPickerFields', []).append({
+                'fieldId': 'assignee',
+                'user': {'accountId': value.get('accountId') or value.get('id')}
+            })
+        elif name == 'description' and isinstance(value, dict):
+            edited.setdefault('richTextFields', []).append({'fieldId': 'description',
+                                                            'richText': {'adfValue': value}})
+        else:
+            return None
+        actions.append(name)
+
+    return (actions, edited) if actions else None
@@ -0,0 +1,113 @@
+"""
+Construction du client Jira utilisé par les scripts
+Empile sur JiraClient le cache disque et le regroupement des lectures identiques
+La pile HTTP (requests) n'est importée qu'à la création du premier client
+
+En mode « chaud » (jira_cli.py shell / serve), un même client est réutilisé
+d'une commande à l'autre et garde en mémoire les données de référence
+(projets, utilisateurs, groupes, champs, boards).
+"""
+
+import hashlib
+import os
+import re
+import threading
+
+# Endpoints de référence conservés en mémoire entre deux commandes en mode chaud
+WARM_ENDPOINTS = re.compile(
+    r'^(project/search|project/[^/]+(/role(/\d+)?|/components|/versions)?'
+    r'|users?/search|users|user|user/groups|group/bulk|group/member'
+    r'|field|board|board/\d+(/configuration)?|permissionscheme|workflow/search)$'
+)
+
+# Variables d'identification: un client chaud n'est réutilisé que pour le même site et la même identité
+CREDENTIAL_ENV = ('JIRA_URL', 'JIRA_EMAIL', 'JIRA_API_TOKEN')
+
+# Durée de vie (secondes) des données de référence en mode chaud (surchargeable via JIRA_WARM_TTL)
+DEFAULT_WARM_TTL = 300
+
+_warm_clients = None
+_warm_lock = threading.Lock()
+
+
+def get_warm_ttl() -> float:
+    """Retourne la durée de vie configurée des données gardées en mémoire"""
+    try:
+        return max(0.0, float(os.environ.get('JIRA_WARM_TTL', DEFAULT_WARM_TTL)))
+    except ValueError:
+        return DEFAULT_WARM_TTL
+
+
+def is_warm_endpoint(endpoint: str) -> bool:
+    """Indique si un endpoint renvoie des données de référence à garder entre deux commandes"""
+    return bool(WARM_ENDPOINTS.match(endpoint))
+
+
+def credentials_fingerprint() -> str:
+    """Empreinte du site et des identifiants définis dans l'environnement (jamais stockés en clair)"""
+    values = '\0'.join(os.environ.get(name, '') for name in CREDENTIAL_ENV)
+    return hashlib.sha256(values.encode('utf-8')).hexdigest()
+
+
+def _build_client(config_path: str = None, use_cache: bool = True, max_age: float = None):
+    from lib.jira_client import JiraClient
+    from lib.response_cache import CachedClient
+    from lib.request_coalescing import CoalescingClient
+
+    client = JiraClient(config_path)
+    client = CachedClient(client, enabled=use_cache)
+    return CoalescingClient(client, max_age=max_age)
+
+
+def create_client(config_path: str = None, use_cache: bool = True):
+    """
+    Crée un client Jira prêt à l'emploi
+
+    En mode chaud, retourne le client déjà créé pour la même configuration
+    et les mêmes identifiants (JIRA_URL, JIRA_EMAIL, JIRA_API_TOKEN).
+
+    Args:
+        config_path: Fichier de configuration (défaut: ~/.jira_config.json ou variables d'environnement)
+        use_cache: Utiliser le cache disque des réponses peu changeantes
+
+    Returns:
+        Client exposant la même interface que JiraClient
+    """
+    if _warm_clients is None:
+        return _build_client(config_path, use_cache)
+
+    key = (os.path.abspath(config_path) if config_path else None, use_cache, credentials_fingerprint())
+    with _warm_lock:
+        if key not in _warm_clients:
+            _warm_clients[key] = _build_client(config_path, use_cache, max_age=get_warm_ttl())
+        return _warm_clients[key]
+
+
+def enable_warm_clients():
+    """Active la réutilisation des clients entre les commandes d'un même processus"""
+    global _warm_clients
+
+    with _warm_lock:
+        if _warm_clients is None:
+            _warm_clients = {}
+
+
+def end_command():
+    """
+    Termine une commande en mode chaud
+
+    Seules les données de référence encore fraîches restent en mémoire:
+    les recherches et les issues sont relues à la commande suivante.
+    """
+    with _warm_lock:
+        clients = list((_warm_clients or {}).values())
+    for client in clients:
+        client.retain(is_warm_endpoint)
+
+
+def reset_warm_clients():
+    """Oublie toutes les données gardées en mémoire par les clients chauds"""
+    with _warm_lock:
+        clients = list((_warm_clients or {}).values())
+    for client in clients:
+        client.clear()
@@ -0,0 +1,45 @@
+"""
+Exécution concurrente des appels indépendants à l'API Jira
+Les requêtes d'une même commande partent en parallèle sur un pool de threads
+borné au lieu d'attendre chacune un aller-retour réseau complet
+"""
+
+import os
+from typing import Callable, Iterable, List, Optional
+
+# Nombre de requêtes en vol simultanément (surchargeable via JIRA_WORKERS ou --workers)
+DEFAULT_WORKERS = 8
+
+
+def get_workers(workers: Optional[int] = None) -> int:
+    """Retourne le nombre de workers demandé, sinon celui configuré"""
+    if workers:
+        return max(1, workers)
+    try:
+        return max(1, int(os.environ.get('JIRA_WORKERS', DEFAULT_WORKERS)))
+    except ValueError:
+        return DEFAULT_WORKERS
+
+
+def map_concurrent(func: Callable, items: Iterable, workers: Optional[int] = None) -> List:
+    """
+    Applique `func` à chaque élément en parallèle
+
+    Args:
+        func: Fonction appelée pour chaque élément (doit gérer ses propres erreurs)
+        items: Éléments à traiter
+        workers: Nombre de threads (défaut: JIRA_WORKERS ou 8)
+
+    Returns:
+        Les résultats dans l'ordre des éléments
+    """
+    items = list(items)
+    workers = min(get_workers(workers), len(items) or 1)
+
+    if workers <= 1:
+        return [func(item) for item in items]
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(func, items))
@@ -0,0 +1,116 @@
+"""
+Création idempotente des issues (create / import-csv)
+Chaque ligne reçoit une empreinte déterministe de son contenu, posée en label
+sur l'issue créée et conservée dans un index local (JSON Lines par site).
+Une nouvelle exécution retrouve les lignes déjà créées par une recherche JQL
+par lot, l'index servant d'indice pour les issues pas encore indexées par la
+recherche; les lignes dont l'issue a disparu de Jira sont recréées.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+from lib import fast_json
+
+# Préfixe des labels d'empreinte
+LABEL_PREFIX = 'jcli-'
+
+
+def get_index_dir() -> str:
+    """Répertoire des index (JIRA_CREATE_INDEX_DIR, sinon $XDG_CACHE_HOME/jira_cli/created)"""
+    if os.environ.get('JIRA_CREATE_INDEX_DIR'):
+        return os.environ['JIRA_CREATE_INDEX_DIR']
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'jira_cli', 'created')
+
+
+class RowHasher:
+    """
+    Empreinte de chaque ligne: contenu des champs et rang parmi les lignes identiques
+
+    Deux lignes identiques d'un même fichier gardent ainsi deux empreintes
+    distinctes, stables d'une exécution à l'autre. Les lignes sont vues une
+    à une (import en flux): seul le compteur de chaque contenu distinct est
+    conservé, indexé par condensé.
+    """
+
+    def __init__(self):
+        self._occurrences = {}
+
+    def hash(self, issue_data: Dict) -> str:
+        """Empreinte de la ligne suivante"""
+        content = json.dumps(issue_data.get('fields', {}), sort_keys=True, ensure_ascii=False,
+                             separators=(',', ':'), default=str)
+        content_digest = hashlib.sha256(content.encode('utf-8')).digest()
+        occurrence = self._occurrences.get(content_digest, 0)
+        self._occurrences[content_digest] = occurrence + 1
+        digest = hashlib.sha256(f'{occurrence}:{content}'.encode('utf-8')).hexdigest()
+        return digest[:16]
+
+
+def hash_label(row_hash: str) -> str:
+    """Label posé sur l'issue créée"""
+    return f'{LABEL_PREFIX}{row_hash}'
+
+
+def with_hash_label(issue_data: Dict, row_hash: str) -> Dict:
+    """Copie des données d'issue avec le label d'empreinte"""
+    fields = dict(issue_data.get('fields', {}))
+    fields['labels'] = list(fields.get('labels') or []) + [hash_label(row_hash)]
+    return {**issue_data, 'fields': fields}
+
+
+class CreateIndex:
+    """Index local empreinte → clé d'issue, en ajout seul (clé nulle: entrée retirée)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.keys = {}
+        self._lock = threading.Lock()
+
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = fast_json.loads(line)
+                        if entry['key']:
+                            self.keys[entry['hash']] = entry['key']
+                        else:
+                            self.keys.pop(entry['hash'], None)
+                    except (ValueError, KeyError, TypeError):
+                        continue  # Ligne tronquée
+
+    @classmethod
+    def for_site(cls, base_url: str) -> 'CreateIndex':
+        """Index d'un site Jira (un fichier par hôte)"""
+        directory = get_index_dir()
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        host = urlsplit(base_url).netloc or 'jira'
+        return cls(os.path.join(directory, f'{host.replace(":", "_")}.jsonl'))
+
+    def get(self, row_hash: str) -> Optional[str]:
+        return self.keys.get(row_hash)
+
+    def add(self, entries: Dict[str, str]):
+        """Enregistre des empreintes et les clés des issues correspondantes"""
+        if not entries:
+            return
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                for row_hash, key in entries.items():
+                    f.write(fast_json.dumps({'hash': row_hash, 'key': key}) + '\n')
+            self.keys.update(entries)
+
+    def remove(self, row_hashes: List[str]):
+        """Retire des empreintes dont l'issue n'existe plus dans Jira"""
+        if not row_hashes:
+            return
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                for row_hash in row_hashes:
+                    f.write(fast_json.dumps({'hash': row_hash, 'key': None}) + '\n')
+                    self.keys.pop(row_hash, None)
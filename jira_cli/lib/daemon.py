@@ -0,0 +1,216 @@
+"""
+Démon local de jira_cli.py (mode serve)
+Un processus garde un client Jira chaud et exécute les commandes reçues sur
+un socket Unix, une à la fois. Chaque requête est une ligne JSON
+{"argv": [...], "cwd": "...", "env": {...}} et reçoit {"exit_code", "stdout",
+"stderr", "needs_input"} ({"ping": true} vérifie seulement que le démon répond).
+Une commande qui lit l'entrée standard (confirmation interactive) n'est pas
+exécutée jusqu'au bout: needs_input indique à l'appelant de la relancer chez lui.
+"""
+
+import io
+import os
+import socket
+import socketserver
+import sys
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from typing import Callable, Dict, List, Optional, Tuple
+
+from lib import fast_json
+
+# Taille maximale d'une requête (une ligne de commande)
+MAX_REQUEST_BYTES = 1024 * 1024
+
+# Variables d'environnement de l'appelant appliquées le temps de la commande
+# (identifiants compris: la commande s'exécute avec le site et l'identité de l'appelant)
+FORWARDED_ENV = ('JIRA_URL', 'JIRA_EMAIL', 'JIRA_API_TOKEN', 'JIRA_NO_CACHE', 'JIRA_WORKERS', 'JIRA_PAGINATION_WORKERS', 'JIRA_RATE_LIMIT',
+                 'JIRA_RATE_LIMIT_MAX', 'JIRA_LATENCY_TARGET_MS', 'JIRA_JOBS_DIR',
+                 'JIRA_CREATE_INDEX_DIR', 'JIRA_CACHE_DIR', 'JIRA_CACHE_MAX_MB')
+
+
+class InputRequested(BaseException):
+    """
+    La commande a tenté de lire l'entrée standard
+
+    Hérite de BaseException pour traverser les `except Exception` des outils.
+    """
+
+
+class _NoInput(io.TextIOBase):
+    """Entrée standard des commandes du démon: toute lecture interrompt la commande"""
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> str:
+        raise InputRequested()
+
+    def readline(self, size: int = -1) -> str:
+        raise InputRequested()
+
+
+def default_socket_path() -> str:
+    """Socket du démon (JIRA_DAEMON_SOCKET, sinon $XDG_RUNTIME_DIR ou ~/.cache/jira_cli)"""
+    if os.environ.get('JIRA_DAEMON_SOCKET'):
+        return os.environ['JIRA_DAEMON_SOCKET']
+    base = os.environ.get('XDG_RUNTIME_DIR') or os.path.join(os.path.expanduser('~'), '.cache', 'jira_cli')
+    return os.path.join(base, 'jira_cli.sock')
+
+
+def caller_env() -> Dict[str, str]:
+    """Variables de FORWARDED_ENV définies chez l'appelant"""
+    return {name: os.environ[name] for name in FORWARDED_ENV if name in os.environ}
+
+
+def _apply_env(env: Dict[str, str]) -> Tuple[Dict[str, Optional[str]], Optional[Tuple[float, float]]]:
+    """Applique l'environnement de l'appelant, retourne l'état à restaurer"""
+    from lib.rate_limiter import get_rate_limiter
+
+    # Créé avant toute modification: ses réglages initiaux restent ceux du démon
+    limiter = get_rate_limiter()
+    saved = {name: os.environ.get(name) for name in FORWARDED_ENV}
+    for name in FORWARDED_ENV:
+        if name in env:
+            os.environ[name] = str(env[name])
+        else:
+            os.environ.pop(name, None)
+
+    # Le limiteur est créé une fois par processus: il relit les débits demandés,
+    # sinon il garde le débit appris par les commandes précédentes
+    saved_rates = None
+    if 'JIRA_RATE_LIMIT' in env or 'JIRA_RATE_LIMIT_MAX' in env:
+        saved_rates = (limiter.rate, limiter.max_rate)
+        limiter.reload_settings()
+    return saved, saved_rates
+
+
+def _restore_env(saved: Tuple[Dict[str, Optional[str]], Optional[Tuple[float, float]]]):
+    from lib.rate_limiter import get_rate_limiter
+
+    variables, rates = saved
+    for name, value in variables.items():
+        if value is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = value
+
+    if rates:
+        limiter = get_rate_limiter()
+        limiter.rate, limiter.max_rate = rates
+
+
+def run_captured(execute: Callable[[List[str]], int], argv: List[str], cwd: str = None,
+                 env: Dict[str, str] = None) -> Dict:
+    """
+    Exécute une commande en capturant sa sortie
+
+    La commande ne peut pas lire l'entrée standard du démon: une
+    confirmation interactive l'interrompt et la réponse porte needs_input
+    pour que l'appelant la relance dans son terminal.
+
+    Args:
+        env: Variables de FORWARDED_ENV de l'appelant (None: environnement du démon)
+    """
+    stdout, stderr = io.StringIO(), io.StringIO()
+    previous_cwd = os.getcwd()
+    previous_stdin = sys.stdin
+    saved_env = _apply_env(env) if env is not None else None
+    needs_input = False
+    try:
+        if cwd:
+            os.chdir(cwd)
+        sys.stdin = _NoInput()
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            try:
+                exit_code = execute(argv)
+            except InputRequested:
+                needs_input, exit_code = True, 1
+            except Exception:
+                traceback.print_exc()
+                exit_code = 1
+    finally:
+        sys.stdin = previous_stdin
+        os.chdir(previous_cwd)
+        if saved_env is not None:
+            _restore_env(saved_env)
+
+    return {'exit_code': exit_code, 'stdout': stdout.getvalue(), 'stderr': stderr.getvalue(),
+            'needs_input': needs_input}
+
+
+class _CommandHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        line = self.rfile.readline(MAX_REQUEST_BYTES)
+        try:
+            request = fast_json.loads(line)
+            if request.get('ping'):
+                response = {'exit_code': 0, 'stdout': '', 'stderr': ''}
+            else:
+                argv = [str(arg) for arg in request['argv']]
+                response = run_captured(self.server.execute, argv, request.get('cwd'), request.get('env'))
+        except (ValueError, KeyError, TypeError, AttributeError):
+            response = {'exit_code': 2, 'stdout': '', 'stderr': 'Requête invalide\n'}
+
+        self.wfile.write(fast_json.dumps(response, indent=False).encode('utf-8') + b'\n')
+
+
+class CommandServer(socketserver.UnixStreamServer):
+    """Serveur de commandes sur socket Unix (commandes exécutées en série)"""
+
+    def __init__(self, socket_path: str, execute: Callable[[List[str]], int]):
+        self.execute = execute
+        self.socket_path = socket_path
+
+        directory = os.path.dirname(os.path.abspath(socket_path))
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        if os.path.exists(socket_path):
+            if send_command(socket_path, None) is not None:
+                raise RuntimeError(f"Un démon écoute déjà sur {socket_path}")
+            os.remove(socket_path)
+
+        # Socket accessible uniquement par l'utilisateur courant
+        previous_umask = os.umask(0o177)
+        try:
+            super().__init__(socket_path, _CommandHandler)
+        finally:
+            os.umask(previous_umask)
+
+    def server_close(self):
+        super().server_close()
+        try:
+            os.remove(self.socket_path)
+        except OSError:
+            pass
+
+
+def send_command(socket_path: str, argv: Optional[List[str]], timeout: float = None) -> Optional[Dict]:
+    """
+    Envoie une commande au démon
+
+    Args:
+        socket_path: Socket du démon
+        argv: Arguments de la commande (None: vérifie seulement que le démon répond)
+        timeout: Délai maximum en secondes (None: illimité)
+
+    Returns:
+        Réponse du démon, None si aucun démon n'écoute
+    """
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout if argv is not None else 2.0)
+            sock.connect(socket_path)
+            request = {'ping': True} if argv is None else {'argv': argv, 'cwd': os.getcwd(),
+                                                           'env': caller_env()}
+            sock.sendall(fast_json.dumps(request, indent=False).encode('utf-8') + b'\n')
+
+            chunks = []
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+    except (FileNotFoundError, ConnectionRefusedError):
+        return None
+
+    return fast_json.loads(b''.join(chunks))
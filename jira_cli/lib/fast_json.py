@@ -0,0 +1,50 @@
+"""
+Sérialisation JSON rapide
+Utilise orjson lorsqu'il est installé, sinon le module json standard.
+La sortie indentée a la même forme que json.dump(..., indent=2, ensure_ascii=False)
+"""
+
+import json
+from typing import IO
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - dépend de l'environnement
+    orjson = None
+
+BACKEND = 'orjson' if orjson else 'json'
+
+
+def loads(data):
+    """Désérialise un document JSON (str ou bytes)"""
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj, indent: bool = False) -> str:
+    """
+    Sérialise un objet en JSON
+
+    Args:
+        obj: Objet à sérialiser
+        indent: Indenter sur 2 espaces (format des exports)
+    """
+    if orjson:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, option=option).decode('utf-8')
+        except TypeError:
+            # Type non supporté par orjson: repli sur json
+            pass
+
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+
+def dump(obj, f: IO, indent: bool = True):
+    """Écrit un objet JSON dans un fichier ouvert (indenté par défaut, comme les exports)"""
+    f.write(dumps(obj, indent=indent))
@@ -0,0 +1,139 @@
+"""
+Session HTTP partagée pour tous les appels à l'API Jira
+Un seul pool de connexions keep-alive réutilisé par le client et les appels directs
+Chaque réponse alimente le limiteur de débit adaptatif (lib.rate_limiter)
+`requests` n'est importé qu'à la création de la session (démarrage rapide des scripts)
+"""
+
+import os
+import threading
+from typing import TYPE_CHECKING, Optional
+
+from lib.adaptive_batch import MAX_WORKERS
+from lib.concurrency import get_workers
+from lib.rate_limiter import get_rate_limiter, THROTTLE_STATUS_CODES
+
+# Taille du pool de connexions (surchargeable via JIRA_POOL_SIZE). Le pool
+# compte au moins autant de connexions que de workers possibles: au-delà,
+# urllib3 fermerait les connexions keep-alive rendues en surnombre.
+DEFAULT_POOL_SIZE = 10
+
+# Nombre de nouvelles tentatives après un 429/503
+MAX_RETRIES = 5
+
+if TYPE_CHECKING:
+    import requests
+
+_session = None
+_session_lock = threading.Lock()
+
+
+# Préfixes des endpoints servis par l'API Agile plutôt que par l'API REST v3
+AGILE_PREFIXES = ('board', 'sprint', 'epic', 'backlog')
+
+
+def build_url(base_url: str, endpoint: str) -> str:
+    """Construit l'URL complète d'un endpoint (API REST v3 ou Agile 1.0)"""
+    root = endpoint.split('/', 1)[0]
+    api = 'agile/1.0' if root in AGILE_PREFIXES else 'api/3'
+    return f"{base_url.rstrip('/')}/rest/{api}/{endpoint}"
+
+
+def get_accept_encoding() -> str:
+    """Compression négociée: brotli uniquement si urllib3 sait la décoder"""
+    try:
+        import brotli  # noqa: F401
+        return 'gzip, deflate, br'
+    except ImportError:
+        try:
+            import brotlicffi  # noqa: F401
+            return 'gzip, deflate, br'
+        except ImportError:
+            return 'gzip, deflate'
+
+
+def get_pool_size() -> int:
+    """Retourne la taille du pool configurée"""
+    try:
+        return max(1, int(os.environ.get('JIRA_POOL_SIZE', DEFAULT_POOL_SIZE)))
+    except ValueError:
+        return DEFAULT_POOL_SIZE
+
+
+def create_session(pool_size: Optional[int] = None) -> 'requests.Session':
+    """
+    Crée une session avec un pool de connexions persistantes
+
+    Args:
+        pool_size: Nombre de connexions conservées par hôte (défaut: JIRA_POOL_SIZE ou 10,
+                   relevé au nombre maximum de workers)
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    pool_size = pool_size or max(get_pool_size(), MAX_WORKERS, get_workers())
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({
+        'Accept': 'application/json',
+        'Accept-Encoding': get_accept_encoding(),
+        'Connection': 'keep-alive'
+    })
+    session.hooks['response'].append(get_rate_limiter().response_hook)
+    return session
+
+
+def get_session() -> 'requests.Session':
+    """Retourne la session partagée du processus (créée au premier appel)"""
+    global _session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = create_session()
+    return _session
+
+
+def rate_limited_request(method: str, url: str, max_retries: int = MAX_RETRIES,
+                         **kwargs) -> 'requests.Response':
+    """
+    Envoie une requête via la session partagée en respectant le limiteur de débit
+
+    Les réponses 429/503 sont rejouées après le délai Retry-After annoncé par Jira.
+    Un délai dépassé est compté par le limiteur (signal de saturation) puis propagé.
+
+    Args:
+        method: Méthode HTTP (GET, POST, PUT, DELETE)
+        url: URL complète
+        max_retries: Nombre maximum de nouvelles tentatives sur throttling
+        **kwargs: Arguments transmis à requests.Session.request
+    """
+    import requests
+
+    limiter = get_rate_limiter()
+    session = get_session()
+
+    for attempt in range(max_retries + 1):
+        limiter.acquire()
+        try:
+            response = session.request(method, url, **kwargs)
+        except requests.Timeout:
+            limiter.on_timeout()
+            raise
+        if response.status_code not in THROTTLE_STATUS_CODES:
+            break
+
+    return response
+
+
+def close_session():
+    """Ferme la session partagée et libère les connexions du pool"""
+    global _session
+
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
@@ -0,0 +1,132 @@
+"""
+Journal des opérations en masse (reprise après interruption)
+Chaque job est un fichier JSON Lines en ajout seul: une première ligne décrit
+l'opération et ses éléments (ou la source lue en flux: JQL, fichier CSV), puis
+une ligne est ajoutée par élément terminé.
+Après un crash, un Ctrl-C ou un token expiré, `bulk_operations.py resume <job>`
+ne rejoue que les éléments sans succès enregistré.
+"""
+
+import os
+import secrets
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from lib import fast_json
+
+
+def get_jobs_dir() -> str:
+    """Répertoire des journaux (JIRA_JOBS_DIR, sinon $XDG_CACHE_HOME/jira_cli/jobs)"""
+    if os.environ.get('JIRA_JOBS_DIR'):
+        return os.environ['JIRA_JOBS_DIR']
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'jira_cli', 'jobs')
+
+
+class JobJournal:
+    """
+    Journal d'un job en masse
+
+    Args:
+        path: Fichier du journal
+        header: Description du job (operation, params, items)
+        done: Résultat des éléments déjà réussis, par identifiant d'élément
+    """
+
+    def __init__(self, path: str, header: Dict, done: Dict[str, Optional[Dict]] = None):
+        self.path = path
+        self.header = header
+        self.done = done or {}
+        self._lock = threading.Lock()
+        self._file = open(path, 'a', encoding='utf-8')
+
+    @property
+    def job_id(self) -> str:
+        return self.header['job']
+
+    @property
+    def operation(self) -> str:
+        return self.header['operation']
+
+    @property
+    def params(self) -> Dict:
+        return self.header.get('params', {})
+
+    @property
+    def items(self) -> List:
+        return self.header.get('items', [])
+
+    @classmethod
+    def create(cls, operation: str, params: Dict, items: List) -> 'JobJournal':
+        """Crée le journal d'un nouveau job (les éléments sont figés dès le départ)"""
+        directory = get_jobs_dir()
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        job_id = f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{secrets.token_hex(2)}"
+        header = {
+            'job': job_id,
+            'operation': operation,
+            'params': params,
+            'items': items,
+            'created': datetime.now().isoformat(timespec='seconds')
+        }
+
+        path = os.path.join(directory, f'{job_id}.jsonl')
+        with open(path, 'x', encoding='utf-8') as f:
+            f.write(fast_json.dumps(header) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        return cls(path, header)
+
+    @classmethod
+    def load(cls, job_id: str) -> 'JobJournal':
+        """
+        Rouvre le journal d'un job existant
+
+        Raises:
+            FileNotFoundError: Job inconnu
+        """
+        path = job_id if job_id.endswith('.jsonl') else os.path.join(get_jobs_dir(), f'{job_id}.jsonl')
+        done = {}
+        with open(path, 'r', encoding='utf-8') as f:
+            header = fast_json.loads(f.readline())
+            for line in f:
+                try:
+                    entry = fast_json.loads(line)
+                except ValueError:
+                    continue  # Dernière ligne tronquée par l'interruption
+                if entry.get('error'):
+                    done.pop(entry['item'], None)
+                else:
+                    done[entry['item']] = entry.get('result')
+        return cls(path, header, done)
+
+    def is_done(self, item_id: str) -> bool:
+        return str(item_id) in self.done
+
+    def record(self, item_id: str, error: str = None, result: Dict = None):
+        """Enregistre le résultat d'un élément dès qu'il est connu"""
+        entry = {'item': str(item_id)}
+        if error:
+            entry['error'] = error
+        if result is not None:
+            entry['result'] = result
+
+        with self._lock:
+            self._file.write(fast_json.dumps(entry) + '\n')
+            self._file.flush()
+            if not error:
+                self.done[str(item_id)] = result
+
+    def sync(self):
+        """Force l'écriture du journal sur disque (appelé après chaque lot)"""
+        with self._lock:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.flush()
+                os.fsync(self._file.fileno())
+                self._file.close()
@@ -0,0 +1,189 @@
+"""
+Pagination des endpoints Jira paginés par startAt/maxResults
+- iter_paginated: générateur qui produit les éléments page par page (mémoire constante)
+- get_paginated_concurrent: liste complète, pages récupérées en parallèle
+
+Dès que la première page annonce le total, les pages suivantes sont
+récupérées en parallèle sur un pool de workers borné. Une page en échec
+lève PaginationError: un résultat ne peut pas être tronqué en silence.
+"""
+
+import os
+from collections import deque
+from typing import Iterator, List, Dict, Optional
+
+from lib.rate_limiter import get_rate_limiter
+
+# Taille de page par défaut (maximum accepté par /search)
+DEFAULT_PAGE_SIZE = 100
+
+# Nombre de pages récupérées en parallèle (surchargeable via JIRA_PAGINATION_WORKERS)
+DEFAULT_WORKERS = 4
+
+# Clés contenant les éléments dans les réponses paginées de Jira
+ITEM_KEYS = ('issues', 'values', 'records', 'users', 'comments', 'worklogs')
+
+
+class PaginationError(RuntimeError):
+    """Une page n'a pas pu être récupérée (erreur ou nouvelles tentatives épuisées)"""
+
+
+def get_workers() -> int:
+    """Retourne le nombre de workers de pagination configuré"""
+    try:
+        return max(1, int(os.environ.get('JIRA_PAGINATION_WORKERS', DEFAULT_WORKERS)))
+    except ValueError:
+        return DEFAULT_WORKERS
+
+
+def extract_items(page) -> List[Dict]:
+    """Extrait la liste des éléments d'une page de résultats"""
+    if isinstance(page, list):
+        return page
+    if isinstance(page, dict):
+        for key in ITEM_KEYS:
+            if isinstance(page.get(key), list):
+                return page[key]
+    return []
+
+
+def _is_last_page(page, items: List[Dict], page_size: int) -> bool:
+    """Détermine si une page est la dernière (pagination sans total)"""
+    if isinstance(page, dict) and 'isLast' in page:
+        return bool(page['isLast'])
+    return len(items) < page_size
+
+
+def iter_paginated(client, endpoint: str, params: Dict = None,
+                   page_size: int = DEFAULT_PAGE_SIZE,
+                   workers: Optional[int] = None) -> Iterator[Dict]:
+    """
+    Parcourt un endpoint paginé en produisant les éléments au fil des pages
+
+    Seules les pages en cours de téléchargement sont gardées en mémoire:
+    au plus `workers` pages sont préchargées en avance sur le consommateur.
+
+    Args:
+        client: Client Jira
+        endpoint: Endpoint paginé (search, project/search, board/{id}/issue, ...)
+        params: Paramètres de la requête
+        page_size: Taille de page si params ne précise pas maxResults
+        workers: Nombre de pages en vol simultanément (défaut: JIRA_PAGINATION_WORKERS)
+
+    Raises:
+        PaginationError: Page en échec (le client a retourné None)
+    """
+    params = dict(params or {})
+    params.setdefault('maxResults', page_size)
+    workers = workers or get_workers()
+    limiter = get_rate_limiter()
+
+    def get_page(start_at: int):
+        limiter.acquire()
+        page = client.get(endpoint, params={**params, 'startAt': start_at})
+        if page is None:
+            raise PaginationError(f"{endpoint}: échec de la page commençant à {start_at}")
+        return page
+
+    first_page = get_page(0)
+    items = extract_items(first_page)
+    yield from items
+
+    if not items:
+        return
+
+    # Total connu: planifier les offsets restants sur le pool, dans l'ordre
+    if isinstance(first_page, dict) and 'total' in first_page:
+        total = first_page.get('total', 0)
+        step = first_page.get('maxResults') or len(items)
+        offsets = iter(range(step, total, step))
+
+        def fetch(start_at: int) -> List[Dict]:
+            return extract_items(get_page(start_at))
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            for start_at in offsets:
+                pending.append(executor.submit(fetch, start_at))
+                if len(pending) >= workers:
+                    break
+
+            while pending:
+                page_items = pending.popleft().result()
+                next_offset = next(offsets, None)
+                if next_offset is not None:
+                    pending.append(executor.submit(fetch, next_offset))
+                yield from page_items
+        return
+
+    # Sans total: pagination séquentielle jusqu'à la dernière page
+    page = first_page
+    start_at = len(items)
+    while not _is_last_page(page, items, params['maxResults']):
+        page = get_page(start_at)
+        items = extract_items(page)
+        if not items:
+            break
+        yield from items
+        start_at += len(items)
+
+
+def get_paginated_concurrent(client, endpoint: str, params: Dict = None,
+                             page_size: int = DEFAULT_PAGE_SIZE,
+                             workers: Optional[int] = None) -> List[Dict]:
+    """
+    Récupère tous les éléments d'un endpoint paginé, pages en parallèle
+
+    Args:
+        client: Client Jira
+        endpoint: Endpoint paginé (search, project/search, board/{id}/issue, ...)
+        params: Paramètres de la requête
+        page_size: Taille de page si params ne précise pas maxResults
+        workers: Nombre de pages en vol simultanément (défaut: JIRA_PAGINATION_WORKERS)
+
+    Returns:
+        Les éléments dans l'ordre des pages
+    """
+    return list(iter_paginated(client, endpoint, params=params,
+                               page_size=page_size, workers=workers))
+
+
+def iter_search_while_mutating(client, jql: str, fields: str = 'key',
+                               page_size: int = DEFAULT_PAGE_SIZE,
+                               workers: Optional[int] = None) -> Iterator[Dict]:
+    """
+    Parcourt les issues d'une JQL pendant que le consommateur les modifie
+
+    Une issue qui sort du résultat (suppression, transition) décale les pages
+    suivantes: la pagination par startAt en saute alors autant. Tant qu'une
+    passe n'a pas vu tout le total annoncé, une nouvelle passe reprend les
+    issues manquées. Chaque issue n'est produite qu'une fois (seules les clés
+    déjà produites sont gardées en mémoire).
+
+    Args:
+        client: Client Jira
+        jql: Requête JQL
+        fields: Champs des issues produites
+        page_size: Taille de page
+        workers: Pages préchargées en avance sur le consommateur (défaut: JIRA_PAGINATION_WORKERS)
+    """
+    params = {'jql': jql, 'fields': fields}
+    seen = set()
+
+    while True:
+        probe = client.get('search', params={**params, 'startAt': 0, 'maxResults': 0})
+        expected = probe.get('total') if isinstance(probe, dict) else None
+
+        visited = new = 0
+        for issue in iter_paginated(client, 'search', params=params, page_size=page_size, workers=workers):
+            visited += 1
+            if issue['key'] in seen:
+                continue
+            seen.add(issue['key'])
+            new += 1
+            yield issue
+
+        if not new or expected is None or visited >= expected:
+            return
@@ -0,0 +1,69 @@
+"""
+Étages de traitement en flux reliés par des files bornées
+Un étage s'exécute dans son propre thread et produit ses éléments dans une
+file de taille limitée: il prend de l'avance sur l'étage suivant sans jamais
+dépasser `maxsize` éléments en mémoire (contre-pression)
+"""
+
+import queue
+import threading
+from typing import Iterable, Iterator
+
+# Taille par défaut des files entre étages
+DEFAULT_QUEUE_SIZE = 500
+
+_DONE = object()
+
+
+class _Failure:
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+def prefetch(iterable: Iterable, maxsize: int = DEFAULT_QUEUE_SIZE) -> Iterator:
+    """
+    Consomme `iterable` dans un thread et restitue ses éléments dans l'ordre
+
+    Une exception levée par l'étage est relancée chez le consommateur. Si le
+    consommateur s'arrête avant la fin, l'étage s'interrompt au prochain
+    élément produit.
+
+    Args:
+        iterable: Étage à exécuter en arrière-plan (générateur)
+        maxsize: Nombre maximum d'éléments produits d'avance
+    """
+    items = queue.Queue(maxsize=max(1, maxsize))
+    stopped = threading.Event()
+
+    def put(item) -> bool:
+        while not stopped.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def run():
+        try:
+            for item in iterable:
+                if not put(item):
+                    return
+        except BaseException as e:
+            put(_Failure(e))
+            return
+        put(_DONE)
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+
+    try:
+        while True:
+            item = items.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            yield item
+    finally:
+        stopped.set()
@@ -0,0 +1,205 @@
+"""
+Limiteur de débit adaptatif (token bucket) pour l'API Jira Cloud
+Le débit augmente tant que Jira répond normalement et diminue dès que
+les en-têtes Retry-After / X-RateLimit-* signalent une saturation
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+# Débit initial en requêtes/seconde (surchargeable via JIRA_RATE_LIMIT)
+DEFAULT_RATE = 10.0
+
+# Débit maximum atteignable par l'augmentation adaptative (JIRA_RATE_LIMIT_MAX)
+DEFAULT_MAX_RATE = 50.0
+
+# Débit plancher, même après plusieurs 429 consécutifs
+MIN_RATE = 0.5
+
+# Codes HTTP signalant un throttling côté Jira
+THROTTLE_STATUS_CODES = (429, 503)
+
+# Nombre de durées de réponse conservées (lues par lib.adaptive_batch)
+LATENCY_WINDOW = 2048
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Convertit un en-tête Retry-After (secondes ou date HTTP) en secondes d'attente"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    from email.utils import parsedate_to_datetime
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_reset(value: Optional[str]) -> Optional[float]:
+    """Convertit un en-tête X-RateLimit-Reset (date ISO 8601) en secondes d'attente"""
+    if not value:
+        return None
+    try:
+        reset_at = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        if reset_at.tzinfo is None:
+            reset_at = reset_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (reset_at - datetime.now(timezone.utc)).total_seconds())
+    except ValueError:
+        return parse_retry_after(value)
+
+
+class AdaptiveRateLimiter:
+    """Token bucket dont le débit s'ajuste aux réponses de Jira (AIMD)"""
+
+    def __init__(self, rate: float = None, max_rate: float = None,
+                 min_rate: float = MIN_RATE, increase_step: float = 0.5):
+        """
+        Args:
+            rate: Débit initial en requêtes/seconde (défaut: JIRA_RATE_LIMIT ou 10)
+            max_rate: Débit maximum (défaut: JIRA_RATE_LIMIT_MAX ou 50)
+            min_rate: Débit minimum
+            increase_step: Augmentation du débit après chaque réponse saine
+        """
+        self.max_rate = max_rate or _env_float('JIRA_RATE_LIMIT_MAX', DEFAULT_MAX_RATE)
+        self.min_rate = min_rate
+        self.rate = min(rate or _env_float('JIRA_RATE_LIMIT', DEFAULT_RATE), self.max_rate)
+        self.increase_step = increase_step
+
+        self.throttled_count = 0
+        self.server_error_count = 0
+        self.timeout_count = 0
+        self.response_count = 0
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+        self._tokens = 1.0
+        self._paused_until = 0.0
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reload_settings(self):
+        """
+        Relit JIRA_RATE_LIMIT et JIRA_RATE_LIMIT_MAX (commande transmise au démon)
+
+        Sans JIRA_RATE_LIMIT, le débit courant est conservé (borné par le nouveau maximum).
+        """
+        with self._lock:
+            self.max_rate = _env_float('JIRA_RATE_LIMIT_MAX', DEFAULT_MAX_RATE)
+            rate = _env_float('JIRA_RATE_LIMIT', self.rate) if os.environ.get('JIRA_RATE_LIMIT') else self.rate
+            self.rate = max(self.min_rate, min(rate, self.max_rate))
+
+    def _refill(self, now: float):
+        """Ajoute les jetons accumulés depuis le dernier appel"""
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        burst = max(1.0, self.rate)
+        self._tokens = min(burst, self._tokens + elapsed * self.rate)
+
+    def acquire(self):
+        """Bloque jusqu'à ce qu'une requête puisse être envoyée"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self._paused_until - now
+
+                if wait <= 0:
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+
+            time.sleep(wait)
+
+    def pause(self, seconds: float):
+        """Suspend l'envoi de requêtes pendant `seconds` secondes"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+
+    def latencies_since(self, count: int) -> List[float]:
+        """Durées (secondes) des réponses reçues depuis que response_count valait `count`"""
+        with self._lock:
+            new = min(self.response_count - count, len(self.latencies))
+            return list(self.latencies)[-new:] if new > 0 else []
+
+    def on_response(self, status_code: int, headers: Dict, elapsed: float = None):
+        """Ajuste le débit en fonction d'une réponse de Jira"""
+        with self._lock:
+            self.response_count += 1
+            if elapsed is not None:
+                self.latencies.append(elapsed)
+            if status_code >= 500 and status_code not in THROTTLE_STATUS_CODES:
+                self.server_error_count += 1
+
+        retry_after = parse_retry_after(headers.get('Retry-After'))
+
+        if status_code in THROTTLE_STATUS_CODES:
+            with self._lock:
+                self.throttled_count += 1
+                self.rate = max(self.min_rate, self.rate / 2)
+            self.pause(retry_after if retry_after is not None else 1 / self.rate)
+            return
+
+        remaining = headers.get('X-RateLimit-Remaining')
+        limit = headers.get('X-RateLimit-Limit')
+
+        if remaining is not None and str(remaining).isdigit() and int(remaining) == 0:
+            # Quota épuisé: attendre la réinitialisation annoncée
+            reset = parse_reset(headers.get('X-RateLimit-Reset'))
+            with self._lock:
+                self.rate = max(self.min_rate, self.rate / 2)
+            self.pause(reset if reset is not None else 1.0)
+            return
+
+        near_limit = str(headers.get('X-RateLimit-NearLimit', '')).lower() == 'true'
+        if not near_limit and remaining is not None and limit:
+            try:
+                near_limit = int(remaining) < 0.2 * int(limit)
+            except ValueError:
+                pass
+
+        with self._lock:
+            if near_limit:
+                self.rate = max(self.min_rate, self.rate * 0.8)
+            else:
+                self.rate = min(self.max_rate, self.rate + self.increase_step)
+
+    def on_timeout(self):
+        """Compte une requête restée sans réponse dans le délai imparti"""
+        with self._lock:
+            self.timeout_count += 1
+
+    def response_hook(self, response, *args, **kwargs):
+        """Hook `response` pour requests.Session"""
+        self.on_response(response.status_code, response.headers, response.elapsed.total_seconds())
+        return response
+
+
+_limiter = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> AdaptiveRateLimiter:
+    """Retourne le limiteur partagé du processus"""
+    global _limiter
+
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                _limiter = AdaptiveRateLimiter()
+    return _limiter
@@ -0,0 +1,104 @@
+"""
+Regroupement (single-flight) des GET identiques au sein d'une commande
+Une même URL + paramètres n'est récupérée qu'une fois: les appels concurrents
+attendent la requête en vol, les appels suivants réutilisent sa réponse
+"""
+
+import json
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, Optional
+
+
+class CoalescingClient:
+    """
+    Enveloppe un JiraClient et déduplique les lectures identiques
+
+    Toute écriture (post/put/delete) vide la mémoire des réponses pour ne
+    jamais servir une lecture antérieure à une modification. Les lectures de
+    pages explicites (paramètre startAt) ne sont pas mémorisées afin que les
+    exports en streaming gardent une mémoire constante.
+    """
+
+    def __init__(self, client, max_age: Optional[float] = None):
+        """
+        Args:
+            client: Client Jira à envelopper
+            max_age: Durée de vie des réponses en secondes (None: toute la commande)
+        """
+        self._client = client
+        self.max_age = max_age
+        self._responses = {}
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+    def _call(self, method: str, endpoint: str, params: Dict = None, **kwargs):
+        fetch = getattr(self._client, method)
+
+        if params and 'startAt' in params:
+            return fetch(endpoint, params=params, **kwargs)
+
+        key = (method, endpoint, json.dumps([params or {}, kwargs], sort_keys=True, default=str))
+
+        with self._lock:
+            cached = self._responses.get(key)
+            if cached and (self.max_age is None or time.monotonic() - cached[0] < self.max_age):
+                future, owner = cached[1], False
+            else:
+                future, owner = Future(), True
+                self._responses[key] = (time.monotonic(), future)
+
+        if not owner:
+            return future.result()
+
+        try:
+            result = fetch(endpoint, params=params, **kwargs)
+        except Exception as e:
+            with self._lock:
+                self._responses.pop(key, None)
+            future.set_exception(e)
+            raise
+
+        if result is None:
+            # Échec signalé par le client: ne pas le mémoriser
+            with self._lock:
+                self._responses.pop(key, None)
+
+        future.set_result(result)
+        return result
+
+    def get(self, endpoint: str, params: Dict = None, **kwargs):
+        return self._call('get', endpoint, params=params, **kwargs)
+
+    def get_paginated(self, endpoint: str, params: Dict = None, **kwargs):
+        return self._call('get_paginated', endpoint, params=params, **kwargs)
+
+    def clear(self):
+        """Oublie toutes les réponses mémorisées"""
+        with self._lock:
+            self._responses.clear()
+
+    def retain(self, keep: Callable[[str], bool]):
+        """Ne garde que les réponses terminées des endpoints pour lesquels keep(endpoint) est vrai"""
+        now = time.monotonic()
+        with self._lock:
+            self._responses = {
+                key: (stored_at, future) for key, (stored_at, future) in self._responses.items()
+                if future.done() and keep(key[1])
+                and (self.max_age is None or now - stored_at < self.max_age)
+            }
+
+    def post(self, *args, **kwargs):
+        self.clear()
+        return self._client.post(*args, **kwargs)
+
+    def put(self, *args, **kwargs):
+        self.clear()
+        return self._client.put(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        self.clear()
+        return self._client.delete(*args, **kwargs)
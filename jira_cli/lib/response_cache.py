@@ -0,0 +1,225 @@
+"""
+Cache disque des réponses GET peu changeantes de l'API Jira
+- TTL par endpoint (projets, schémas de permissions, workflows, filtres, ...)
+- Revalidation conditionnelle (If-None-Match / If-Modified-Since) à expiration
+- Taille bornée avec éviction LRU
+"""
+
+import hashlib
+import json
+import os
+import re
+import time
+from typing import Dict, Optional
+
+from lib import fast_json
+from lib.http_session import build_url, rate_limited_request
+
+# Durée de fraîcheur (secondes) des endpoints mis en cache
+CACHE_TTLS = [
+    (re.compile(r'^project/(?!search$)[^/]+$'), 3600),
+    (re.compile(r'^project/[^/]+/role/\d+$'), 3600),
+    (re.compile(r'^board/\d+/configuration$'), 3600),
+    (re.compile(r'^permissionscheme/\d+$'), 6 * 3600),
+    (re.compile(r'^workflow/search$'), 6 * 3600),
+    (re.compile(r'^filter/\d+$'), 900),
+]
+
+# Taille maximale du cache en Mo (surchargeable via JIRA_CACHE_MAX_MB)
+DEFAULT_MAX_MB = 50
+
+
+def get_ttl(endpoint: str) -> Optional[int]:
+    """Retourne la durée de fraîcheur d'un endpoint, None s'il n'est pas mis en cache"""
+    for pattern, ttl in CACHE_TTLS:
+        if pattern.match(endpoint):
+            return ttl
+    return None
+
+
+def default_cache_dir() -> str:
+    """Répertoire du cache (JIRA_CACHE_DIR, sinon $XDG_CACHE_HOME/jira_cli/http)"""
+    if os.environ.get('JIRA_CACHE_DIR'):
+        return os.environ['JIRA_CACHE_DIR']
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'jira_cli', 'http')
+
+
+class ResponseCache:
+    """Stockage disque des réponses, une entrée JSON par requête"""
+
+    def __init__(self, directory: str = None, max_bytes: int = None):
+        self.directory = directory or default_cache_dir()
+        if max_bytes is None:
+            try:
+                max_bytes = int(float(os.environ.get('JIRA_CACHE_MAX_MB', DEFAULT_MAX_MB)) * 1024 * 1024)
+            except ValueError:
+                max_bytes = DEFAULT_MAX_MB * 1024 * 1024
+        self.max_bytes = max_bytes
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f'{key}.json')
+
+    def load(self, key: str) -> Optional[Dict]:
+        """Lit une entrée et la marque comme récemment utilisée"""
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                entry = fast_json.loads(f.read())
+            os.utime(path)
+            return entry
+        except (OSError, ValueError):
+            return None
+
+    def store(self, key: str, entry: Dict):
+        """Écrit une entrée (fichier privé) puis applique la limite de taille"""
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        path = self._path(key)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            fast_json.dump(entry, f, indent=False)
+        os.replace(tmp_path, path)
+
+        self.evict()
+
+    def delete(self, key: str):
+        """Supprime une entrée"""
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def evict(self):
+        """Supprime les entrées les moins récemment utilisées au-delà de max_bytes"""
+        try:
+            entries = [e for e in os.scandir(self.directory)
+                       if e.is_file() and e.name.endswith('.json')]
+        except OSError:
+            return
+
+        stats = [(e.stat().st_mtime, e.stat().st_size, e.path) for e in entries]
+        total = sum(size for _, size, _ in stats)
+
+        for _, size, path in sorted(stats):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+    def clear(self):
+        """Vide le cache"""
+        try:
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith('.json'):
+                    os.remove(entry.path)
+        except OSError:
+            pass
+
+
+class CachedClient:
+    """
+    Enveloppe un JiraClient et met en cache disque les GET peu changeants
+
+    Les autres appels sont délégués tels quels au client. Toute écriture
+    (post/put/delete) sur un endpoint mis en cache invalide son entrée.
+    """
+
+    def __init__(self, client, cache: ResponseCache = None, enabled: bool = True):
+        self._client = client
+        self.cache = cache or ResponseCache()
+        self._enabled = enabled
+
+    @property
+    def enabled(self) -> bool:
+        # Relu à chaque appel: le démon applique l'environnement de chaque commande transmise
+        return self._enabled and os.environ.get('JIRA_NO_CACHE', '') not in ('1', 'true')
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+    def _key(self, endpoint: str, params: Dict = None) -> str:
+        auth = getattr(self._client, 'auth', None)
+        user = getattr(auth, 'username', None) or (auth[0] if isinstance(auth, tuple) else '')
+        raw = json.dumps([self._client.base_url, user, endpoint, params or {}], sort_keys=True)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def get(self, endpoint: str, params: Dict = None, **kwargs):
+        ttl = get_ttl(endpoint)
+        if not self.enabled or ttl is None or kwargs:
+            return self._client.get(endpoint, params=params, **kwargs)
+
+        key = self._key(endpoint, params)
+        entry = self.cache.load(key)
+
+        if entry and time.time() - entry['stored_at'] < ttl:
+            return entry['body']
+
+        # Entrée expirée: revalidation conditionnelle
+        headers = {}
+        if entry and entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry and entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+
+        response = rate_limited_request('GET', build_url(self._client.base_url, endpoint),
+                                        auth=self._client.auth, params=params, headers=headers)
+
+        if response.status_code == 304 and entry:
+            entry['stored_at'] = time.time()
+            self.cache.store(key, entry)
+            return entry['body']
+
+        if response.status_code != 200:
+            # Laisser le client gérer et signaler l'erreur
+            return self._client.get(endpoint, params=params)
+
+        body = fast_json.loads(response.content)
+        self.cache.store(key, {
+            'endpoint': endpoint,
+            'stored_at': time.time(),
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'body': body
+        })
+        return body
+
+    def get_paginated(self, endpoint: str, params: Dict = None, **kwargs):
+        ttl = get_ttl(endpoint)
+        if not self.enabled or ttl is None:
+            return self._client.get_paginated(endpoint, params=params, **kwargs)
+
+        # Liste multi-pages: pas de revalidation possible, TTL uniquement
+        key = self._key(endpoint, {'__paginated__': True, **(params or {}), **kwargs})
+        entry = self.cache.load(key)
+        if entry and time.time() - entry['stored_at'] < ttl:
+            return entry['body']
+
+        body = self._client.get_paginated(endpoint, params=params, **kwargs)
+        if body is not None:
+            self.cache.store(key, {'endpoint': endpoint, 'stored_at': time.time(), 'body': body})
+        return body
+
+    def _invalidate(self, endpoint: str):
+        """Invalide l'endpoint modifié et ses parents (ex: filter/10/owner -> filter/10)"""
+        parts = endpoint.split('/')
+        for i in range(len(parts), 0, -1):
+            prefix = '/'.join(parts[:i])
+            if get_ttl(prefix) is not None:
+                self.cache.delete(self._key(prefix))
+
+    def post(self, endpoint: str, *args, **kwargs):
+        self._invalidate(endpoint)
+        return self._client.post(endpoint, *args, **kwargs)
+
+    def put(self, endpoint: str, *args, **kwargs):
+        self._invalidate(endpoint)
+        return self._client.put(endpoint, *args, **kwargs)
+
+    def delete(self, endpoint: str, *args, **kwargs):
+        self._invalidate(endpoint)
+        return self._client.delete(endpoint, *args, **kwargs)
@@ -0,0 +1,256 @@
+"""
+Écriture en flux des exports (CSV, JSON, Parquet, Arrow)
+Les lignes sont écrites au fil des pages de recherche et vidées sur disque
+par page: un export de plusieurs Go ne garde jamais plus d'une page en mémoire.
+Sortie compressée en gzip (bibliothèque standard) ou zstd (paquet `zstandard`
+si installé), choisie explicitement ou d'après l'extension du fichier.
+Les formats en colonnes (Parquet, Arrow IPC) nécessitent le paquet `pyarrow`.
+"""
+
+import gzip
+import io
+import sys
+from typing import IO, Dict, Iterable, List, Optional
+
+# Compressions disponibles
+COMPRESSIONS = ('gzip', 'zstd')
+
+# Extensions reconnues
+EXTENSIONS = {'.gz': 'gzip', '.gzip': 'gzip', '.zst': 'zstd', '.zstd': 'zstd'}
+
+# Lignes écrites entre deux vidages (taille d'une page de recherche)
+FLUSH_ROWS = 100
+
+# Formats d'export des lignes
+FORMATS = ('csv', 'parquet', 'arrow')
+
+# Lignes par groupe (Parquet) ou lot (Arrow): 100 pages de recherche.
+# Des groupes d'une seule page multiplieraient les métadonnées du fichier.
+ROW_GROUP_ROWS = 10000
+
+# Colonnes à faible cardinalité, encodées par dictionnaire
+DICTIONARY_COLUMNS = {'status', 'issuetype', 'type', 'priority', 'assignee', 'reporter',
+                      'resolution', 'project'}
+
+
+def field_value(value):
+    """Valeur d'un champ d'issue mise à plat pour un export en lignes"""
+    if isinstance(value, dict):
+        if 'name' in value:
+            return value['name']
+        if 'displayName' in value:
+            return value['displayName']
+        return str(value)
+    if isinstance(value, list):
+        return ', '.join(str(v) for v in value)
+    return value
+
+
+def detect_compression(filename: str) -> Optional[str]:
+    """Compression déduite de l'extension du fichier (None: aucune)"""
+    for extension, compression in EXTENSIONS.items():
+        if filename.lower().endswith(extension):
+            return compression
+    return None
+
+
+def open_output(filename: str, compression: Optional[str] = None, newline: Optional[str] = None) -> IO[str]:
+    """
+    Ouvre un fichier d'export en écriture texte (UTF-8)
+
+    Args:
+        filename: Fichier de sortie
+        compression: 'gzip', 'zstd' ou None (d'après l'extension)
+        newline: Comme pour open() ('' pour le module csv)
+
+    Raises:
+        ValueError: Compression inconnue ou indisponible
+    """
+    compression = compression or detect_compression(filename)
+
+    if compression is None:
+        return open(filename, 'w', encoding='utf-8', newline=newline)
+
+    if compression == 'gzip':
+        return gzip.open(filename, 'wt', encoding='utf-8', newline=newline)
+
+    if compression == 'zstd':
+        try:
+            import zstandard
+        except ImportError:
+            raise ValueError("Compression zstd indisponible: pip install zstandard")
+        raw = open(filename, 'wb')
+        try:
+            stream = zstandard.ZstdCompressor().stream_writer(raw)
+        except Exception:
+            raw.close()
+            raise
+        return io.TextIOWrapper(stream, encoding='utf-8', newline=newline)
+
+    raise ValueError(f"Compression inconnue: {compression} (disponibles: {', '.join(COMPRESSIONS)})")
+
+
+class ExportProgress:
+    """Compteur de lignes exportées, affiché sur stderr quand c'est un terminal"""
+
+    def __init__(self, label: str = 'issues', stream: IO[str] = None):
+        self.label = label
+        self.stream = stream or sys.stderr
+        self.count = 0
+        self.enabled = self.stream.isatty()
+
+    def update(self, count: int):
+        self.count = count
+        if self.enabled:
+            self.stream.write(f"\r  {count} {self.label} exportées...")
+            self.stream.flush()
+
+    def close(self):
+        if self.enabled and self.count:
+            self.stream.write('\r' + ' ' * (len(str(self.count)) + len(self.label) + 20) + '\r')
+            self.stream.flush()
+
+
+def write_csv(filename: str, fieldnames: List[str], rows: Iterable[Dict],
+              compression: Optional[str] = None, label: str = 'issues') -> int:
+    """
+    Écrit des lignes CSV au fil de l'eau
+
+    Args:
+        filename: Fichier de sortie
+        fieldnames: En-têtes des colonnes
+        rows: Lignes (dictionnaires), produites page par page
+        compression: 'gzip', 'zstd' ou None (d'après l'extension)
+        label: Nom des éléments pour le compteur de progression
+
+    Returns:
+        Nombre de lignes écrites
+    """
+    import csv
+
+    progress = ExportProgress(label)
+    count = 0
+
+    with open_output(filename, compression, newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+            if count % FLUSH_ROWS == 0:
+                f.flush()
+                progress.update(count)
+
+    progress.close()
+    return count
+
+
+class _Dictionary:
+    """Dictionnaire d'une colonne, partagé par tous les groupes du fichier"""
+
+    def __init__(self):
+        self.values = []
+        self.indices = {}
+
+    def encode(self, values: List) -> List[Optional[int]]:
+        encoded = []
+        for value in values:
+            if value is None:
+                encoded.append(None)
+                continue
+            index = self.indices.get(value)
+            if index is None:
+                index = self.indices[value] = len(self.values)
+                self.values.append(value)
+            encoded.append(index)
+        return encoded
+
+
+def write_columnar(filename: str, fieldnames: List[str], rows: Iterable[Dict],
+                   format: str = 'parquet', compression: Optional[str] = None,
+                   label: str = 'issues') -> int:
+    """
+    Écrit des lignes colonne par colonne (Parquet ou fichier Arrow IPC)
+
+    Les valeurs sont converties en texte; les colonnes à faible cardinalité
+    (statut, type, priorité, assigné...) sont encodées par dictionnaire. Un
+    groupe de lignes est écrit toutes les ROW_GROUP_ROWS lignes.
+
+    Args:
+        format: 'parquet' ou 'arrow'
+        compression: Codec ('gzip' ou 'zstd' pour Parquet, 'zstd' pour Arrow;
+            défaut: snappy pour Parquet, aucun pour Arrow)
+
+    Returns:
+        Nombre de lignes écrites
+
+    Raises:
+        ValueError: pyarrow absent, format ou compression non pris en charge
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise ValueError(f"Format {format} indisponible: pip install pyarrow")
+
+    if format not in ('parquet', 'arrow'):
+        raise ValueError(f"Format en colonnes inconnu: {format}")
+    if format == 'arrow' and compression not in (None, 'zstd'):
+        raise ValueError("Le format arrow ne prend en charge que la compression zstd")
+
+    dictionaries = {name: _Dictionary() for name in fieldnames if name.lower() in DICTIONARY_COLUMNS}
+    schema = pa.schema([
+        (name, pa.dictionary(pa.int32(), pa.string()) if name in dictionaries else pa.string())
+        for name in fieldnames
+    ])
+
+    def to_table(buffer: List[Dict]):
+        columns = []
+        for name in fieldnames:
+            values = [row.get(name) for row in buffer]
+            values = [None if v is None else v if isinstance(v, str) else str(v) for v in values]
+            if name in dictionaries:
+                dictionary = dictionaries[name]
+                indices = pa.array(dictionary.encode(values), type=pa.int32())
+                columns.append(pa.DictionaryArray.from_arrays(indices, pa.array(dictionary.values,
+                                                                                 type=pa.string())))
+            else:
+                columns.append(pa.array(values, type=pa.string()))
+        return pa.Table.from_arrays(columns, schema=schema)
+
+    if format == 'parquet':
+        import pyarrow.parquet as pq
+        writer = pq.ParquetWriter(filename, schema, compression=compression or 'snappy',
+                                  use_dictionary=list(dictionaries))
+    else:
+        # Les dictionnaires ne font que grandir: chaque lot n'écrit que les nouvelles valeurs
+        options = pa.ipc.IpcWriteOptions(compression=compression, emit_dictionary_deltas=True)
+        writer = pa.ipc.new_file(filename, schema, options=options)
+
+    progress = ExportProgress(label)
+    buffer = []
+    count = 0
+
+    with writer:
+        for row in rows:
+            buffer.append(row)
+            count += 1
+            if count % FLUSH_ROWS == 0:
+                progress.update(count)
+            if len(buffer) >= ROW_GROUP_ROWS:
+                writer.write_table(to_table(buffer))
+                buffer = []
+
+        if buffer or not count:
+            writer.write_table(to_table(buffer))
+
+    progress.close()
+    return count
+
+
+def write_rows(filename: str, fieldnames: List[str], rows: Iterable[Dict], format: str = 'csv',
+               compression: Optional[str] = None, label: str = 'issues') -> int:
+    """Écrit des lignes au format demandé (csv, parquet, arrow)"""
+    if format == 'csv':
+        return write_csv(filename, fieldnames, rows, compression, label)
+    return write_columnar(filename, fieldnames, rows, format, compression, label)
@@ -7,24 +7,30 @@ Permet d'auditer les permissions, les projets, les schémas
 import sys
 import os
 import argparse
-import json
 from datetime import datetime, timedelta
 from collections import defaultdict
-from typing import List, Dict
+from typing import TYPE_CHECKING, List, Dict
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-from lib.jira_client import JiraClient
+from lib.client_factory import create_client
+from lib import fast_json
+from lib.pagination import get_paginated_concurrent
+from lib.concurrency import map_concurrent
+
+if TYPE_CHECKING:
+    from lib.jira_client import JiraClient
 
 
 class AuditTool:
     """Outil d'audit Jira"""
 
-    def __init__(self, client: JiraClient):
+    def __init__(self, client: 'JiraClient', workers: int = None):
         self.client = client
+        self.workers = workers  # Requêtes en parallèle (défaut: JIRA_WORKERS)
 
     def audit_projects(self) -> Dict:
         """Audit de tous les projets"""
-        projects = self.client.get_paginated('project/search')
+        projects = get_paginated_concurrent(self.client, 'project/search')
 
         audit_data = {
             'total_projects': len(projects),
@@ -59,11 +65,17 @@ class AuditTool:
 
         role_details = {}
         if roles:
-            for role_name, role_url in roles.items():
-                # Extraire l'ID du rôle de l'URL
-                role_id = role_url.split('/')[-1]
-                role_info = self.client.get(f'project/{project_key}/role/{role_id}')
+            # Extraire l'ID du rôle de l'URL
+            role_ids = {name: url.split('/')[-1] for name, url in roles.items()}
+
+            # Récupérer les détails des rôles en parallèle
+            role_infos = map_concurrent(
+                lambda role_id: self.client.get(f'project/{project_key}/role/{role_id}'),
+                role_ids.values(),
+                workers=self.workers
+            )
 
+            for role_name, role_info in zip(role_ids, role_infos):
                 if role_info:
                     actors = []
                     for actor in role_info.get('actors', []):
@@ -92,11 +104,16 @@ class AuditTool:
         # Récupère tous les schémas de permissions
         permission_schemes = self.client.get_paginated('permissionscheme')
 
+        # Détails des schémas, récupérés en parallèle
+        all_details = map_concurrent(
+            lambda scheme: self.client.get(f"permissionscheme/{scheme.get('id')}"),
+            permission_schemes,
+            workers=self.workers
+        )
+
         schemes_data = []
-        for scheme in permission_schemes:
+        for scheme, details in zip(permission_schemes, all_details):
             scheme_id = scheme.get('id')
-            # Détails du schéma
-            details = self.client.get(f'permissionscheme/{scheme_id}')
 
             if details:
                 schemes_data.append({
@@ -141,12 +158,16 @@ class AuditTool:
             'groups': []
         }
 
-        for group in groups:
-            group_name = group.get('name')
+        # Récupérer les membres des groupes en parallèle
+        all_members = map_concurrent(
+            lambda group: get_paginated_concurrent(self.client, 'group/member',
+                                                   params={'groupname': group.get('name')}),
+            groups,
+            workers=self.workers
+        )
 
-            # Récupérer les membres du groupe
-            members = self.client.get_paginated('group/member',
-                                               params={'groupname': group_name})
+        for group, members in zip(groups, all_members):
+            group_name = group.get('name')
 
             group_data['groups'].append({
                 'name': group_name,
@@ -197,9 +218,13 @@ class AuditTool:
             return []
 
 
-def main():
+def main(argv: List[str] = None):
     parser = argparse.ArgumentParser(description='Audit et monitoring Jira Cloud')
     parser.add_argument('--config', help='Fichier de configuration')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Ignorer le cache disque des réponses')
+    parser.add_argument('--workers', type=int,
+                       help='Nombre de requêtes en parallèle (défaut: JIRA_WORKERS ou 8)')
 
     subparsers = parser.add_subparsers(dest='command', help='Commandes disponibles')
 
@@ -233,22 +258,22 @@ def main():
     logs_parser.add_argument('--from', dest='from_date', help='Date de début (ISO format)')
     logs_parser.add_argument('--to', dest='to_date', help='Date de fin (ISO format)')
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if not args.command:
         parser.print_help()
         return
 
     try:
-        client = JiraClient(args.config)
-        audit = AuditTool(client)
+        client = create_client(args.config, use_cache=not args.no_cache)
+        audit = AuditTool(client, workers=args.workers)
 
         if args.command == 'projects':
             data = audit.audit_projects()
 
             if args.output:
                 with open(args.output, 'w') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
+                    fast_json.dump(data, f)
                 print(f"✓ Audit exporté vers {args.output}")
             else:
                 print("\n=== AUDIT DES PROJETS ===")
@@ -265,7 +290,7 @@ def main():
 
             if args.output:
                 with open(args.output, 'w') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
+                    fast_json.dump(data, f)
                 print(f"✓ Audit exporté vers {args.output}")
             else:
                 print(f"\n=== RÔLES DU PROJET {args.project_key} ===")
@@ -281,7 +306,7 @@ def main():
 
             if args.output:
                 with open(args.output, 'w') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
+                    fast_json.dump(data, f)
                 print(f"✓ Audit exporté vers {args.output}")
             else:
                 print(f"\n=== SCHÉMAS DE PERMISSIONS ===")
@@ -296,7 +321,7 @@ def main():
 
             if args.output:
                 with open(args.output, 'w') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
+                    fast_json.dump(data, f)
                 print(f"✓ Audit exporté vers {args.output}")
             else:
                 print(f"\n=== WORKFLOWS ===")
@@ -311,7 +336,7 @@ def main():
 
             if args.output:
                 with open(args.output, 'w') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
+                    fast_json.dump(data, f)
                 print(f"✓ Audit exporté vers {args.output}")
             else:
                 print(f"\n=== GROUPES ===")
@@ -328,28 +353,28 @@ def main():
             # Audit projects
             print("  • Audit des projets...")
             with open(f"{output_dir}/projects.json", 'w') as f:
-                json.dump(audit.audit_projects(), f, indent=2, ensure_ascii=False)
+                fast_json.dump(audit.audit_projects(), f)
 
             # Audit permissions
             print("  • Audit des permissions...")
             with open(f"{output_dir}/permissions.json", 'w') as f:
-                json.dump(audit.audit_permissions(), f, indent=2, ensure_ascii=False)
+                fast_json.dump(audit.audit_permissions(), f)
 
             # Audit workflows
             print("  • Audit des workflows...")
             with open(f"{output_dir}/workflows.json", 'w') as f:
-                json.dump(audit.audit_workflows(), f, indent=2, ensure_ascii=False)
+                fast_json.dump(audit.audit_workflows(), f)
 
             # Audit groups
             print("  • Audit des groupes...")
             with open(f"{output_dir}/groups.json", 'w') as f:
-                json.dump(audit.audit_groups(), f, indent=2, ensure_ascii=False)
+                fast_json.dump(audit.audit_groups(), f)
 
             print(f"\n✓ Audit complet exporté vers {output_dir}/")
 
         elif args.command == 'logs':
             logs = audit.get_audit_log(args.from_date, args.to_date)
-            print(json.dumps(logs, indent=2, ensure_ascii=False))
+            print(fast_json.dumps(logs, indent=True))
 
     except Exception as e:
         print(f"Erreur: {e}", file=sys.stderr)
@@ -8,18 +8,22 @@ Gérer les colonnes, swimlanes, filtres
 import sys
 import os
 import argparse
-import json
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import TYPE_CHECKING, List, Dict, Optional
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-from lib.jira_client import JiraClient
+from lib.client_factory import create_client
+from lib import fast_json
+from lib.pagination import get_paginated_concurrent
+
+if TYPE_CHECKING:
+    from lib.jira_client import JiraClient
 
 
 class BoardManager:
     """Gestionnaire de boards Jira"""
 
-    def __init__(self, client: JiraClient):
+    def __init__(self, client: 'JiraClient'):
         self.client = client
 
     def list_boards(self, project_key: str = None, board_type: str = None,
@@ -106,7 +110,7 @@ class BoardManager:
         if jql:
             params['jql'] = jql
 
-        return self.client.get_paginated(f'board/{board_id}/issue', params=params)
+        return get_paginated_concurrent(self.client, f'board/{board_id}/issue', params=params)
 
     def get_board_backlog(self, board_id: int) -> List[Dict]:
         """Récupère le backlog d'un board"""
@@ -219,7 +223,7 @@ class BoardManager:
         }
 
         with open(filename, 'w') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+            fast_json.dump(export_data, f)
 
         print(f"✓ Configuration du board exportée vers {filename}")
 
@@ -263,9 +267,11 @@ class BoardManager:
         }
 
 
-def main():
+def main(argv: List[str] = None):
     parser = argparse.ArgumentParser(description='Gestion des boards Jira Cloud')
     parser.add_argument('--config', help='Fichier de configuration')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Ignorer le cache disque des réponses')
 
     subparsers = parser.add_subparsers(dest='command', help='Commandes disponibles')
 
@@ -341,14 +347,14 @@ def main():
     analyze_parser = subparsers.add_parser('analyze', help='Analyser la performance')
     analyze_parser.add_argument('board_id', type=int, help='ID du board')
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if not args.command:
         parser.print_help()
         return
 
     try:
-        client = JiraClient(args.config)
+        client = create_client(args.config, use_cache=not args.no_cache)
         manager = BoardManager(client)
 
         if args.command == 'list':
@@ -362,7 +368,7 @@ def main():
         elif args.command == 'get':
             board = manager.get_board(args.board_id)
             if board:
-                print(json.dumps(board, indent=2, ensure_ascii=False))
+                print(fast_json.dumps(board, indent=True))
             else:
                 print(f"Board {args.board_id} non trouvé", file=sys.stderr)
                 sys.exit(1)
@@ -391,7 +397,7 @@ def main():
         elif args.command == 'config':
             config = manager.get_board_configuration(args.board_id)
             if config:
-                print(json.dumps(config, indent=2, ensure_ascii=False))
+                print(fast_json.dumps(config, indent=True))
             else:
                 print(f"Configuration non trouvée", file=sys.stderr)
                 sys.exit(1)
@@ -458,7 +464,7 @@ def main():
 
             if args.output:
                 with open(args.output, 'w') as f:
-                    json.dump(summary, f, indent=2, ensure_ascii=False)
+                    fast_json.dump(summary, f)
                 print(f"✓ Résumé exporté vers {args.output}")
             else:
                 print(f"\n=== RÉSUMÉ BOARD: {summary['board']['name']} ===")
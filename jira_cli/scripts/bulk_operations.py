@@ -9,79 +9,431 @@ import sys
 import os
 import argparse
 import json
-import csv
+import threading
 from datetime import datetime
-from typing import List, Dict, Optional
-import time
+from itertools import islice
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, List, Dict, Optional, Tuple
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-from lib.jira_client import JiraClient
+from lib.client_factory import create_client
+from lib import fast_json
+from lib.pagination import (PaginationError, get_paginated_concurrent, iter_paginated,
+                            iter_search_while_mutating)
+from lib.http_session import build_url, rate_limited_request
+from lib.rate_limiter import get_rate_limiter
+from lib.concurrency import map_concurrent
+from lib.adaptive_batch import BatchController
+from lib.create_index import CreateIndex, RowHasher, hash_label, with_hash_label
+from lib.pipeline import prefetch
+from lib.streaming_export import COMPRESSIONS, FORMATS, field_value, write_rows
+from lib import bulk_tasks
+from lib.job_journal import JobJournal
+
+if TYPE_CHECKING:
+    from lib.jira_client import JiraClient
+
+# Nombre maximum d'issues par requête issue/bulk
+BULK_CREATE_LIMIT = 50
+
+# Lignes CSV lues ou validées d'avance sur l'étage suivant
+CSV_QUEUE_SIZE = 500
 
 
 class BulkOperations:
     """Gestionnaire d'opérations en masse"""
 
-    def __init__(self, client: JiraClient):
+    def __init__(self, client: 'JiraClient', workers: int = None, server_side: bool = False,
+                 journal: JobJournal = None, idempotent: bool = False):
         self.client = client
-        self.batch_size = 50  # Taille des lots pour éviter les timeouts
-        self.delay_between_batches = 1  # Secondes entre les lots
+        # Taille des lots et requêtes en parallèle initiales, ajustées ensuite
+        # selon la latence et les erreurs de Jira (lib.adaptive_batch)
+        self.batch_size = 50
+        self.workers = workers  # Défaut: JIRA_WORKERS
+        # Débit adaptatif partagé: remplace la pause fixe entre les lots
+        self.rate_limiter = get_rate_limiter()
+        # ID de transition par (contexte de workflow, nom de transition)
+        self._transition_ids = {}
+        self._transition_lock = threading.Lock()
+        # Transitions, mises à jour et assignations confiées aux tâches bulk de Jira
+        self.server_side = server_side
+        # Journal de reprise: chaque élément terminé y est enregistré
+        self.journal = journal
+        # Création idempotente: empreinte de chaque ligne en label (lib.create_index)
+        self.idempotent = idempotent
+        # Métadonnées de validation des imports CSV (priorités, utilisateurs)
+        self._priorities = None
+        self._account_ids = {}
+        self._metadata_lock = threading.Lock()
+
+    def _pending(self, items: Iterable, results: Dict, done_key: str) -> Iterator:
+        """
+        Écarte au fil de l'eau les éléments déjà réussis d'après le journal (reprise d'un job)
+
+        Les éléments écartés sont comptés comme traités dans results[done_key]
+        et dans results['skipped'].
+        """
+        for item in items:
+            issue_key = item.get('issue_key') if isinstance(item, dict) else item
+            if self.journal and self.journal.is_done(issue_key):
+                results[done_key].append(issue_key)
+                results['skipped'] = results.get('skipped', 0) + 1
+            else:
+                yield item
+
+    @staticmethod
+    def _new_results(done_key: str, items: Iterable, dry_run: bool) -> Dict:
+        """Résultats d'une opération (total inconnu tant qu'un flux n'est pas épuisé)"""
+        return {
+            done_key: [],
+            'failed': [],
+            'total': len(items) if isinstance(items, list) else None,
+            'dry_run': dry_run
+        }
+
+    @staticmethod
+    def _finish(results: Dict, done_key: str) -> Dict:
+        if results['total'] is None:
+            results['total'] = len(results[done_key]) + len(results['failed'])
+        return results
+
+    def _record(self, item_id: str, error: Optional[str], result: Dict = None):
+        """Enregistre le résultat d'un élément dans le journal"""
+        if self.journal:
+            self.journal.record(item_id, error, result)
+
+    def _run_batches(self, items: Iterable, process: Callable, results: Dict, done_key: str):
+        """
+        Applique `process` aux éléments lot par lot, en parallèle au sein d'un lot
+
+        Le limiteur de débit partagé borne le débit global; la taille des lots
+        et le nombre de workers s'adaptent à la santé de Jira (trajectoire dans
+        results['batch_trajectory']). L'affichage et les
+        résultats restent dans l'ordre des éléments. Les éléments peuvent
+        arriver d'un flux (pages de recherche): chaque lot est lu au moment
+        de son traitement, et le flux ne précharge que quelques pages.
+
+        Args:
+            items: Clés d'issues, ou dictionnaires contenant 'issue_key' (liste ou flux)
+            process: Fonction retournant (erreur ou None, ligne à afficher ou None)
+            results: Dictionnaire de résultats à compléter
+            done_key: Liste de results recevant les clés traitées avec succès
+        """
+        def key_of(item) -> str:
+            return item.get('issue_key') if isinstance(item, dict) else item
+
+        def process_and_record(item) -> Tuple[Optional[str], Optional[str]]:
+            error, message = process(item)
+            self._record(key_of(item), error)
+            return error, message
+
+        controller = BatchController(self.batch_size, self.workers)
+        results['batch_trajectory'] = controller.trajectory
+
+        items = iter(items)
+        number = 0
+        while True:
+            batch = list(islice(items, controller.batch_size))
+            if not batch:
+                break
+            number += 1
+            print(f"Traitement du lot {number} ({len(batch)} issues, {controller.workers} workers)...")
+
+            controller.start_batch()
+            outcomes = map_concurrent(process_and_record, batch, workers=controller.workers)
+            controller.end_batch(len(batch), sum(1 for error, _ in outcomes if error))
+            if self.journal:
+                self.journal.sync()
+
+            for item, (error, message) in zip(batch, outcomes):
+                issue_key = key_of(item)
+                if error:
+                    results['failed'].append({
+                        'issue_key': issue_key,
+                        'error': error
+                    })
+                else:
+                    results[done_key].append(issue_key)
 
-    def bulk_create_issues(self, issues_data: List[Dict], dry_run: bool = False) -> Dict:
+                if message:
+                    print(message)
+
+    def bulk_create_issues(self, issues_data: Iterable[Dict], dry_run: bool = False) -> Dict:
         """
         Crée plusieurs issues en masse
 
+        Les données peuvent arriver en flux (import CSV): les lots sont formés
+        au fil de la lecture. Un élément portant une clé 'error' (ligne rejetée
+        à la validation) est compté en échec sans être envoyé.
+
+        En mode idempotent, les lignes déjà créées lors d'une exécution
+        précédente sont retrouvées (index local, puis une JQL par lot) et
+        reportées dans results['existing'] au lieu d'être recréées.
+
         Args:
-            issues_data: Liste de données d'issues
+            issues_data: Données d'issues (liste ou flux)
             dry_run: Mode simulation (ne crée rien)
 
         Returns:
             Résultat avec succès et échecs
         """
-        results = {
-            'created': [],
-            'failed': [],
-            'total': len(issues_data),
-            'dry_run': dry_run
-        }
+        results = self._new_results('created', issues_data, dry_run)
+        results['existing'] = []
 
         if dry_run:
-            print(f"MODE SIMULATION: {len(issues_data)} issues seraient créées")
-            for i, issue_data in enumerate(issues_data, 1):
-                print(f"  {i}. {issue_data.get('fields', {}).get('summary', 'N/A')}")
+            count = rejected = 0
+            for count, issue_data in enumerate(issues_data, 1):
+                summary = issue_data.get('fields', {}).get('summary', 'N/A')
+                if issue_data.get('error'):
+                    rejected += 1
+                    print(f"  {count}. ✗ {summary} ({issue_data['error']})")
+                else:
+                    print(f"  {count}. {summary}")
+            print(f"MODE SIMULATION: {count - rejected} issues seraient créées"
+                  + (f" ({rejected} lignes rejetées)" if rejected else ""))
+            results['total'] = count
             return results
 
-        # Traiter par lots
-        for i in range(0, len(issues_data), self.batch_size):
-            batch = issues_data[i:i + self.batch_size]
-            print(f"Traitement du lot {i//self.batch_size + 1}/{(len(issues_data)-1)//self.batch_size + 1}...")
-
-            for issue_data in batch:
-                try:
-                    result = self.client.post('issue', data=issue_data)
-                    if result:
-                        results['created'].append({
-                            'key': result.get('key'),
-                            'summary': issue_data.get('fields', {}).get('summary')
-                        })
-                        print(f"  ✓ {result.get('key')}")
-                    else:
-                        results['failed'].append({
-                            'data': issue_data,
-                            'error': 'API returned None'
-                        })
-                        print(f"  ✗ Échec: {issue_data.get('fields', {}).get('summary')}")
-                except Exception as e:
-                    results['failed'].append({
-                        'data': issue_data,
-                        'error': str(e)
-                    })
-                    print(f"  ✗ Erreur: {str(e)}")
+        hasher = RowHasher() if self.idempotent else None
+        created_index = CreateIndex.for_site(self.client.base_url) if self.idempotent else None
+        existing_rows = set()
+
+        def pending_rows() -> Iterator[Tuple[int, Dict, Optional[str]]]:
+            """(position, données, empreinte) des lignes à créer"""
+            for row, issue_data in enumerate(issues_data):
+                # L'empreinte tient compte de toutes les lignes, même écartées
+                row_hash = hasher.hash(issue_data) if hasher else None
+
+                # Reprise: les lignes sont identifiées par leur position dans le job
+                if self.journal and self.journal.is_done(row):
+                    results['created'].append(self.journal.done[str(row)])
+                    results['skipped'] = results.get('skipped', 0) + 1
+                    continue
+
+                if issue_data.get('error'):
+                    summary = issue_data.get('fields', {}).get('summary')
+                    results['failed'].append({'data': issue_data, 'error': issue_data['error']})
+                    self._record(row, issue_data['error'])
+                    line = issue_data.get('line', row + 1)
+                    print(f"  ✗ Ligne {line} rejetée: {summary} ({issue_data['error']})")
+                    continue
+
+                yield row, issue_data, row_hash
+
+        def create_idempotent(batch: List[Tuple[int, Dict, str]]) -> List[Tuple[Optional[str], Optional[str]]]:
+            """Ne crée que les lignes du lot absentes de Jira"""
+            try:
+                found = self._find_created([row_hash for _, _, row_hash in batch], created_index)
+            except Exception as e:
+                return [(None, f"Vérification des doublons impossible: {e}")] * len(batch)
+
+            to_create = [item for item in batch if item[2] not in found]
+            created = self._create_batch([with_hash_label(data, row_hash)
+                                          for _, data, row_hash in to_create]) if to_create else []
+            created_index.add({row_hash: key for (_, _, row_hash), (key, _) in zip(to_create, created) if key})
+
+            outcomes = dict(zip((row for row, _, _ in to_create), created))
+            for row, _, row_hash in batch:
+                if row_hash in found:
+                    existing_rows.add(row)
+                    outcomes[row] = (found[row_hash], None)
+            return [outcomes[row] for row, _, _ in batch]
+
+        def create_and_record(batch: List[Tuple[int, Dict, Optional[str]]]) -> List[Tuple[Optional[str], Optional[str]]]:
+            if self.idempotent:
+                batch_outcomes = create_idempotent(batch)
+            else:
+                batch_outcomes = self._create_batch([data for _, data, _ in batch])
+            for (row, data, _), (key, error) in zip(batch, batch_outcomes):
+                self._record(row, error, {'key': key, 'summary': data.get('fields', {}).get('summary')}
+                             if key else None)
+            if self.journal:
+                self.journal.sync()
+            return batch_outcomes
+
+        # Un lot = une requête issue/bulk (50 issues max), autant de lots en parallèle
+        # que de workers; seul le nombre de workers peut dépasser la valeur initiale
+        controller = BatchController(min(self.batch_size, BULK_CREATE_LIMIT), self.workers,
+                                     max_batch_size=BULK_CREATE_LIMIT)
+        results['batch_trajectory'] = controller.trajectory
+        rows = pending_rows()
+        number = 0
+
+        while True:
+            batches = [batch for batch in (list(islice(rows, controller.batch_size))
+                                           for _ in range(controller.workers)) if batch]
+            if not batches:
+                break
+
+            controller.start_batch()
+            outcomes = map_concurrent(create_and_record, batches, workers=len(batches))
+            controller.end_batch(sum(len(batch) for batch in batches),
+                                 sum(1 for batch_outcomes in outcomes for key, _ in batch_outcomes if not key))
+
+            for batch, batch_outcomes in zip(batches, outcomes):
+                number += 1
+                print(f"Traitement du lot {number}...")
+                self._report_created(batch, batch_outcomes, results, existing_rows)
+
+        if results['total'] is None:
+            results['total'] = len(results['created']) + len(results['existing']) + len(results['failed'])
+        return results
 
-            # Pause entre les lots
-            if i + self.batch_size < len(issues_data):
-                time.sleep(self.delay_between_batches)
+    def _find_created(self, hashes: List[str], index: CreateIndex) -> Dict[str, str]:
+        """
+        Issues déjà créées pour ces empreintes, confirmées par Jira
 
-        return results
+        Une seule JQL `labels in (...)` fait foi. L'index local ne sert que
+        d'indice: une clé indexée absente du résultat (issue supprimée, ou pas
+        encore indexée par la recherche) est vérifiée directement, et retirée
+        de l'index si l'issue n'existe plus ou a perdu son label.
+
+        Raises:
+            RuntimeError: Recherche impossible (les lignes ne doivent pas être créées)
+        """
+        labels = {hash_label(row_hash): row_hash for row_hash in hashes}
+        self.rate_limiter.acquire()
+        page = self.client.get('search', params={
+            'jql': f"labels in ({', '.join(labels)})",
+            'fields': 'labels',
+            'startAt': 0,
+            'maxResults': len(labels)
+        })
+        if page is None:
+            raise RuntimeError('recherche JQL en échec')
+
+        found = {}
+        for issue in page.get('issues', []):
+            for label in (issue.get('fields') or {}).get('labels') or []:
+                if label in labels:
+                    found[labels[label]] = issue['key']
+
+        stale = []
+        for row_hash in hashes:
+            key = index.get(row_hash)
+            if not key or row_hash in found:
+                continue
+            if self._has_label(key, hash_label(row_hash)):
+                found[row_hash] = key
+            else:
+                stale.append(row_hash)
+
+        index.remove(stale)
+        index.add({row_hash: key for row_hash, key in found.items() if index.get(row_hash) != key})
+        return found
+
+    def _has_label(self, issue_key: str, label: str) -> bool:
+        """
+        Vérifie qu'une issue existe encore et porte le label
+
+        Raises:
+            RuntimeError: Réponse inattendue de Jira
+        """
+        response = rate_limited_request('GET', build_url(self.client.base_url, f'issue/{issue_key}'),
+                                        auth=self.client.auth, params={'fields': 'labels'})
+        if response.status_code == 404:
+            return False
+        if response.status_code != 200:
+            raise RuntimeError(f'vérification de {issue_key} en échec (HTTP {response.status_code})')
+        fields = (fast_json.loads(response.content) or {}).get('fields') or {}
+        return label in (fields.get('labels') or [])
+
+    def _report_created(self, batch: List[Tuple[int, Dict, Optional[str]]],
+                        batch_outcomes: List[Tuple[Optional[str], Optional[str]]], results: Dict,
+                        existing_rows: set = frozenset()):
+        """Ajoute les issues d'un lot de création aux résultats et les affiche"""
+        for (row, issue_data, _), (key, error) in zip(batch, batch_outcomes):
+            summary = issue_data.get('fields', {}).get('summary')
+            if key and row in existing_rows:
+                existing_rows.discard(row)
+                results['existing'].append({
+                    'key': key,
+                    'summary': summary
+                })
+                print(f"  = {key} (déjà créée)")
+            elif key:
+                results['created'].append({
+                    'key': key,
+                    'summary': summary
+                })
+                print(f"  ✓ {key}")
+            else:
+                results['failed'].append({
+                    'data': issue_data,
+                    'error': error
+                })
+                print(f"  ✗ Échec: {summary} ({error})")
+
+    def _send(self, method: str, endpoint: str, data: Dict = None) -> Tuple[Optional[Dict], Optional[str]]:
+        """
+        Écriture issue par issue via la session partagée
+
+        Les 429/503 sont rejoués après Retry-After et chaque réponse alimente
+        le limiteur de débit (AIMD) et la taille des lots (lib.adaptive_batch).
+
+        Returns:
+            (corps de la réponse, erreur ou None)
+        """
+        kwargs = {'auth': self.client.auth}
+        if data is not None:
+            kwargs['data'] = fast_json.dumps(data).encode('utf-8')
+            kwargs['headers'] = {'Content-Type': 'application/json'}
+
+        response = rate_limited_request(method, build_url(self.client.base_url, endpoint), **kwargs)
+        try:
+            body = fast_json.loads(response.content) if response.content else {}
+        except ValueError:
+            body = {}
+
+        if response.status_code < 400:
+            return body, None
+
+        messages = []
+        if isinstance(body, dict):
+            messages = list(body.get('errorMessages', []))
+            messages += [f"{field}: {message}" for field, message in (body.get('errors') or {}).items()]
+        return None, '; '.join(messages) or f'HTTP {response.status_code}'
+
+    def _create_batch(self, batch: List[Dict]) -> List[Tuple[Optional[str], Optional[str]]]:
+        """
+        Crée un lot d'issues en une seule requête issue/bulk
+
+        Jira crée les éléments valides et signale les autres par leur position
+        (failedElementNumber); les issues créées sont renvoyées dans l'ordre du lot.
+
+        Returns:
+            Pour chaque élément du lot: (clé créée ou None, erreur ou None)
+        """
+        try:
+            response = rate_limited_request(
+                'POST',
+                build_url(self.client.base_url, 'issue/bulk'),
+                auth=self.client.auth,
+                data=fast_json.dumps({'issueUpdates': batch}).encode('utf-8'),
+                headers={'Content-Type': 'application/json'}
+            )
+            body = fast_json.loads(response.content) if response.content else {}
+        except Exception as e:
+            return [(None, str(e))] * len(batch)
+
+        if not isinstance(body, dict) or (response.status_code not in (200, 201) and not body.get('errors')):
+            return [(None, f'HTTP {response.status_code}')] * len(batch)
+
+        failed = {}
+        for error in body.get('errors', []):
+            element_errors = error.get('elementErrors', {})
+            messages = list(element_errors.get('errorMessages', []))
+            messages += [f"{field}: {message}" for field, message in element_errors.get('errors', {}).items()]
+            failed[error.get('failedElementNumber')] = '; '.join(messages) or f"HTTP {error.get('status')}"
+
+        created = iter(body.get('issues', []))
+        outcomes = []
+        for index in range(len(batch)):
+            if index in failed:
+                outcomes.append((None, failed[index]))
+            else:
+                issue = next(created, None)
+                outcomes.append((issue.get('key'), None) if issue else (None, 'Absente de la réponse issue/bulk'))
+        return outcomes
 
     def bulk_update_issues(self, updates: List[Dict], dry_run: bool = False) -> Dict:
         """
@@ -104,180 +456,323 @@ class BulkOperations:
                 print(f"  • {update['issue_key']}: {list(update.get('fields', {}).keys())}")
             return results
 
-        for i in range(0, len(updates), self.batch_size):
-            batch = updates[i:i + self.batch_size]
-            print(f"Traitement du lot {i//self.batch_size + 1}...")
-
-            for update in batch:
-                try:
-                    issue_key = update['issue_key']
-                    fields = update.get('fields', {})
-
-                    update_data = {'fields': fields}
-                    result = self.client.put(f'issue/{issue_key}', data=update_data)
-
-                    if result is not None:
-                        results['updated'].append(issue_key)
-                        print(f"  ✓ {issue_key}")
-                    else:
-                        results['failed'].append({
-                            'issue_key': issue_key,
-                            'error': 'Update failed'
-                        })
-                        print(f"  ✗ {issue_key}")
-
-                except Exception as e:
-                    results['failed'].append({
-                        'issue_key': update.get('issue_key'),
-                        'error': str(e)
-                    })
-                    print(f"  ✗ Erreur: {str(e)}")
-
-            if i + self.batch_size < len(updates):
-                time.sleep(self.delay_between_batches)
+        updates = self._pending(updates, results, 'updated')
+        if self.server_side:
+            updates = self._update_with_tasks(updates, results)
 
+        self._run_batches(updates, self._update_issue, results, 'updated')
         return results
 
-    def bulk_delete_issues(self, issue_keys: List[str], dry_run: bool = False,
+    def _update_with_tasks(self, updates: List[Dict], results: Dict) -> List[Dict]:
+        """
+        Confie aux tâches bulk/issues/fields les mises à jour qu'elles savent appliquer
+
+        Les issues recevant les mêmes valeurs partagent une tâche.
+
+        Returns:
+            Mises à jour à appliquer issue par issue (champs non pris en charge)
+        """
+        groups, remaining = {}, []
+        for update in updates:
+            edit = bulk_tasks.bulk_edit_input(update.get('fields', {}))
+            if edit is None:
+                remaining.append(update)
+            else:
+                signature = json.dumps(edit, sort_keys=True)
+                groups.setdefault(signature, (edit, []))[1].append(update['issue_key'])
+
+        if remaining:
+            print(f"{len(remaining)} mises à jour hors des champs des tâches bulk: traitement issue par issue")
+
+        jobs = []
+        for (actions, edited), keys in groups.values():
+            jobs += [(chunk, lambda chunk=chunk, actions=actions, edited=edited:
+                      bulk_tasks.submit_edit_task(self.client, chunk, actions, edited))
+                     for chunk in self._task_chunks(keys)]
+        self._run_tasks(jobs, results, 'updated')
+        return remaining
+
+    def _update_issue(self, update: Dict) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Met à jour les champs d'une issue
+
+        Returns:
+            (erreur ou None, ligne à afficher ou None)
+        """
+        try:
+            issue_key = update['issue_key']
+            update_data = {'fields': update.get('fields', {})}
+            _, error = self._send('PUT', f'issue/{issue_key}', update_data)
+
+            if error is None:
+                return None, f"  ✓ {issue_key}"
+            return error, f"  ✗ {issue_key} ({error})"
+
+        except Exception as e:
+            return str(e), f"  ✗ Erreur: {str(e)}"
+
+    def bulk_delete_issues(self, issue_keys: Iterable[str], dry_run: bool = False,
                           delete_subtasks: bool = False) -> Dict:
-        """Supprime plusieurs issues en masse"""
-        results = {
-            'deleted': [],
-            'failed': [],
-            'total': len(issue_keys),
-            'dry_run': dry_run
-        }
+        """Supprime plusieurs issues en masse (clés en liste ou en flux)"""
+        results = self._new_results('deleted', issue_keys, dry_run)
 
         if dry_run:
+            issue_keys = list(issue_keys)
+            results['total'] = len(issue_keys)
             print(f"MODE SIMULATION: {len(issue_keys)} issues seraient supprimées")
             for key in issue_keys:
                 print(f"  • {key}")
             return results
 
-        for i in range(0, len(issue_keys), self.batch_size):
-            batch = issue_keys[i:i + self.batch_size]
-            print(f"Traitement du lot {i//self.batch_size + 1}...")
-
-            for issue_key in batch:
-                try:
-                    import requests
-                    url = f"{self.client.base_url}/rest/api/3/issue/{issue_key}"
-                    params = {'deleteSubtasks': 'true' if delete_subtasks else 'false'}
-
-                    response = requests.delete(url, auth=self.client.auth, params=params)
-
-                    if response.status_code in [204, 200]:
-                        results['deleted'].append(issue_key)
-                        print(f"  ✓ {issue_key}")
-                    else:
-                        results['failed'].append({
-                            'issue_key': issue_key,
-                            'error': f'HTTP {response.status_code}'
-                        })
-                        print(f"  ✗ {issue_key} (HTTP {response.status_code})")
-
-                except Exception as e:
-                    results['failed'].append({
-                        'issue_key': issue_key,
-                        'error': str(e)
-                    })
-                    print(f"  ✗ Erreur: {str(e)}")
+        issue_keys = self._pending(issue_keys, results, 'deleted')
+        self._run_batches(issue_keys, lambda issue_key: self._delete_issue(issue_key, delete_subtasks),
+                          results, 'deleted')
+        return self._finish(results, 'deleted')
 
-            if i + self.batch_size < len(issue_keys):
-                time.sleep(self.delay_between_batches)
+    def _delete_issue(self, issue_key: str, delete_subtasks: bool = False) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Supprime une issue
 
-        return results
+        Returns:
+            (erreur ou None, ligne à afficher ou None)
+        """
+        try:
+            url = f"{self.client.base_url}/rest/api/3/issue/{issue_key}"
+            params = {'deleteSubtasks': 'true' if delete_subtasks else 'false'}
 
-    def bulk_transition_issues(self, issue_keys: List[str], transition_name: str,
-                              comment: str = None, dry_run: bool = False) -> Dict:
-        """Effectue une transition sur plusieurs issues"""
-        results = {
-            'transitioned': [],
-            'failed': [],
-            'total': len(issue_keys),
-            'dry_run': dry_run
-        }
+            response = rate_limited_request('DELETE', url, auth=self.client.auth, params=params)
+
+            if response.status_code in [204, 200]:
+                return None, f"  ✓ {issue_key}"
+            return f'HTTP {response.status_code}', f"  ✗ {issue_key} (HTTP {response.status_code})"
+
+        except Exception as e:
+            return str(e), f"  ✗ Erreur: {str(e)}"
+
+    def bulk_transition_issues(self, issue_keys: Iterable[str], transition_name: str,
+                              comment: str = None, dry_run: bool = False,
+                              contexts: Dict[str, Tuple] = None) -> Dict:
+        """
+        Effectue une transition sur plusieurs issues
+
+        L'ID de la transition est résolu une fois par contexte de workflow puis
+        réutilisé; une issue ne consulte ses transitions que si l'ID est refusé.
+
+        Args:
+            issue_keys: Clés des issues (liste ou flux)
+            contexts: Contexte de workflow par clé, (projet, type d'issue, statut);
+                      une issue sans contexte résout sa transition elle-même.
+                      Avec un flux, le dictionnaire peut être complété au fil
+                      de la lecture
+        """
+        results = self._new_results('transitioned', issue_keys, dry_run)
 
         if dry_run:
+            issue_keys = list(issue_keys)
+            results['total'] = len(issue_keys)
             print(f"MODE SIMULATION: {len(issue_keys)} issues → {transition_name}")
             for key in issue_keys:
                 print(f"  • {key}")
             return results
 
-        for i in range(0, len(issue_keys), self.batch_size):
-            batch = issue_keys[i:i + self.batch_size]
-            print(f"Traitement du lot {i//self.batch_size + 1}...")
-
-            for issue_key in batch:
-                try:
-                    # Récupérer les transitions disponibles
-                    transitions = self.client.get(f'issue/{issue_key}/transitions')
-
-                    if not transitions:
-                        results['failed'].append({
-                            'issue_key': issue_key,
-                            'error': 'Cannot get transitions'
-                        })
-                        continue
-
-                    # Trouver l'ID de la transition
-                    transition_id = None
-                    for t in transitions.get('transitions', []):
-                        if t['name'].lower() == transition_name.lower():
-                            transition_id = t['id']
-                            break
-
-                    if not transition_id:
-                        results['failed'].append({
-                            'issue_key': issue_key,
-                            'error': f'Transition "{transition_name}" not found'
-                        })
-                        print(f"  ✗ {issue_key} (transition non trouvée)")
-                        continue
-
-                    # Effectuer la transition
-                    transition_data = {'transition': {'id': transition_id}}
-
-                    if comment:
-                        transition_data['update'] = {
-                            'comment': [{
-                                'add': {
-                                    'body': {
-                                        'type': 'doc',
-                                        'version': 1,
-                                        'content': [{
-                                            'type': 'paragraph',
-                                            'content': [{'type': 'text', 'text': comment}]
-                                        }]
-                                    }
-                                }
-                            }]
-                        }
-
-                    result = self.client.post(f'issue/{issue_key}/transitions',
-                                             data=transition_data)
+        issue_keys = self._pending(issue_keys, results, 'transitioned')
+        if self.server_side:
+            if comment:
+                print("Les tâches bulk ne gèrent pas les commentaires: transition issue par issue")
+            else:
+                self._transition_with_tasks(issue_keys, transition_name, results)
+                return self._finish(results, 'transitioned')
+
+        # Le dictionnaire est complété par le flux: le garder même vide
+        contexts = {} if contexts is None else contexts
+        self._run_batches(issue_keys,
+                          lambda issue_key: self._transition_issue(issue_key, transition_name, comment,
+                                                                   contexts.pop(issue_key, None)),
+                          results, 'transitioned')
+        return self._finish(results, 'transitioned')
+
+    def _transition_with_tasks(self, issue_keys: List[str], transition_name: str, results: Dict):
+        """
+        Transitionne les issues par tâches bulk/issues/transition
 
-                    if result is not None:
-                        results['transitioned'].append(issue_key)
-                        print(f"  ✓ {issue_key}")
-                    else:
-                        results['failed'].append({
-                            'issue_key': issue_key,
-                            'error': 'Transition failed'
-                        })
-                        print(f"  ✗ {issue_key}")
+        Jira regroupe les issues par workflow; chaque groupe reçoit l'ID de la
+        transition portant ce nom dans son workflow.
+        """
+        jobs = []
+        for chunk in self._task_chunks(issue_keys):
+            inputs, selected = [], set()
+            for group in bulk_tasks.transition_groups(self.client, chunk):
+                transition_id = next((t['transitionId'] for t in group.get('transitions', [])
+                                      if t.get('transitionName', '').lower() == transition_name.lower()), None)
+                if transition_id is not None:
+                    inputs.append((transition_id, group.get('issues', [])))
+                    selected.update(group.get('issues', []))
+
+            for issue_key in chunk:
+                if issue_key not in selected:
+                    results['failed'].append({'issue_key': issue_key,
+                                              'error': f'Transition "{transition_name}" not found'})
+                    self._record(issue_key, results['failed'][-1]['error'])
+                    print(f"  ✗ {issue_key} (transition non trouvée)")
+
+            keys = [key for key in chunk if key in selected]
+            if keys:
+                jobs.append((keys, lambda inputs=inputs: bulk_tasks.submit_transition_task(self.client, inputs)))
+
+        self._run_tasks(jobs, results, 'transitioned')
+
+    def _task_chunks(self, issue_keys: Iterable[str]) -> Iterator[List[str]]:
+        """Découpe les clés en tâches de MAX_TASK_ISSUES issues au plus"""
+        issue_keys = iter(issue_keys)
+        while True:
+            chunk = list(islice(issue_keys, bulk_tasks.MAX_TASK_ISSUES))
+            if not chunk:
+                return
+            yield chunk
+
+    def _issue_ids(self, issue_keys: List[str]) -> Dict[str, str]:
+        """ID de chaque issue (les tâches bulk rendent leurs résultats par ID)"""
+        chunks = [issue_keys[i:i + 100] for i in range(0, len(issue_keys), 100)]
+
+        def lookup(chunk: List[str]) -> List[Dict]:
+            params = {'jql': f"key in ({','.join(chunk)})", 'fields': 'key'}
+            return get_paginated_concurrent(self.client, 'search', params=params)
+
+        ids = {}
+        for issues in map_concurrent(lookup, chunks, workers=self.workers):
+            ids.update({issue['key']: str(issue['id']) for issue in issues})
+        return ids
+
+    def _run_tasks(self, jobs: List[Tuple[List[str], Callable[[], str]]], results: Dict, done_key: str):
+        """
+        Soumet les tâches bulk, suit leur avancement et rapporte le résultat de chaque issue
 
-                except Exception as e:
-                    results['failed'].append({
-                        'issue_key': issue_key,
-                        'error': str(e)
-                    })
-                    print(f"  ✗ Erreur {issue_key}: {str(e)}")
+        Args:
+            jobs: Liste de (clés des issues, fonction soumettant la tâche et retournant son ID)
+            results: Dictionnaire de résultats à compléter (results['tasks'] reçoit chaque tâche)
+            done_key: Liste de results recevant les clés traitées avec succès
+        """
+        if not jobs:
+            return
+
+        issue_ids = self._issue_ids([key for keys, _ in jobs for key in keys])
+        results.setdefault('tasks', [])
+
+        def run(job) -> Tuple[Optional[Dict], Dict[str, Optional[str]]]:
+            keys, submit = job
+            ids = {key: issue_ids[key] for key in keys if key in issue_ids}
+            missing = {key: 'Issue introuvable' for key in keys if key not in issue_ids}
+            if not ids:
+                return None, missing
+
+            try:
+                task_id = submit()
+                print(f"Tâche {task_id} soumise ({len(ids)} issues)")
+                progress = {'percent': None}
+
+                def report(state: Dict):
+                    if state.get('progressPercent') != progress['percent']:
+                        progress['percent'] = state.get('progressPercent')
+                        print(f"  Tâche {task_id}: {state.get('status')} {progress['percent'] or 0}%")
+
+                task = bulk_tasks.wait_for_task(self.client, task_id, on_progress=report)
+            except Exception as e:
+                return None, {**{key: str(e) for key in ids}, **missing}
+            return task, {**bulk_tasks.task_outcomes(task, ids), **missing}
+
+        # Jira limite le nombre de tâches bulk simultanées par utilisateur
+        workers = min(self.workers or bulk_tasks.MAX_CONCURRENT_TASKS, bulk_tasks.MAX_CONCURRENT_TASKS)
+        for (keys, _), (task, outcomes) in zip(jobs, map_concurrent(run, jobs, workers=workers)):
+            if task:
+                results['tasks'].append({'task_id': task.get('taskId'), 'status': task.get('status'),
+                                         'issues': len(keys)})
+            for issue_key in keys:
+                error = outcomes.get(issue_key)
+                self._record(issue_key, error)
+                if error:
+                    results['failed'].append({'issue_key': issue_key, 'error': error})
+                    print(f"  ✗ {issue_key} ({error})")
+                else:
+                    results[done_key].append(issue_key)
+                    print(f"  ✓ {issue_key}")
+        if self.journal:
+            self.journal.sync()
+
+    def _transition_issue(self, issue_key: str, transition_name: str,
+                          comment: str = None, context: Tuple = None) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Transitionne une issue
 
-            if i + self.batch_size < len(issue_keys):
-                time.sleep(self.delay_between_batches)
+        Returns:
+            (erreur ou None, ligne à afficher ou None)
+        """
+        try:
+            # Sans contexte connu, le workflow de l'issue est inconnu: pas de cache
+            cache_key = (tuple(context), transition_name.lower()) if context else None
+            cached_id = None
+            if cache_key:
+                with self._transition_lock:
+                    cached_id = self._transition_ids.get(cache_key)
+
+            if cached_id:
+                if self._post_transition(issue_key, cached_id, comment) is None:
+                    return None, f"  ✓ {issue_key}"
+                # ID refusé (workflow ou statut différent): résolution pour cette issue
+
+            # Récupérer les transitions disponibles
+            transitions, error = self._send('GET', f'issue/{issue_key}/transitions')
+
+            if error:
+                return f'Cannot get transitions ({error})', f"  ✗ {issue_key} ({error})"
+
+            # Trouver l'ID de la transition
+            transition_id = None
+            for t in transitions.get('transitions', []):
+                if t['name'].lower() == transition_name.lower():
+                    transition_id = t['id']
+                    break
+
+            if not transition_id:
+                return (f'Transition "{transition_name}" not found',
+                        f"  ✗ {issue_key} (transition non trouvée)")
+
+            if transition_id == cached_id:
+                # L'ID est le bon mais Jira refuse la transition (validateur, champ requis, ...)
+                return 'Transition failed', f"  ✗ {issue_key}"
+
+            if cache_key:
+                with self._transition_lock:
+                    self._transition_ids[cache_key] = transition_id
+
+            error = self._post_transition(issue_key, transition_id, comment)
+            if error is None:
+                return None, f"  ✓ {issue_key}"
+            return error, f"  ✗ {issue_key} ({error})"
+
+        except Exception as e:
+            return str(e), f"  ✗ Erreur {issue_key}: {str(e)}"
+
+    def _post_transition(self, issue_key: str, transition_id: str, comment: str = None) -> Optional[str]:
+        """Effectue la transition, retourne l'erreur si Jira la refuse (None si effectuée)"""
+        transition_data = {'transition': {'id': transition_id}}
+
+        if comment:
+            transition_data['update'] = {
+                'comment': [{
+                    'add': {
+                        'body': {
+                            'type': 'doc',
+                            'version': 1,
+                            'content': [{
+                                'type': 'paragraph',
+                                'content': [{'type': 'text', 'text': comment}]
+                            }]
+                        }
+                    }
+                }]
+            }
 
-        return results
+        return self._send('POST', f'issue/{issue_key}/transitions', transition_data)[1]
 
     def import_from_csv(self, csv_file: str, project_key: str,
                        issue_type: str = 'Task', dry_run: bool = False) -> Dict:
@@ -286,58 +781,146 @@ class BulkOperations:
 
         Format CSV attendu: summary,description,priority,assignee,labels
         """
-        issues_data = []
+        print(f"Importation depuis {csv_file}")
+        return self.bulk_create_issues(self.iter_csv_issues(csv_file, project_key, issue_type),
+                                       dry_run=dry_run)
 
-        with open(csv_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
+    def iter_csv_issues(self, csv_file: str, project_key: str, issue_type: str = 'Task') -> Iterator[Dict]:
+        """
+        Lit un fichier CSV en flux et produit les données d'issues validées
 
-            for row in reader:
-                issue_data = {
-                    'fields': {
-                        'project': {'key': project_key},
-                        'summary': row.get('summary', ''),
-                        'issuetype': {'name': issue_type}
-                    }
-                }
-
-                # Description
-                if row.get('description'):
-                    issue_data['fields']['description'] = {
-                        'type': 'doc',
-                        'version': 1,
-                        'content': [{
-                            'type': 'paragraph',
-                            'content': [{'type': 'text', 'text': row['description']}]
-                        }]
-                    }
+        Lecture et validation tournent chacune dans leur thread, reliées à la
+        création par des files bornées: les premières issues sont créées dès
+        les premières lignes lues, en mémoire constante.
+        """
+        rows = prefetch(self._read_csv(csv_file), CSV_QUEUE_SIZE)
+
+        def validate() -> Iterator[Dict]:
+            for line, row in rows:
+                issue_data = self._csv_issue(row, project_key, issue_type)
+                if issue_data.get('error'):
+                    issue_data['line'] = line  # Ligne du fichier, pour le message d'erreur
+                yield issue_data
 
-                # Priorité
-                if row.get('priority'):
-                    issue_data['fields']['priority'] = {'name': row['priority']}
+        return prefetch(validate(), CSV_QUEUE_SIZE)
 
-                # Assigné
-                if row.get('assignee'):
-                    issue_data['fields']['assignee'] = {'id': row['assignee']}
+    @staticmethod
+    def _read_csv(csv_file: str) -> Iterator[Tuple[int, Dict]]:
+        """(numéro de ligne dans le fichier, en-tête compris; ligne CSV)"""
+        import csv
+
+        with open(csv_file, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield reader.line_num, row
 
-                # Labels
-                if row.get('labels'):
-                    labels = [l.strip() for l in row['labels'].split(',')]
-                    issue_data['fields']['labels'] = labels
+    def _csv_issue(self, row: Dict, project_key: str, issue_type: str) -> Dict:
+        """
+        Convertit une ligne CSV en données d'issue
 
-                issues_data.append(issue_data)
+        Priorité, assigné et labels sont vérifiés contre les métadonnées de
+        Jira (en cache); une ligne invalide reçoit une clé 'error'.
+        """
+        issue_data = {
+            'fields': {
+                'project': {'key': project_key},
+                'summary': (row.get('summary') or '').strip(),
+                'issuetype': {'name': issue_type}
+            }
+        }
+        fields = issue_data['fields']
+
+        if not fields['summary']:
+            issue_data['error'] = 'summary: résumé vide'
+            return issue_data
+
+        # Description
+        if row.get('description'):
+            fields['description'] = {
+                'type': 'doc',
+                'version': 1,
+                'content': [{
+                    'type': 'paragraph',
+                    'content': [{'type': 'text', 'text': row['description']}]
+                }]
+            }
+
+        # Priorité
+        if row.get('priority'):
+            priority = self._priority_ref(row['priority'].strip())
+            if priority is None:
+                issue_data['error'] = f"priority: priorité inconnue ({row['priority']})"
+                return issue_data
+            fields['priority'] = priority
+
+        # Assigné (accountId ou adresse e-mail)
+        if row.get('assignee'):
+            account_id = self._account_id(row['assignee'].strip())
+            if account_id is None:
+                issue_data['error'] = f"assignee: utilisateur inconnu ({row['assignee']})"
+                return issue_data
+            fields['assignee'] = {'accountId': account_id}
+
+        # Labels (Jira refuse les espaces dans un label)
+        if row.get('labels'):
+            labels = [l.strip().replace(' ', '_') for l in row['labels'].split(',')]
+            fields['labels'] = [l for l in labels if l]
+
+        return issue_data
+
+    def _priority_ref(self, name: str) -> Optional[Dict]:
+        """Référence d'une priorité par nom (None si Jira ne la connaît pas)"""
+        with self._metadata_lock:
+            if self._priorities is None:
+                priorities = self.client.get('priority')
+                self._priorities = {p['name'].lower(): p['id'] for p in priorities or []
+                                    if p.get('name') and p.get('id')}
+
+        if not self._priorities:
+            return {'name': name}  # Liste indisponible: Jira validera à la création
+        priority_id = self._priorities.get(name.lower())
+        return {'id': priority_id} if priority_id else None
+
+    def _account_id(self, value: str) -> Optional[str]:
+        """
+        accountId d'un utilisateur désigné par accountId ou e-mail (en cache)
 
-        print(f"Importation de {len(issues_data)} issues depuis {csv_file}")
-        return self.bulk_create_issues(issues_data, dry_run=dry_run)
+        Seuls les résultats confirmés par Jira sont gardés: un utilisateur
+        trouvé, ou une recherche par e-mail aboutie mais sans correspondance.
+        Une requête en échec (délai, 5xx) est retentée à la ligne suivante.
+        """
+        with self._metadata_lock:
+            if value in self._account_ids:
+                return self._account_ids[value]
+
+        if '@' in value:
+            users = self.client.get('user/search', params={'query': value})
+            account_id = next((u['accountId'] for u in users or []
+                               if (u.get('emailAddress') or '').lower() == value.lower()), None)
+            confirmed = users is not None
+        else:
+            user = self.client.get('user', params={'accountId': value})
+            account_id = user.get('accountId') if user else None
+            confirmed = account_id is not None
+
+        if confirmed:
+            with self._metadata_lock:
+                self._account_ids[value] = account_id
+        return account_id
 
     def export_to_csv(self, jql: str, csv_file: str,
-                     fields: List[str] = None) -> int:
+                     fields: List[str] = None, compression: str = None, format: str = 'csv') -> int:
         """
-        Exporte les résultats d'une recherche JQL en CSV
+        Exporte les résultats d'une recherche JQL en CSV (ou Parquet/Arrow)
+
+        Les lignes sont écrites au fil des pages de recherche (mémoire constante).
 
         Args:
             jql: Requête JQL
             csv_file: Fichier de sortie
             fields: Champs à exporter (par défaut: summary, status, assignee, priority)
+            compression: 'gzip', 'zstd' ou None (d'après l'extension: .gz, .zst)
+            format: 'csv', 'parquet' ou 'arrow' (voir lib.streaming_export)
         """
         if not fields:
             fields = ['summary', 'status', 'assignee', 'priority', 'created', 'updated']
@@ -347,97 +930,257 @@ class BulkOperations:
             'jql': jql,
             'fields': ','.join(fields)
         }
+        issues = iter_paginated(self.client, 'search', params=params)
 
-        issues = self.client.get_paginated('search', params=params)
-
-        # Écrire le CSV
-        with open(csv_file, 'w', newline='', encoding='utf-8') as f:
-            # Préparer les en-têtes
-            csv_fields = ['key'] + fields
-
-            writer = csv.DictWriter(f, fieldnames=csv_fields)
-            writer.writeheader()
-
+        def rows() -> Iterator[Dict]:
             for issue in issues:
                 row = {'key': issue['key']}
                 issue_fields = issue.get('fields', {})
 
                 for field in fields:
-                    value = issue_fields.get(field)
-
-                    # Traiter les différents types de champs
-                    if isinstance(value, dict):
-                        if 'name' in value:
-                            row[field] = value['name']
-                        elif 'displayName' in value:
-                            row[field] = value['displayName']
-                        else:
-                            row[field] = str(value)
-                    elif isinstance(value, list):
-                        row[field] = ', '.join(str(v) for v in value)
-                    else:
-                        row[field] = value or ''
-
-                writer.writerow(row)
-
-        print(f"✓ {len(issues)} issues exportées vers {csv_file}")
-        return len(issues)
-
-    def bulk_assign_issues(self, issue_keys: List[str], account_id: str = None,
+                    row[field] = field_value(issue_fields.get(field))
+
+                yield row
+
+        count = write_rows(csv_file, ['key'] + fields, rows(), format, compression)
+        print(f"✓ {count} issues exportées vers {csv_file}")
+        return count
+
+    def bulk_assign_issues(self, issue_keys: Iterable[str], account_id: str = None,
                           dry_run: bool = False) -> Dict:
-        """Assigne plusieurs issues en masse"""
-        results = {
-            'assigned': [],
-            'failed': [],
-            'total': len(issue_keys),
-            'dry_run': dry_run
-        }
+        """Assigne plusieurs issues en masse (clés en liste ou en flux)"""
+        results = self._new_results('assigned', issue_keys, dry_run)
 
         assignee_name = account_id or "Automatic"
 
         if dry_run:
+            issue_keys = list(issue_keys)
+            results['total'] = len(issue_keys)
             print(f"MODE SIMULATION: {len(issue_keys)} issues → {assignee_name}")
             for key in issue_keys:
                 print(f"  • {key}")
             return results
 
-        for i in range(0, len(issue_keys), self.batch_size):
-            batch = issue_keys[i:i + self.batch_size]
-            print(f"Traitement du lot {i//self.batch_size + 1}...")
-
-            for issue_key in batch:
-                try:
-                    data = {'accountId': account_id} if account_id else None
-                    result = self.client.put(f'issue/{issue_key}/assignee', data=data)
-
-                    if result is not None:
-                        results['assigned'].append(issue_key)
-                        print(f"  ✓ {issue_key}")
-                    else:
-                        results['failed'].append({
-                            'issue_key': issue_key,
-                            'error': 'Assignment failed'
-                        })
-                        print(f"  ✗ {issue_key}")
-
-                except Exception as e:
-                    results['failed'].append({
-                        'issue_key': issue_key,
-                        'error': str(e)
-                    })
-                    print(f"  ✗ Erreur: {str(e)}")
+        issue_keys = self._pending(issue_keys, results, 'assigned')
+        if self.server_side and account_id:
+            edit = bulk_tasks.bulk_edit_input({'assignee': {'accountId': account_id}})
+            self._run_tasks([(chunk, lambda chunk=chunk: bulk_tasks.submit_edit_task(self.client, chunk, *edit))
+                             for chunk in self._task_chunks(issue_keys)], results, 'assigned')
+            return self._finish(results, 'assigned')
+        if self.server_side:
+            print("Les tâches bulk ne gèrent pas l'assignation automatique: assignation issue par issue")
 
-            if i + self.batch_size < len(issue_keys):
-                time.sleep(self.delay_between_batches)
+        self._run_batches(issue_keys, lambda issue_key: self._assign_issue(issue_key, account_id),
+                          results, 'assigned')
+        return self._finish(results, 'assigned')
 
-        return results
+    def _assign_issue(self, issue_key: str, account_id: str = None) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Assigne une issue (assignation automatique si account_id est vide)
 
+        Returns:
+            (erreur ou None, ligne à afficher ou None)
+        """
+        try:
+            data = {'accountId': account_id} if account_id else None
+            _, error = self._send('PUT', f'issue/{issue_key}/assignee', data)
+
+            if error is None:
+                return None, f"  ✓ {issue_key}"
+            return error, f"  ✗ {issue_key} ({error})"
+
+        except Exception as e:
+            return str(e), f"  ✗ Erreur: {str(e)}"
+
+
+def workflow_context(issue: Dict) -> Tuple:
+    """Contexte de workflow d'une issue de recherche: (projet, type d'issue, statut)"""
+    fields = issue.get('fields') or {}
+
+    def ref(name: str, attribute: str = 'id'):
+        value = fields.get(name) or {}
+        return value.get(attribute) or value.get('name')
+
+    return (ref('project', 'key') or issue['key'].rsplit('-', 1)[0], ref('issuetype'), ref('status'))
+
+
+# Liste des résultats et libellé des éléments réussis, par opération
+RESULT_LABELS = {
+    'create': ('created', 'Créées'),
+    'import-csv': ('created', 'Créées'),
+    'update': ('updated', 'Mises à jour'),
+    'delete': ('deleted', 'Supprimées'),
+    'transition': ('transitioned', 'Transitionnées'),
+    'assign': ('assigned', 'Assignées'),
+}
+
+
+def stream_issue_keys(client, jql: str, contexts: Dict = None) -> Iterator[str]:
+    """
+    Clés des issues d'une JQL, produites au fil des pages de recherche
+
+    Les modifications commencent dès la première page; seules quelques pages
+    sont préchargées en avance (JIRA_PAGINATION_WORKERS), ce qui borne la
+    mémoire quel que soit le nombre d'issues.
+
+    Args:
+        contexts: Dictionnaire recevant le contexte de workflow de chaque
+                  issue avant que sa clé soit produite (transitions)
+    """
+    fields = 'project,issuetype,status' if contexts is not None else 'key'
+    for issue in iter_search_while_mutating(client, jql, fields=fields):
+        if contexts is not None:
+            contexts[issue['key']] = workflow_context(issue)
+        yield issue['key']
+
+
+def stream_key_contexts(client, issue_keys: Iterable[str], contexts: Dict) -> Iterator[str]:
+    """
+    Clés explicites, produites après résolution de leur contexte de workflow
+
+    Le contexte (projet, type d'issue, statut) est lu par recherches
+    `key in (...)` de 100 clés. Si une recherche échoue (clé inconnue de
+    Jira), les clés de ce groupe sont produites sans contexte.
+    """
+    issue_keys = iter(issue_keys)
+    while True:
+        chunk = list(islice(issue_keys, 100))
+        if not chunk:
+            return
+        params = {'jql': f"key in ({','.join(chunk)})", 'fields': 'project,issuetype,status'}
+        try:
+            for issue in iter_paginated(client, 'search', params=params):
+                contexts[issue['key']] = workflow_context(issue)
+        except PaginationError:
+            pass
+        yield from chunk
+
+
+def count_issues(client, jql: str) -> int:
+    """Nombre d'issues correspondant à une JQL (sans les télécharger)"""
+    page = client.get('search', params={'jql': jql, 'fields': 'key', 'startAt': 0, 'maxResults': 0})
+    return (page or {}).get('total', 0)
+
+
+def prepare_job(args, client, bulk: BulkOperations) -> Tuple[str, Dict, Optional[List]]:
+    """
+    Prépare les paramètres et les éléments d'une commande avant son exécution
+
+    Les fichiers JSON et les clés explicites sont figés dans le journal. Une
+    sélection par JQL ou un fichier CSV est lu en flux pendant l'exécution
+    (voir run_job): la reprise relit la source et écarte les éléments déjà
+    traités.
+
+    Returns:
+        (opération, paramètres, éléments ou None pour une JQL),
+        None à la place du tuple si la commande est abandonnée
+    """
+    operation, params = args.command, {}
+
+    if operation == 'create':
+        with open(args.json_file, 'r') as f:
+            return operation, params, json.load(f)
+
+    if operation == 'update':
+        with open(args.json_file, 'r') as f:
+            return operation, params, json.load(f)
+
+    if operation == 'import-csv':
+        # Le fichier est relu en flux (et à la reprise), sans figer ses lignes
+        params = {'csv_file': os.path.abspath(args.csv_file), 'project_key': args.project_key,
+                  'type': args.type}
+        print(f"Importation depuis {args.csv_file}")
+        return operation, params, None
+
+    if args.jql:
+        params['jql'] = args.jql
+        items = None
+    elif args.keys:
+        items = list(args.keys)
+    else:
+        print("Erreur: spécifier --jql ou --keys", file=sys.stderr)
+        sys.exit(1)
 
-def main():
+    if operation == 'delete':
+        if not args.confirm and not args.dry_run:
+            count = len(items) if items is not None else count_issues(client, args.jql)
+            response = input(f"⚠ Confirmer la suppression de {count} issues ? (oui/non): ")
+            if response.lower() not in ['oui', 'o', 'yes', 'y']:
+                print("Suppression annulée")
+                return None
+        params['delete_subtasks'] = args.delete_subtasks
+    elif operation == 'transition':
+        params.update({'transition': args.transition, 'comment': args.comment})
+    elif operation == 'assign':
+        params['account_id'] = args.account_id
+
+    return operation, params, items
+
+
+def run_job(bulk: BulkOperations, operation: str, params: Dict, items: Optional[List],
+            dry_run: bool = False) -> Dict:
+    """Exécute une opération en masse (nouveau job ou reprise)"""
+    contexts = {} if operation == 'transition' and not dry_run else None
+    if items is None and operation == 'import-csv':
+        items = bulk.iter_csv_issues(params['csv_file'], params['project_key'], params.get('type', 'Task'))
+    elif items is None:
+        # Sélection par JQL: les clés alimentent les workers au fil des pages
+        items = stream_issue_keys(bulk.client, params['jql'], contexts)
+    elif contexts is not None:
+        # Clés explicites: contexte de workflow lu par recherches groupées
+        items = stream_key_contexts(bulk.client, items, contexts)
+
+    if operation in ('create', 'import-csv'):
+        return bulk.bulk_create_issues(items, dry_run=dry_run)
+    if operation == 'update':
+        return bulk.bulk_update_issues(items, dry_run=dry_run)
+    if operation == 'delete':
+        return bulk.bulk_delete_issues(items, dry_run=dry_run,
+                                       delete_subtasks=params.get('delete_subtasks', False))
+    if operation == 'transition':
+        return bulk.bulk_transition_issues(items, params['transition'], params.get('comment'),
+                                           dry_run=dry_run, contexts=contexts)
+    if operation == 'assign':
+        return bulk.bulk_assign_issues(items, params.get('account_id'), dry_run=dry_run)
+    raise ValueError(f"Opération inconnue: {operation}")
+
+
+def print_results(operation: str, results: Dict):
+    """Affiche le bilan d'une opération en masse"""
+    done_key, label = RESULT_LABELS[operation]
+
+    print(f"\n=== RÉSULTATS ===")
+    print(f"Total: {results['total']}")
+    print(f"{label}: {len(results[done_key])}")
+    if results.get('existing'):
+        print(f"Déjà existantes (ignorées): {len(results['existing'])}")
+    if results.get('skipped'):
+        print(f"Dont déjà traitées (reprise): {results['skipped']}")
+    print(f"Échecs: {len(results['failed'])}")
+
+    if operation == 'create' and results['failed']:
+        print(f"\nÉchecs:")
+        for fail in results['failed'][:10]:  # 10 premiers
+            print(f"  • {fail.get('error')}")
+
+
+def main(argv: List[str] = None):
     parser = argparse.ArgumentParser(description='Opérations en masse sur Jira Cloud')
     parser.add_argument('--config', help='Fichier de configuration')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Ignorer le cache disque des réponses')
     parser.add_argument('--dry-run', action='store_true',
                        help='Mode simulation (ne fait rien)')
+    parser.add_argument('--workers', type=int,
+                       help='Nombre de requêtes en parallèle (défaut: JIRA_WORKERS ou 8)')
+    parser.add_argument('--server-side', action='store_true',
+                       help='Transitions, mises à jour et assignations par tâches bulk Jira '
+                            '(1 000 issues par tâche)')
+    parser.add_argument('--no-dedup', action='store_true',
+                       help='create / import-csv: ne pas poser de label d\'empreinte '
+                            'ni ignorer les lignes déjà créées')
+    parser.add_argument('--no-journal', action='store_true',
+                       help='Ne pas journaliser le job (pas de reprise possible)')
 
     subparsers = parser.add_subparsers(dest='command', help='Commandes disponibles')
 
@@ -473,10 +1216,14 @@ def main():
     import_parser.add_argument('--type', default='Task', help='Type d\'issue')
 
     # Export CSV
-    export_parser = subparsers.add_parser('export-csv', help='Exporter vers un CSV')
+    export_parser = subparsers.add_parser('export-csv', help='Exporter vers un CSV (ou Parquet/Arrow)')
     export_parser.add_argument('jql', help='Requête JQL')
     export_parser.add_argument('csv_file', help='Fichier CSV de sortie')
     export_parser.add_argument('--fields', nargs='*', help='Champs à exporter')
+    export_parser.add_argument('--compress', choices=COMPRESSIONS,
+                              help='Compression de la sortie (défaut: d\'après l\'extension .gz/.zst)')
+    export_parser.add_argument('--format', choices=FORMATS, default='csv',
+                              help='Format de sortie (parquet/arrow: pyarrow requis)')
 
     # Assignation en masse
     assign_parser = subparsers.add_parser('assign', help='Assigner des issues en masse')
@@ -484,117 +1231,65 @@ def main():
     assign_parser.add_argument('--keys', nargs='+', help='Clés des issues')
     assign_parser.add_argument('--account-id', help='Account ID (vide = automatic)')
 
-    args = parser.parse_args()
+    # Reprise d'un job interrompu
+    resume_parser = subparsers.add_parser('resume', help='Reprendre un job interrompu')
+    resume_parser.add_argument('job_id', help='ID du job (affiché au lancement)')
+
+    args = parser.parse_args(argv)
 
     if not args.command:
         parser.print_help()
         return
 
     try:
-        client = JiraClient(args.config)
-        bulk = BulkOperations(client)
-
-        if args.command == 'create':
-            with open(args.json_file, 'r') as f:
-                issues_data = json.load(f)
-
-            results = bulk.bulk_create_issues(issues_data, dry_run=args.dry_run)
-
-            print(f"\n=== RÉSULTATS ===")
-            print(f"Total: {results['total']}")
-            print(f"Créées: {len(results['created'])}")
-            print(f"Échecs: {len(results['failed'])}")
-
+        client = create_client(args.config, use_cache=not args.no_cache)
+        bulk = BulkOperations(client, workers=args.workers, server_side=args.server_side,
+                              idempotent=not args.no_dedup)
+
+        if args.command == 'export-csv':
+            bulk.export_to_csv(args.jql, args.csv_file, args.fields, args.compress, args.format)
+            return
+
+        if args.command == 'resume':
+            journal = JobJournal.load(args.job_id)
+            operation, params, items = journal.operation, journal.params, journal.items
+            bulk.server_side = bulk.server_side or params.get('server_side', False)
+            total = f"/{len(items)}" if items is not None else ''
+            print(f"Reprise du job {journal.job_id} ({operation}): "
+                  f"{len(journal.done)}{total} éléments déjà traités")
+        else:
+            job = prepare_job(args, client, bulk)
+            if job is None:
+                return
+            operation, params, items = job
+            journal = None
+            if not args.dry_run and not args.no_journal:
+                journal = JobJournal.create(operation, {**params, 'server_side': args.server_side}, items)
+                print(f"Job {journal.job_id}"
+                      + (f" ({len(items)} éléments)" if items is not None
+                         else f" (JQL: {params['jql']})" if 'jql' in params
+                         else f" ({params['csv_file']})"))
+
+        bulk.journal = journal
+        try:
+            results = run_job(bulk, operation, params, items, dry_run=args.dry_run)
+        except KeyboardInterrupt:
+            if journal:
+                print(f"\nInterrompu: reprendre avec `bulk_operations.py resume {journal.job_id}`",
+                      file=sys.stderr)
+            sys.exit(130)
+        finally:
+            if journal:
+                journal.close()
+
+        print_results(operation, results)
+
+        if journal:
             if results['failed']:
-                print(f"\nÉchecs:")
-                for fail in results['failed'][:10]:  # 10 premiers
-                    print(f"  • {fail.get('error')}")
-
-        elif args.command == 'update':
-            with open(args.json_file, 'r') as f:
-                updates = json.load(f)
-
-            results = bulk.bulk_update_issues(updates, dry_run=args.dry_run)
-
-            print(f"\n=== RÉSULTATS ===")
-            print(f"Total: {results['total']}")
-            print(f"Mises à jour: {len(results['updated'])}")
-            print(f"Échecs: {len(results['failed'])}")
-
-        elif args.command == 'delete':
-            # Récupérer les clés à supprimer
-            if args.jql:
-                issues = client.get_paginated('search', params={'jql': args.jql, 'fields': 'key'})
-                issue_keys = [i['key'] for i in issues]
-            elif args.keys:
-                issue_keys = args.keys
+                print(f"\nJob {journal.job_id}: relancer les échecs avec "
+                      f"`bulk_operations.py resume {journal.job_id}`")
             else:
-                print("Erreur: spécifier --jql ou --keys", file=sys.stderr)
-                sys.exit(1)
-
-            if not args.confirm and not args.dry_run:
-                response = input(f"⚠ Confirmer la suppression de {len(issue_keys)} issues ? (oui/non): ")
-                if response.lower() not in ['oui', 'o', 'yes', 'y']:
-                    print("Suppression annulée")
-                    return
-
-            results = bulk.bulk_delete_issues(issue_keys, dry_run=args.dry_run,
-                                             delete_subtasks=args.delete_subtasks)
-
-            print(f"\n=== RÉSULTATS ===")
-            print(f"Total: {results['total']}")
-            print(f"Supprimées: {len(results['deleted'])}")
-            print(f"Échecs: {len(results['failed'])}")
-
-        elif args.command == 'transition':
-            # Récupérer les clés
-            if args.jql:
-                issues = client.get_paginated('search', params={'jql': args.jql, 'fields': 'key'})
-                issue_keys = [i['key'] for i in issues]
-            elif args.keys:
-                issue_keys = args.keys
-            else:
-                print("Erreur: spécifier --jql ou --keys", file=sys.stderr)
-                sys.exit(1)
-
-            results = bulk.bulk_transition_issues(issue_keys, args.transition,
-                                                 args.comment, dry_run=args.dry_run)
-
-            print(f"\n=== RÉSULTATS ===")
-            print(f"Total: {results['total']}")
-            print(f"Transitionnées: {len(results['transitioned'])}")
-            print(f"Échecs: {len(results['failed'])}")
-
-        elif args.command == 'import-csv':
-            results = bulk.import_from_csv(args.csv_file, args.project_key,
-                                          args.type, dry_run=args.dry_run)
-
-            print(f"\n=== RÉSULTATS ===")
-            print(f"Total: {results['total']}")
-            print(f"Créées: {len(results['created'])}")
-            print(f"Échecs: {len(results['failed'])}")
-
-        elif args.command == 'export-csv':
-            count = bulk.export_to_csv(args.jql, args.csv_file, args.fields)
-
-        elif args.command == 'assign':
-            # Récupérer les clés
-            if args.jql:
-                issues = client.get_paginated('search', params={'jql': args.jql, 'fields': 'key'})
-                issue_keys = [i['key'] for i in issues]
-            elif args.keys:
-                issue_keys = args.keys
-            else:
-                print("Erreur: spécifier --jql ou --keys", file=sys.stderr)
-                sys.exit(1)
-
-            results = bulk.bulk_assign_issues(issue_keys, args.account_id,
-                                             dry_run=args.dry_run)
-
-            print(f"\n=== RÉSULTATS ===")
-            print(f"Total: {results['total']}")
-            print(f"Assignées: {len(results['assigned'])}")
-            print(f"Échecs: {len(results['failed'])}")
+                os.remove(journal.path)
 
     except Exception as e:
         print(f"Erreur: {e}", file=sys.stderr)
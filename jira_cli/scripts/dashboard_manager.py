@@ -8,18 +8,23 @@ Gérer les favoris et la propriété
 import sys
 import os
 import argparse
-import json
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import TYPE_CHECKING, Iterator, List, Dict, Optional
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-from lib.jira_client import JiraClient
+from lib.client_factory import create_client
+from lib import fast_json
+from lib.pagination import iter_paginated
+from lib.streaming_export import COMPRESSIONS, open_output, write_rows
+
+if TYPE_CHECKING:
+    from lib.jira_client import JiraClient
 
 
 class DashboardFilterManager:
     """Gestionnaire de dashboards et filtres Jira"""
 
-    def __init__(self, client: JiraClient):
+    def __init__(self, client: 'JiraClient'):
         self.client = client
 
     # === DASHBOARDS ===
@@ -220,14 +225,16 @@ class DashboardFilterManager:
 
     # === UTILITAIRES ===
 
-    def export_filter_results(self, filter_id: int, filename: str, format: str = 'json'):
+    def export_filter_results(self, filter_id: int, filename: str, format: str = 'json',
+                              compression: str = None):
         """
         Exporte les résultats d'un filtre
 
         Args:
             filter_id: ID du filtre
             filename: Fichier de sortie
-            format: Format (json, csv)
+            format: Format (json, csv, parquet, arrow)
+            compression: 'gzip', 'zstd' ou None (d'après l'extension: .gz, .zst)
         """
         filter_obj = self.get_filter(filter_id)
         if not filter_obj:
@@ -236,42 +243,55 @@ class DashboardFilterManager:
 
         jql = filter_obj.get('jql')
 
-        # Exécuter la recherche
-        issues = self.client.get_paginated('search', params={'jql': jql})
+        # Exécuter la recherche (issues produites page par page)
+        issues = iter_paginated(self.client, 'search', params={'jql': jql})
+        count = 0
 
         if format == 'json':
-            with open(filename, 'w') as f:
-                json.dump({
-                    'filter': filter_obj,
-                    'issues': issues,
-                    'total': len(issues),
-                    'export_date': datetime.now().isoformat()
-                }, f, indent=2, ensure_ascii=False)
-            print(f"✓ {len(issues)} issues exportées vers {filename}")
-
-        elif format == 'csv':
-            import csv
-            with open(filename, 'w', newline='', encoding='utf-8') as f:
-                if not issues:
-                    print("Aucune issue trouvée")
-                    return
-
-                writer = csv.DictWriter(f, fieldnames=['key', 'summary', 'status', 'assignee', 'priority'])
-                writer.writeheader()
+            with open_output(filename, compression) as f:
+                # Écriture incrémentale du même document que fast_json.dump
+                f.write('{\n  "filter": ')
+                f.write(self._indent_json(filter_obj, 2))
+                f.write(',\n  "issues": [')
 
+                for issue in issues:
+                    f.write(',\n    ' if count else '\n    ')
+                    f.write(self._indent_json(issue, 4))
+                    count += 1
+
+                f.write('\n  ]' if count else ']')
+                f.write(f',\n  "total": {count},\n  "export_date": ')
+                f.write(fast_json.dumps(datetime.now().isoformat()))
+                f.write('\n}')
+            print(f"✓ {count} issues exportées vers {filename}")
+
+        else:
+            def rows() -> Iterator[Dict]:
                 for issue in issues:
                     fields = issue.get('fields', {})
                     assignee = fields.get('assignee')
 
-                    writer.writerow({
+                    yield {
                         'key': issue['key'],
                         'summary': fields.get('summary', ''),
                         'status': fields.get('status', {}).get('name', ''),
                         'assignee': assignee.get('displayName') if assignee else 'Non assigné',
                         'priority': fields.get('priority', {}).get('name', '')
-                    })
+                    }
+
+            count = write_rows(filename, ['key', 'summary', 'status', 'assignee', 'priority'],
+                               rows(), format, compression)
+
+            if not count:
+                print("Aucune issue trouvée")
+                return
+
+            print(f"✓ {count} issues exportées vers {filename}")
 
-            print(f"✓ {len(issues)} issues exportées vers {filename}")
+    def _indent_json(self, obj, level: int) -> str:
+        """Sérialise un objet en JSON indenté, décalé pour être imbriqué à `level` espaces"""
+        text = fast_json.dumps(obj, indent=True)
+        return text.replace('\n', '\n' + ' ' * level)
 
     def clone_filter(self, filter_id: int, new_name: str) -> Dict:
         """Clone un filtre"""
@@ -287,9 +307,11 @@ class DashboardFilterManager:
         )
 
 
-def main():
+def main(argv: List[str] = None):
     parser = argparse.ArgumentParser(description='Gestion des dashboards et filtres Jira Cloud')
     parser.add_argument('--config', help='Fichier de configuration')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Ignorer le cache disque des réponses')
 
     subparsers = parser.add_subparsers(dest='command', help='Commandes disponibles')
 
@@ -376,17 +398,19 @@ def main():
     export_parser = subparsers.add_parser('filter-export', help='Exporter les résultats d\'un filtre')
     export_parser.add_argument('filter_id', type=int, help='ID du filtre')
     export_parser.add_argument('filename', help='Fichier de sortie')
-    export_parser.add_argument('--format', choices=['json', 'csv'], default='json',
-                              help='Format d\'export')
+    export_parser.add_argument('--format', choices=['json', 'csv', 'parquet', 'arrow'], default='json',
+                              help='Format d\'export (parquet/arrow: pyarrow requis)')
+    export_parser.add_argument('--compress', choices=COMPRESSIONS,
+                              help='Compression de la sortie (défaut: d\'après l\'extension .gz/.zst)')
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if not args.command:
         parser.print_help()
         return
 
     try:
-        client = JiraClient(args.config)
+        client = create_client(args.config, use_cache=not args.no_cache)
         manager = DashboardFilterManager(client)
 
         # === DASHBOARDS ===
@@ -402,7 +426,7 @@ def main():
         elif args.command == 'dashboard-get':
             dashboard = manager.get_dashboard(args.dashboard_id)
             if dashboard:
-                print(json.dumps(dashboard, indent=2, ensure_ascii=False))
+                print(fast_json.dumps(dashboard, indent=True))
             else:
                 print(f"Dashboard {args.dashboard_id} non trouvé", file=sys.stderr)
                 sys.exit(1)
@@ -442,7 +466,7 @@ def main():
         elif args.command == 'filter-get':
             filt = manager.get_filter(args.filter_id)
             if filt:
-                print(json.dumps(filt, indent=2, ensure_ascii=False))
+                print(fast_json.dumps(filt, indent=True))
             else:
                 print(f"Filtre {args.filter_id} non trouvé", file=sys.stderr)
                 sys.exit(1)
@@ -544,7 +568,7 @@ def main():
                 sys.exit(1)
 
         elif args.command == 'filter-export':
-            manager.export_filter_results(args.filter_id, args.filename, args.format)
+            manager.export_filter_results(args.filter_id, args.filename, args.format, args.compress)
 
     except Exception as e:
         print(f"Erreur: {e}", file=sys.stderr)
@@ -7,18 +7,23 @@ Permet de créer, éditer, supprimer, commenter, gérer les transitions, etc.
 import sys
 import os
 import argparse
-import json
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import TYPE_CHECKING, List, Dict, Optional
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-from lib.jira_client import JiraClient
+from lib.client_factory import create_client
+from lib import fast_json
+from lib.pagination import get_paginated_concurrent
+from lib.http_session import rate_limited_request
+
+if TYPE_CHECKING:
+    from lib.jira_client import JiraClient
 
 
 class IssueManager:
     """Gestionnaire d'issues Jira"""
 
-    def __init__(self, client: JiraClient):
+    def __init__(self, client: 'JiraClient'):
         self.client = client
 
     def create_issue(self, project_key: str, summary: str, issue_type: str,
@@ -79,8 +84,7 @@ class IssueManager:
         endpoint = f'issue/{issue_key}'
         url = f"{self.client.base_url}/rest/api/3/{endpoint}"
 
-        import requests
-        response = requests.delete(url, auth=self.client.auth, params=params)
+        response = rate_limited_request('DELETE', url, auth=self.client.auth, params=params)
         return response.status_code in [204, 200]
 
     def transition_issue(self, issue_key: str, transition_name: str,
@@ -229,23 +233,24 @@ class IssueManager:
 
     def add_attachment(self, issue_key: str, file_path: str) -> Dict:
         """Ajoute une pièce jointe"""
-        import requests
-
         url = f"{self.client.base_url}/rest/api/3/issue/{issue_key}/attachments"
 
         with open(file_path, 'rb') as f:
             files = {'file': f}
             headers = {'X-Atlassian-Token': 'no-check'}
 
-            response = requests.post(
+            # Pas de nouvelle tentative: le fichier a déjà été consommé
+            response = rate_limited_request(
+                'POST',
                 url,
+                max_retries=0,
                 auth=self.client.auth,
                 files=files,
                 headers=headers
             )
 
             if response.status_code in [200, 201]:
-                return response.json()
+                return fast_json.loads(response.content)
             return None
 
     def delete_attachment(self, attachment_id: str) -> bool:
@@ -264,8 +269,8 @@ class IssueManager:
         endpoint = f'issue/{issue_key}/watchers'
         url = f"{self.client.base_url}/rest/api/3/{endpoint}"
 
-        import requests
-        response = requests.delete(
+        response = rate_limited_request(
+            'DELETE',
             url,
             auth=self.client.auth,
             params={'accountId': account_id}
@@ -308,12 +313,14 @@ class IssueManager:
         if fields:
             params['fields'] = ','.join(fields)
 
-        return self.client.get_paginated('search', params=params)
+        return get_paginated_concurrent(self.client, 'search', params=params)
 
 
-def main():
+def main(argv: List[str] = None):
     parser = argparse.ArgumentParser(description='Gestion des issues Jira Cloud')
     parser.add_argument('--config', help='Fichier de configuration')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Ignorer le cache disque des réponses')
 
     subparsers = parser.add_subparsers(dest='command', help='Commandes disponibles')
 
@@ -431,14 +438,14 @@ def main():
     search_parser.add_argument('--fields', nargs='*', help='Champs à récupérer')
     search_parser.add_argument('--max', type=int, default=50, help='Nombre max de résultats')
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if not args.command:
         parser.print_help()
         return
 
     try:
-        client = JiraClient(args.config)
+        client = create_client(args.config, use_cache=not args.no_cache)
         manager = IssueManager(client)
 
         if args.command == 'create':
@@ -469,7 +476,7 @@ def main():
         elif args.command == 'get':
             issue = manager.get_issue(args.issue_key, fields=args.fields)
             if issue:
-                print(json.dumps(issue, indent=2, ensure_ascii=False))
+                print(fast_json.dumps(issue, indent=True))
             else:
                 print(f"Issue {args.issue_key} non trouvée", file=sys.stderr)
                 sys.exit(1)
@@ -7,18 +7,21 @@ Permet de lister, créer, modifier, archiver des projets
 import sys
 import os
 import argparse
-import json
 from datetime import datetime
-from typing import List, Dict
+from typing import TYPE_CHECKING, List, Dict
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-from lib.jira_client import JiraClient
+from lib.client_factory import create_client
+from lib import fast_json
+
+if TYPE_CHECKING:
+    from lib.jira_client import JiraClient
 
 
 class ProjectManager:
     """Gestionnaire de projets Jira"""
 
-    def __init__(self, client: JiraClient):
+    def __init__(self, client: 'JiraClient'):
         self.client = client
 
     def list_projects(self, expand: List[str] = None) -> List[Dict]:
@@ -120,14 +123,16 @@ class ProjectManager:
         }
 
         with open(filename, 'w') as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+            fast_json.dump(config, f)
 
         print(f"✓ Configuration exportée vers {filename}")
 
 
-def main():
+def main(argv: List[str] = None):
     parser = argparse.ArgumentParser(description='Gestion des projets Jira Cloud')
     parser.add_argument('--config', help='Fichier de configuration')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Ignorer le cache disque des réponses')
 
     subparsers = parser.add_subparsers(dest='command', help='Commandes disponibles')
 
@@ -170,21 +175,21 @@ def main():
     restore_parser = subparsers.add_parser('restore', help='Restaurer un projet archivé')
     restore_parser.add_argument('project_key', help='Clé du projet')
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if not args.command:
         parser.print_help()
         return
 
     try:
-        client = JiraClient(args.config)
+        client = create_client(args.config, use_cache=not args.no_cache)
         manager = ProjectManager(client)
 
         if args.command == 'list':
             projects = manager.list_projects(expand=args.expand)
 
             if args.format == 'json':
-                print(json.dumps(projects, indent=2, ensure_ascii=False))
+                print(fast_json.dumps(projects, indent=True))
             else:
                 print(f"\n{'Clé':<15} {'Nom':<40} {'Type':<20} {'Chef de projet':<30}")
                 print("-" * 110)
@@ -204,7 +209,7 @@ def main():
                 sys.exit(1)
 
             if args.format == 'json':
-                print(json.dumps(project, indent=2, ensure_ascii=False))
+                print(fast_json.dumps(project, indent=True))
             else:
                 print(f"\n=== PROJET {project.get('key')} ===")
                 print(f"Nom: {project.get('name')}")
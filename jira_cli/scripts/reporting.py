@@ -7,20 +7,27 @@ Génère des rapports sur l'activité, la performance, les métriques
 import sys
 import os
 import argparse
-import json
 from datetime import datetime, timedelta
 from collections import defaultdict, Counter
-from typing import List, Dict
+from typing import TYPE_CHECKING, Iterator, List, Dict
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-from lib.jira_client import JiraClient
+from lib.client_factory import create_client
+from lib import fast_json
+from lib.pagination import get_paginated_concurrent, iter_paginated
+from lib.concurrency import map_concurrent
+from lib.streaming_export import COMPRESSIONS, FORMATS, field_value, write_rows
+
+if TYPE_CHECKING:
+    from lib.jira_client import JiraClient
 
 
 class ReportingTool:
     """Outil de reporting Jira"""
 
-    def __init__(self, client: JiraClient):
+    def __init__(self, client: 'JiraClient', workers: int = None):
         self.client = client
+        self.workers = workers  # Requêtes en parallèle (défaut: JIRA_WORKERS)
 
     def get_issues_by_jql(self, jql: str, fields: List[str] = None) -> List[Dict]:
         """Recherche d'issues par JQL"""
@@ -31,23 +38,53 @@ class ReportingTool:
         if fields:
             params['fields'] = ','.join(fields)
 
-        return self.client.get_paginated('search', params=params)
+        return get_paginated_concurrent(self.client, 'search', params=params)
+
+    def iter_issues_by_jql(self, jql: str, fields: List[str] = None) -> Iterator[Dict]:
+        """Recherche d'issues par JQL, produites page par page"""
+        params = {
+            'jql': jql,
+            'maxResults': 100
+        }
+        if fields:
+            params['fields'] = ','.join(fields)
+
+        return iter_paginated(self.client, 'search', params=params)
+
+    def export_jql(self, jql: str, filename: str, fields: List[str] = None, format: str = 'parquet',
+                   compression: str = None) -> int:
+        """Exporte le résultat d'une recherche JQL en colonnes (Parquet/Arrow) ou en CSV"""
+        fields = fields or ['summary', 'status', 'issuetype', 'priority', 'assignee', 'created', 'updated']
+
+        def rows() -> Iterator[Dict]:
+            for issue in self.iter_issues_by_jql(jql, fields=fields):
+                issue_fields = issue.get('fields', {})
+                row = {'key': issue.get('key')}
+                for field in fields:
+                    row[field] = field_value(issue_fields.get(field))
+                yield row
+
+        count = write_rows(filename, ['key'] + fields, rows(), format, compression)
+        print(f"✓ {count} issues exportées vers {filename}")
+        return count
 
     def generate_project_report(self, project_key: str) -> Dict:
         """Génère un rapport complet pour un projet"""
         jql = f'project = {project_key}'
-        issues = self.get_issues_by_jql(
+        issues = self.iter_issues_by_jql(
             jql,
             fields=['status', 'issuetype', 'priority', 'assignee', 'created', 'updated', 'resolutiondate']
         )
 
         # Analyse par statut
+        total_issues = 0
         by_status = Counter()
         by_type = Counter()
         by_priority = Counter()
         by_assignee = Counter()
 
         for issue in issues:
+            total_issues += 1
             fields = issue.get('fields', {})
 
             status = fields.get('status', {}).get('name', 'Unknown')
@@ -67,7 +104,7 @@ class ReportingTool:
 
         return {
             'project_key': project_key,
-            'total_issues': len(issues),
+            'total_issues': total_issues,
             'by_status': dict(by_status),
             'by_type': dict(by_type),
             'by_priority': dict(by_priority),
@@ -79,17 +116,21 @@ class ReportingTool:
         """Rapport d'activité d'un utilisateur"""
         date_from = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
 
-        # Issues créées
-        jql_created = f'creator = "{account_id}" AND created >= {date_from}'
-        created_issues = self.get_issues_by_jql(jql_created, fields=['key', 'summary', 'created'])
-
-        # Issues assignées
-        jql_assigned = f'assignee = "{account_id}" AND updated >= {date_from}'
-        assigned_issues = self.get_issues_by_jql(jql_assigned, fields=['key', 'summary', 'status'])
-
-        # Issues résolues
-        jql_resolved = f'assignee = "{account_id}" AND resolved >= {date_from}'
-        resolved_issues = self.get_issues_by_jql(jql_resolved, fields=['key', 'summary', 'resolutiondate'])
+        searches = [
+            # Issues créées
+            (f'creator = "{account_id}" AND created >= {date_from}', ['key', 'summary', 'created']),
+            # Issues assignées
+            (f'assignee = "{account_id}" AND updated >= {date_from}', ['key', 'summary', 'status']),
+            # Issues résolues
+            (f'assignee = "{account_id}" AND resolved >= {date_from}', ['key', 'summary', 'resolutiondate'])
+        ]
+
+        # Les trois recherches sont indépendantes: elles partent en parallèle
+        created_issues, assigned_issues, resolved_issues = map_concurrent(
+            lambda search: self.get_issues_by_jql(search[0], fields=search[1]),
+            searches,
+            workers=self.workers
+        )
 
         return {
             'account_id': account_id,
@@ -107,10 +148,16 @@ class ReportingTool:
         # Récupérer les sprints
         sprints = self.client.get_paginated(f'board/{board_id}/sprint')
 
+        recent_sprints = sprints[:5]  # 5 derniers sprints
+        all_sprint_issues = map_concurrent(
+            lambda sprint: self.client.get_paginated(f"sprint/{sprint.get('id')}/issue"),
+            recent_sprints,
+            workers=self.workers
+        )
+
         sprint_data = []
-        for sprint in sprints[:5]:  # 5 derniers sprints
+        for sprint, sprint_issues in zip(recent_sprints, all_sprint_issues):
             sprint_id = sprint.get('id')
-            sprint_issues = self.client.get_paginated(f'sprint/{sprint_id}/issue')
 
             # Analyse des issues du sprint
             completed = sum(1 for i in sprint_issues
@@ -181,31 +228,34 @@ class ReportingTool:
     def generate_dashboard_summary(self) -> Dict:
         """Résumé global pour un dashboard"""
         # Récupérer tous les projets
-        projects = self.client.get_paginated('project/search')
+        projects = get_paginated_concurrent(self.client, 'project/search')
 
-        total_issues = 0
-        total_open = 0
         total_in_progress = 0
         total_done = 0
 
-        for project in projects[:20]:  # Limiter à 20 projets pour la perf
-            project_key = project.get('key')
-
-            # Compter les issues
+        def count_issues(jql: str) -> int:
             result = self.client.get('search', params={
-                'jql': f'project = {project_key}',
+                'jql': jql,
                 'maxResults': 0
             })
-            if result:
-                total_issues += result.get('total', 0)
+            return result.get('total', 0) if result else 0
 
-            # Issues ouvertes
-            result = self.client.get('search', params={
-                'jql': f'project = {project_key} AND status != Done',
-                'maxResults': 0
-            })
-            if result:
-                total_open += result.get('total', 0)
+        # Limiter à 20 projets pour la perf, les comptages partent en parallèle
+        project_keys = [project.get('key') for project in projects[:20]]
+
+        # Compter les issues
+        total_issues = sum(map_concurrent(
+            lambda key: count_issues(f'project = {key}'),
+            project_keys,
+            workers=self.workers
+        ))
+
+        # Issues ouvertes
+        total_open = sum(map_concurrent(
+            lambda key: count_issues(f'project = {key} AND status != Done'),
+            project_keys,
+            workers=self.workers
+        ))
 
         return {
             'total_projects': len(projects),
@@ -214,27 +264,21 @@ class ReportingTool:
             'report_date': datetime.now().isoformat()
         }
 
-    def export_csv_report(self, project_key: str, filename: str):
-        """Exporte un rapport en CSV"""
-        import csv
-
+    def export_csv_report(self, project_key: str, filename: str, compression: str = None,
+                          format: str = 'csv'):
+        """Exporte un rapport en CSV (ou Parquet/Arrow), écrit au fil des pages de recherche"""
         jql = f'project = {project_key}'
-        issues = self.get_issues_by_jql(
+        issues = self.iter_issues_by_jql(
             jql,
             fields=['summary', 'status', 'issuetype', 'priority', 'assignee', 'created', 'updated']
         )
 
-        with open(filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=[
-                'Key', 'Summary', 'Type', 'Status', 'Priority', 'Assignee', 'Created', 'Updated'
-            ])
-            writer.writeheader()
-
+        def rows() -> Iterator[Dict]:
             for issue in issues:
                 fields = issue.get('fields', {})
                 assignee = fields.get('assignee')
 
-                writer.writerow({
+                yield {
                     'Key': issue.get('key'),
                     'Summary': fields.get('summary', ''),
                     'Type': fields.get('issuetype', {}).get('name', ''),
@@ -243,14 +287,22 @@ class ReportingTool:
                     'Assignee': assignee.get('displayName') if assignee else 'Non assigné',
                     'Created': fields.get('created', ''),
                     'Updated': fields.get('updated', '')
-                })
+                }
 
-        print(f"✓ {len(issues)} issues exportées vers {filename}")
+        count = write_rows(filename, [
+            'Key', 'Summary', 'Type', 'Status', 'Priority', 'Assignee', 'Created', 'Updated'
+        ], rows(), format, compression)
 
+        print(f"✓ {count} issues exportées vers {filename}")
 
-def main():
+
+def main(argv: List[str] = None):
     parser = argparse.ArgumentParser(description='Reporting et analytique Jira Cloud')
     parser.add_argument('--config', help='Fichier de configuration')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Ignorer le cache disque des réponses')
+    parser.add_argument('--workers', type=int,
+                       help='Nombre de requêtes en parallèle (défaut: JIRA_WORKERS ou 8)')
 
     subparsers = parser.add_subparsers(dest='command', help='Commandes disponibles')
 
@@ -278,29 +330,37 @@ def main():
     csv_parser = subparsers.add_parser('export-csv', help='Exporter les issues en CSV')
     csv_parser.add_argument('project_key', help='Clé du projet')
     csv_parser.add_argument('filename', help='Nom du fichier CSV')
+    csv_parser.add_argument('--compress', choices=COMPRESSIONS,
+                           help='Compression de la sortie (défaut: d\'après l\'extension .gz/.zst)')
+    csv_parser.add_argument('--format', choices=FORMATS, default='csv',
+                           help='Format de sortie (parquet/arrow: pyarrow requis)')
 
     # Recherche JQL personnalisée
     jql_parser = subparsers.add_parser('jql', help='Recherche JQL personnalisée')
     jql_parser.add_argument('query', help='Requête JQL')
     jql_parser.add_argument('--fields', nargs='*', help='Champs à récupérer')
     jql_parser.add_argument('--output', help='Fichier de sortie JSON')
+    jql_parser.add_argument('--format', choices=['json', 'parquet', 'arrow'], default='json',
+                           help='Format de sortie (parquet/arrow: --output et pyarrow requis)')
+    jql_parser.add_argument('--compress', choices=COMPRESSIONS,
+                           help='Compression des sorties parquet/arrow')
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if not args.command:
         parser.print_help()
         return
 
     try:
-        client = JiraClient(args.config)
-        reporting = ReportingTool(client)
+        client = create_client(args.config, use_cache=not args.no_cache)
+        reporting = ReportingTool(client, workers=args.workers)
 
         if args.command == 'project':
             report = reporting.generate_project_report(args.project_key)
 
             if args.output:
                 with open(args.output, 'w') as f:
-                    json.dump(report, f, indent=2, ensure_ascii=False)
+                    fast_json.dump(report, f)
                 print(f"✓ Rapport exporté vers {args.output}")
             else:
                 print(f"\n=== RAPPORT DU PROJET {args.project_key} ===")
@@ -325,7 +385,7 @@ def main():
 
             if args.output:
                 with open(args.output, 'w') as f:
-                    json.dump(report, f, indent=2, ensure_ascii=False)
+                    fast_json.dump(report, f)
                 print(f"✓ Rapport exporté vers {args.output}")
             else:
                 print(f"\n=== ACTIVITÉ UTILISATEUR ({args.days} derniers jours) ===")
@@ -343,7 +403,7 @@ def main():
 
             if args.output:
                 with open(args.output, 'w') as f:
-                    json.dump(report, f, indent=2, ensure_ascii=False)
+                    fast_json.dump(report, f)
                 print(f"✓ Rapport exporté vers {args.output}")
             else:
                 print(f"\n=== RAPPORT SLA - {args.project_key} ===")
@@ -359,7 +419,7 @@ def main():
 
             if args.output:
                 with open(args.output, 'w') as f:
-                    json.dump(report, f, indent=2, ensure_ascii=False)
+                    fast_json.dump(report, f)
                 print(f"✓ Rapport exporté vers {args.output}")
             else:
                 print(f"\n=== DASHBOARD JIRA ===")
@@ -368,17 +428,23 @@ def main():
                 print(f"Issues ouvertes: {report['open_issues']}")
 
         elif args.command == 'export-csv':
-            reporting.export_csv_report(args.project_key, args.filename)
+            reporting.export_csv_report(args.project_key, args.filename, args.compress, args.format)
+
+        elif args.command == 'jql' and args.format != 'json':
+            if not args.output:
+                print(f"Erreur: --format {args.format} nécessite --output", file=sys.stderr)
+                sys.exit(1)
+            reporting.export_jql(args.query, args.output, args.fields, args.format, args.compress)
 
         elif args.command == 'jql':
             issues = reporting.get_issues_by_jql(args.query, fields=args.fields)
 
             if args.output:
                 with open(args.output, 'w') as f:
-                    json.dump(issues, f, indent=2, ensure_ascii=False)
+                    fast_json.dump(issues, f)
                 print(f"✓ {len(issues)} issues exportées vers {args.output}")
             else:
-                print(json.dumps(issues, indent=2, ensure_ascii=False))
+                print(fast_json.dumps(issues, indent=True))
 
     except Exception as e:
         print(f"Erreur: {e}", file=sys.stderr)
@@ -8,19 +8,22 @@ Gérer les issues, analyser la vélocité et le burndown
 import sys
 import os
 import argparse
-import json
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import TYPE_CHECKING, List, Dict, Optional
 from collections import defaultdict
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-from lib.jira_client import JiraClient
+from lib.client_factory import create_client
+from lib import fast_json
+
+if TYPE_CHECKING:
+    from lib.jira_client import JiraClient
 
 
 class SprintManager:
     """Gestionnaire de sprints Jira"""
 
-    def __init__(self, client: JiraClient):
+    def __init__(self, client: 'JiraClient'):
         self.client = client
 
     def get_board(self, board_id: int) -> Dict:
@@ -325,14 +328,16 @@ class SprintManager:
         }
 
         with open(filename, 'w') as f:
-            json.dump(summary, f, indent=2, ensure_ascii=False)
+            fast_json.dump(summary, f)
 
         print(f"✓ Résumé du sprint exporté vers {filename}")
 
 
-def main():
+def main(argv: List[str] = None):
     parser = argparse.ArgumentParser(description='Gestion avancée des sprints Jira Cloud')
     parser.add_argument('--config', help='Fichier de configuration')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Ignorer le cache disque des réponses')
 
     subparsers = parser.add_subparsers(dest='command', help='Commandes disponibles')
 
@@ -422,14 +427,14 @@ def main():
     export_parser.add_argument('sprint_id', type=int, help='ID du sprint')
     export_parser.add_argument('filename', help='Nom du fichier')
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if not args.command:
         parser.print_help()
         return
 
     try:
-        client = JiraClient(args.config)
+        client = create_client(args.config, use_cache=not args.no_cache)
         manager = SprintManager(client)
 
         if args.command == 'boards':
@@ -457,7 +462,7 @@ def main():
         elif args.command == 'get':
             sprint = manager.get_sprint(args.sprint_id)
             if sprint:
-                print(json.dumps(sprint, indent=2, ensure_ascii=False))
+                print(fast_json.dumps(sprint, indent=True))
             else:
                 print(f"Sprint {args.sprint_id} non trouvé", file=sys.stderr)
                 sys.exit(1)
@@ -552,7 +557,7 @@ def main():
 
             if args.output:
                 with open(args.output, 'w') as f:
-                    json.dump(report, f, indent=2, ensure_ascii=False)
+                    fast_json.dump(report, f)
                 print(f"✓ Rapport exporté vers {args.output}")
             else:
                 print(f"\n=== RAPPORT SPRINT: {report['sprint']['name']} ===")
@@ -7,21 +7,24 @@ Permet de lister, rechercher, auditer et nettoyer les utilisateurs
 import sys
 import os
 import argparse
-import json
 import time
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import TYPE_CHECKING, List, Dict, Optional
 from collections import defaultdict
 
 # Ajouter le répertoire parent au path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-from lib.jira_client import JiraClient
+from lib.client_factory import create_client
+from lib import fast_json
+
+if TYPE_CHECKING:
+    from lib.jira_client import JiraClient
 
 
 class UserManager:
     """Gestionnaire d'utilisateurs Jira"""
 
-    def __init__(self, client: JiraClient):
+    def __init__(self, client: 'JiraClient'):
         self.client = client
 
     def list_users(self, max_results: int = 1000) -> List[Dict]:
@@ -330,9 +333,11 @@ class UserManager:
         return result
 
 
-def main():
+def main(argv: List[str] = None):
     parser = argparse.ArgumentParser(description='Gestion et nettoyage des utilisateurs Jira Cloud')
     parser.add_argument('--config', help='Fichier de configuration')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Ignorer le cache disque des réponses')
 
     subparsers = parser.add_subparsers(dest='command', help='Commandes disponibles')
 
@@ -404,21 +409,21 @@ def main():
     cleanup_parser = subparsers.add_parser('cleanup',
                                           help='Nettoyage interactif des utilisateurs')
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if not args.command:
         parser.print_help()
         return
 
     try:
-        client = JiraClient(args.config)
+        client = create_client(args.config, use_cache=not args.no_cache)
         manager = UserManager(client)
 
         if args.command == 'list':
             users = manager.list_users(max_results=args.max)
 
             if args.format == 'json':
-                print(json.dumps(users, indent=2, ensure_ascii=False))
+                print(fast_json.dumps(users, indent=True))
             else:
                 print(f"\n{'Account ID':<40} {'Nom':<30} {'Email':<40} {'Actif'}")
                 print("-" * 120)
@@ -433,7 +438,7 @@ def main():
             users = manager.list_active_users(max_results=args.max)
 
             if args.format == 'json':
-                print(json.dumps(users, indent=2, ensure_ascii=False))
+                print(fast_json.dumps(users, indent=True))
             else:
                 print(f"\n{'Account ID':<40} {'Nom':<30} {'Email':<40}")
                 print("-" * 110)
@@ -447,7 +452,7 @@ def main():
             users = manager.list_disabled_users(max_results=args.max)
 
             if args.format == 'json':
-                print(json.dumps(users, indent=2, ensure_ascii=False))
+                print(fast_json.dumps(users, indent=True))
             else:
                 print(f"\n{'Account ID':<40} {'Nom':<30} {'Email':<40}")
                 print("-" * 110)
@@ -461,7 +466,7 @@ def main():
             users = manager.get_users_by_last_login(days_back=args.days)
 
             if args.format == 'json':
-                print(json.dumps(users, indent=2, ensure_ascii=False))
+                print(fast_json.dumps(users, indent=True))
             elif args.format == 'csv':
                 output_file = args.output or f'users_by_login_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
                 manager.export_users_to_csv(users, output_file)
@@ -486,7 +491,7 @@ def main():
 
         elif args.command == 'search':
             users = manager.search_users(args.query)
-            print(json.dumps(users, indent=2, ensure_ascii=False))
+            print(fast_json.dumps(users, indent=True))
 
         elif args.command == 'groups':
             groups = manager.get_user_groups(args.account_id)
@@ -510,7 +515,7 @@ def main():
 
             if args.output:
                 with open(args.output, 'w') as f:
-                    json.dump(audit, f, indent=2, ensure_ascii=False)
+                    fast_json.dump(audit, f)
                 print(f"✓ Audit exporté vers {args.output}")
             else:
                 print("\n=== AUDIT DES ACCÈS UTILISATEURS ===")
@@ -131,6 +131,18 @@ else
     ((FAIL_COUNT++))
 fi
 
+echo ""
+echo "7. Test du temps de démarrage:"
+echo "------------------------------"
+echo -n "Imports différés et budget de démarrage... "
+if python3 benchmarks/check_startup.py > /dev/null 2>&1; then
+    echo "✅ OK"
+    ((PASS_COUNT++))
+else
+    echo "❌ FAILED (détails: python3 benchmarks/check_startup.py)"
+    ((FAIL_COUNT++))
+fi
+
 echo ""
 echo "========================================"
 echo "📊 RÉSULTATS"